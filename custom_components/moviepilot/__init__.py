@@ -1,22 +1,68 @@
 """The MoviePilot integration for Home Assistant."""
 from __future__ import annotations
 
+import asyncio
+import importlib
 import logging
-from typing import Any
+import time
+
+import voluptuous as vol
 
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.const import CONF_API_TOKEN, CONF_HOST, CONF_PORT, Platform
-from homeassistant.core import HomeAssistant
-from homeassistant.exceptions import ConfigEntryNotReady
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
-
-from .api import MoviePilotAPIClient, MoviePilotAuthError, MoviePilotConnectionError
-from .const import DATA_CLIENT, DOMAIN
-from .sensor import MoviePilotDataUpdateCoordinator
+from homeassistant.const import (
+    CONF_API_TOKEN,
+    CONF_HOST,
+    CONF_PORT,
+    EVENT_HOMEASSISTANT_STOP,
+    Platform,
+)
+from homeassistant.core import Event, HomeAssistant, ServiceCall
+from homeassistant.exceptions import (
+    ConfigEntryAuthFailed,
+    ConfigEntryNotReady,
+    HomeAssistantError,
+)
+import homeassistant.helpers.config_validation as cv
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .api import (
+    MoviePilotAPIClient,
+    MoviePilotAPIError,
+    MoviePilotAuthError,
+    MoviePilotConnectionError,
+)
+from .capabilities import MoviePilotCapabilities, async_remove_capabilities
+from .const import (
+    ATTR_CONFIG_ENTRY_ID,
+    CONF_PUSH_MODE,
+    DATA_CAPABILITIES,
+    DATA_CLIENT,
+    DATA_COORDINATORS,
+    DATA_PUSH,
+    DATA_WEBHOOK,
+    DATA_WEBHOOK_SENSORS,
+    DEFAULT_PUSH_MODE,
+    DOMAIN,
+    RESPONSE_CACHE_TTL,
+    SERVICE_PROBE_CAPABILITIES,
+    SIGNAL_WEBHOOK_SENSORS_RELEASED,
+    UPDATE_GROUP_LIVE,
+)
+from .coordinator import (
+    MoviePilotDataUpdateCoordinator,
+    MoviePilotSnapshotStore,
+    async_create_coordinators,
+)
+from .push import MoviePilotPushListener
+from .scheduler import MoviePilotScheduler, async_get_scheduler
 from .webhook import async_setup_webhook, get_webhook_url
 
 _LOGGER = logging.getLogger(__name__)
 
+SERVICE_PROBE_CAPABILITIES_SCHEMA = vol.Schema(
+    {vol.Optional(ATTR_CONFIG_ENTRY_ID): cv.string}
+)
+
 # Platforms to set up (notification service removed)
 PLATFORMS: list[Platform] = [
     Platform.SENSOR,
@@ -26,9 +72,10 @@ PLATFORMS: list[Platform] = [
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up MoviePilot from a config entry."""
+    setup_started = time.perf_counter()
     hass.data.setdefault(DOMAIN, {})
-
-    session = async_get_clientsession(hass, verify_ssl=False)
+    # 所有配置条目共享的调度器 (错开刷新、限制并发请求)
+    scheduler = async_get_scheduler(hass)
 
     api_token = entry.data.get(CONF_API_TOKEN, "")
 
@@ -38,40 +85,54 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         entry.data[CONF_HOST],
         entry.data[CONF_PORT],
         api_token,
-        session,
         verify_ssl=False,
+        cache_ttl=RESPONSE_CACHE_TTL,
+        request_limiter=scheduler.request_limiter,
     )
 
-    try:
-        _LOGGER.info("验证连接到 MoviePilot...")
-        result = await client.test_connection()
-        _LOGGER.info("成功连接到 MoviePilot: %s", result.get("name", "unknown"))
-    except MoviePilotAuthError as err:
-        _LOGGER.error("MoviePilot认证失败: %s", err)
-        raise ConfigEntryNotReady(f"Authentication failed: {err}") from err
-    except MoviePilotConnectionError as err:
-        _LOGGER.error("无法连接到 MoviePilot: %s", err)
-        raise ConfigEntryNotReady(f"Cannot connect: {err}") from err
-    except Exception as err:
-        _LOGGER.error("连接MoviePilot时出现未知错误: %s", err)
-        raise ConfigEntryNotReady(f"Unknown error: {err}") from err
+    # 按更新组创建coordinator (每组独立刷新周期)
+    coordinators = async_create_coordinators(hass, client, entry)
+
+    # 应用已保存的端点探测结果，不支持的端点不再请求
+    capabilities = MoviePilotCapabilities(hass, entry.entry_id, client, coordinators)
+    await capabilities.async_load()
 
-    # 创建coordinator
-    coordinator = MoviePilotDataUpdateCoordinator(hass, client)
+    # 优先使用上次保存的快照，实体立即可用 (数据标记为陈旧)
+    snapshot = MoviePilotSnapshotStore(hass, entry.entry_id, coordinators)
+    restored = await snapshot.async_restore()
 
-    # 首次刷新数据
-    await coordinator.async_config_entry_first_refresh()
+    if not restored:
+        # 没有快照时阻塞等待连接检查和首次刷新
+        try:
+            await _async_test_connection(client)
+            await _async_refresh_capabilities(capabilities)
+            await asyncio.gather(
+                *(
+                    coordinator.async_config_entry_first_refresh()
+                    for coordinator in coordinators.values()
+                )
+            )
+        except Exception:
+            # 设置失败时释放客户端独占的连接池
+            await client.close()
+            raise
 
     # 保存到hass.data
     hass.data[DOMAIN][entry.entry_id] = {
         DATA_CLIENT: client,
-        "coordinator": coordinator,
+        DATA_COORDINATORS: coordinators,
+        DATA_CAPABILITIES: capabilities,
     }
 
-    # 设置平台
-    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+    # 停止 Home Assistant 时条目不会被卸载，需要单独关闭客户端独占的连接池
+    async def _async_close_client(_event: Event) -> None:
+        await client.close()
 
-    # 设置 Webhook 接收器（全局设置，只执行一次）
+    entry.async_on_unload(
+        hass.bus.async_listen_once(EVENT_HOMEASSISTANT_STOP, _async_close_client)
+    )
+
+    # 设置 Webhook 接收器（全局设置，只执行一次；传感器平台需要已注册的接收器）
     if "webhook_setup" not in hass.data[DOMAIN]:
         webhook_success = await async_setup_webhook(hass)
 
@@ -100,27 +161,187 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
         else:
             _LOGGER.error("Failed to set up webhook receiver")
 
+    if (webhook := hass.data[DOMAIN].get(DATA_WEBHOOK)) is not None:
+        webhook.async_configure()
+
+    # 在执行器中导入平台模块，避免阻塞事件循环；只有首次设置真正导入
+    import_started = time.perf_counter()
+    await hass.async_add_executor_job(_import_platforms)
+    import_duration = time.perf_counter() - import_started
+
+    # 设置平台
+    await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
+
+    # 推送模式: 订阅事件流，实时指标改为对账轮询
+    if entry.options.get(CONF_PUSH_MODE, DEFAULT_PUSH_MODE):
+        push = MoviePilotPushListener(hass, client, coordinators[UPDATE_GROUP_LIVE])
+        push.async_start(entry)
+        hass.data[DOMAIN][entry.entry_id][DATA_PUSH] = push
+
+    if not restored:
+        # 冷启动的首次刷新已同步完成，推迟下一次刷新以错开各条目的刷新相位
+        for coordinator in coordinators.values():
+            coordinator.async_shift_schedule(
+                scheduler.offset(entry.entry_id, coordinator.update_interval)
+            )
+    else:
+        # 连接检查与首次实时刷新在后台进行，不阻塞启动
+        entry.async_create_background_task(
+            hass,
+            _async_background_refresh(entry, scheduler, client, capabilities, coordinators),
+            f"{DOMAIN}_first_refresh_{entry.entry_id}",
+        )
+
+    if not hass.services.has_service(DOMAIN, SERVICE_PROBE_CAPABILITIES):
+        hass.services.async_register(
+            DOMAIN,
+            SERVICE_PROBE_CAPABILITIES,
+            _async_handle_probe_capabilities,
+            schema=SERVICE_PROBE_CAPABILITIES_SCHEMA,
+        )
+
     # 监听配置更新
     entry.async_on_unload(entry.add_update_listener(async_reload_entry))
 
-    _LOGGER.info("MoviePilot集成设置完成")
+    _LOGGER.info(
+        "MoviePilot集成设置完成 (平台导入耗时 %.1fms，设置耗时 %.1fms，%s)",
+        import_duration * 1000,
+        (time.perf_counter() - setup_started) * 1000,
+        "使用缓存快照" if restored else "已完成首次刷新",
+    )
     return True
 
 
+def _import_platforms() -> None:
+    """Import the platform modules (cached after the first setup)."""
+    for platform in PLATFORMS:
+        importlib.import_module(f".{platform}", __name__)
+
+
+async def _async_test_connection(client: MoviePilotAPIClient) -> None:
+    """Verify the connection, raising the matching setup exception."""
+    try:
+        _LOGGER.info("验证连接到 MoviePilot...")
+        result = await client.test_connection()
+        _LOGGER.info("成功连接到 MoviePilot: %s", result.get("name", "unknown"))
+    except MoviePilotAuthError as err:
+        _LOGGER.error("MoviePilot认证失败: %s", err)
+        raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
+    except MoviePilotConnectionError as err:
+        _LOGGER.error("无法连接到 MoviePilot: %s", err)
+        raise ConfigEntryNotReady(f"Cannot connect: {err}") from err
+    except Exception as err:
+        _LOGGER.error("连接MoviePilot时出现未知错误: %s", err)
+        raise ConfigEntryNotReady(f"Unknown error: {err}") from err
+
+
+async def _async_refresh_capabilities(capabilities: MoviePilotCapabilities) -> None:
+    """Re-probe the endpoints if needed; failures keep the known capability map."""
+    try:
+        await capabilities.async_refresh()
+    except MoviePilotAPIError as err:
+        _LOGGER.warning("探测MoviePilot端点失败: %s", err)
+
+
+async def _async_background_refresh(
+    entry: ConfigEntry,
+    scheduler: MoviePilotScheduler,
+    client: MoviePilotAPIClient,
+    capabilities: MoviePilotCapabilities,
+    coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+) -> None:
+    """Check the connection and replace the restored snapshot with live data.
+
+    每个更新组的首次刷新按调度器分配的偏移错开，后续刷新沿用该相位。
+    """
+    started = time.perf_counter()
+    offsets = {
+        group: scheduler.offset(entry.entry_id, coordinator.update_interval)
+        for group, coordinator in coordinators.items()
+    }
+    await asyncio.sleep(offsets[UPDATE_GROUP_LIVE])
+
+    try:
+        await client.test_connection()
+    except Exception as err:  # pylint: disable=broad-except
+        # 刷新失败时由 coordinator 处理可用性与重新认证
+        _LOGGER.warning("后台连接检查失败: %s", err)
+    else:
+        await _async_refresh_capabilities(capabilities)
+
+    async def _async_staggered_refresh(
+        coordinator: MoviePilotDataUpdateCoordinator, offset: float
+    ) -> None:
+        await asyncio.sleep(max(0.0, started + offset - time.perf_counter()))
+        await coordinator.async_refresh()
+
+    await asyncio.gather(
+        *(
+            _async_staggered_refresh(coordinator, offsets[group])
+            for group, coordinator in coordinators.items()
+        )
+    )
+    _LOGGER.debug(
+        "后台首次刷新完成 (偏移 %.1fs)，耗时 %.1fms",
+        offsets[UPDATE_GROUP_LIVE],
+        (time.perf_counter() - started) * 1000,
+    )
+
+
+async def _async_handle_probe_capabilities(call: ServiceCall) -> None:
+    """Re-probe the endpoints of one or all MoviePilot entries."""
+    hass = call.hass
+    entry_id = call.data.get(ATTR_CONFIG_ENTRY_ID)
+
+    for entry in hass.config_entries.async_entries(DOMAIN):
+        if entry_id is not None and entry.entry_id != entry_id:
+            continue
+        entry_data = hass.data[DOMAIN].get(entry.entry_id)
+        if entry_data is None:
+            continue
+
+        try:
+            await entry_data[DATA_CAPABILITIES].async_refresh(force=True)
+        except MoviePilotAPIError as err:
+            raise HomeAssistantError(f"Failed to probe MoviePilot endpoints: {err}") from err
+
+        for coordinator in entry_data[DATA_COORDINATORS].values():
+            await coordinator.async_request_refresh()
+
+
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a config entry."""
     # 卸载所有平台
     unload_ok = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
 
     if unload_ok:
-        hass.data[DOMAIN].pop(entry.entry_id)
+        entry_data = hass.data[DOMAIN].pop(entry.entry_id)
+        if (push := entry_data.get(DATA_PUSH)) is not None:
+            push.async_stop()
+        for coordinator in entry_data[DATA_COORDINATORS].values():
+            await coordinator.async_shutdown()
+        await entry_data[DATA_CLIENT].close()
+
+        # 移除该条目的 Webhook 选项
+        if (webhook := hass.data[DOMAIN].get(DATA_WEBHOOK)) is not None:
+            webhook.async_configure()
+        # 由其他已加载的条目接管 Webhook 传感器
+        if hass.data[DOMAIN].get(DATA_WEBHOOK_SENSORS) == entry.entry_id:
+            del hass.data[DOMAIN][DATA_WEBHOOK_SENSORS]
+            async_dispatcher_send(hass, SIGNAL_WEBHOOK_SENSORS_RELEASED)
 
         _LOGGER.info("MoviePilot集成已卸载")
 
     return unload_ok
 
 
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Remove the persisted snapshot and capability map when the entry is deleted."""
+    await MoviePilotSnapshotStore(hass, entry.entry_id, {}).async_remove()
+    await async_remove_capabilities(hass, entry.entry_id)
+
+
 async def async_reload_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """Reload config entry."""
-    await async_unload_entry(hass, entry)
-    await async_setup_entry(hass, entry)
+    # 经由 config entries 重新加载，async_on_unload 注册的回调和条目后台任务才会被清理
+    await hass.config_entries.async_reload(entry.entry_id)
@@ -0,0 +1,163 @@
+"""Rolling-window aggregates for MoviePilot metrics.
+
+每个指标使用固定容量的 array('d') 环形缓冲区保存样本，均值通过
+增量维护的总和计算，最大值通过单调队列维护，两者都是 O(1) 均摊；
+p95 只在读取时对窗口内的少量样本排序。
+"""
+from __future__ import annotations
+
+from array import array
+from collections import deque
+from collections.abc import Iterable
+import math
+import time
+
+from .const import AGGREGATE_WINDOWS, MIN_SCAN_INTERVAL
+
+
+def aggregate_key(metric: str) -> str:
+    """Return the pseudo overview key notified when a metric is sampled."""
+    return f"{metric}_aggregate"
+
+
+class RollingWindow:
+    """Time-based rolling window backed by a fixed-capacity ring buffer."""
+
+    __slots__ = (
+        "_window",
+        "_capacity",
+        "_values",
+        "_times",
+        "_first",
+        "_next",
+        "_sum",
+        "_max_seqs",
+    )
+
+    def __init__(self, window: float, capacity: int) -> None:
+        """Initialize the window.
+
+        Args:
+            window: 窗口长度(秒)
+            capacity: 最多保存的样本数
+        """
+        self._window = window
+        self._capacity = capacity
+        self._values = array("d", bytes(8 * capacity))
+        self._times = array("d", bytes(8 * capacity))
+        # 使用递增序号定位样本，下标为 序号 % 容量
+        self._first = 0
+        self._next = 0
+        self._sum = 0.0
+        # 单调递减队列 (保存序号)，队首即窗口最大值
+        self._max_seqs: deque[int] = deque()
+
+    def __len__(self) -> int:
+        """Return the number of samples inside the window."""
+        return self._next - self._first
+
+    def add(self, timestamp: float, value: float) -> None:
+        """Append a sample, evicting expired ones first."""
+        self.expire(timestamp)
+        if len(self) == self._capacity:
+            self._pop_oldest()
+
+        seq = self._next
+        index = seq % self._capacity
+        self._values[index] = value
+        self._times[index] = timestamp
+        self._sum += value
+        self._next += 1
+
+        max_seqs = self._max_seqs
+        while max_seqs and self._values[max_seqs[-1] % self._capacity] <= value:
+            max_seqs.pop()
+        max_seqs.append(seq)
+
+        # 每写满一轮重新求和，消除浮点累积误差
+        if self._next % self._capacity == 0:
+            self._sum = math.fsum(self._iter_values())
+
+    def expire(self, now: float) -> None:
+        """Drop samples older than the window."""
+        cutoff = now - self._window
+        while len(self) and self._times[self._first % self._capacity] <= cutoff:
+            self._pop_oldest()
+
+    def mean(self) -> float | None:
+        """Return the mean of the samples in the window."""
+        size = len(self)
+        return self._sum / size if size else None
+
+    def max(self) -> float | None:
+        """Return the maximum of the samples in the window."""
+        if not self._max_seqs:
+            return None
+        return self._values[self._max_seqs[0] % self._capacity]
+
+    def percentile(self, percent: float) -> float | None:
+        """Return the given percentile (nearest rank) of the window."""
+        size = len(self)
+        if not size:
+            return None
+        ordered = sorted(self._iter_values())
+        rank = max(1, math.ceil(size * percent / 100))
+        return ordered[rank - 1]
+
+    def _pop_oldest(self) -> None:
+        """Remove the oldest sample."""
+        seq = self._first
+        self._sum -= self._values[seq % self._capacity]
+        if self._max_seqs and self._max_seqs[0] == seq:
+            self._max_seqs.popleft()
+        self._first += 1
+
+    def _iter_values(self) -> Iterable[float]:
+        """Iterate over the samples in the window, oldest first."""
+        values = self._values
+        capacity = self._capacity
+        return (values[seq % capacity] for seq in range(self._first, self._next))
+
+
+class MetricAggregator:
+    """Keep 1m/5m/15m rolling windows for a set of metrics."""
+
+    def __init__(
+        self,
+        metrics: Iterable[str],
+        windows: dict[str, int] = AGGREGATE_WINDOWS,
+        min_interval: float = MIN_SCAN_INTERVAL,
+    ) -> None:
+        """Initialize the aggregator.
+
+        Args:
+            metrics: 需要聚合的数据字段
+            windows: 窗口名称 -> 窗口长度(秒)
+            min_interval: 最小采样间隔(秒)，用于确定缓冲区容量
+        """
+        self.metrics = tuple(metrics)
+        self._windows: dict[str, dict[str, RollingWindow]] = {
+            metric: {
+                name: RollingWindow(seconds, int(seconds // min_interval) + 1)
+                for name, seconds in windows.items()
+            }
+            for metric in self.metrics
+        }
+
+    def add(self, metric: str, value: float, timestamp: float | None = None) -> None:
+        """Add a sample of a metric to all of its windows."""
+        if timestamp is None:
+            timestamp = time.monotonic()
+        for window in self._windows[metric].values():
+            window.add(timestamp, value)
+
+    def stats(self, metric: str, window: str) -> dict[str, float | int | None]:
+        """Return mean, max, p95 and sample count for one window."""
+        rolling = self._windows[metric][window]
+        rolling.expire(time.monotonic())
+        return {
+            "mean": rolling.mean(),
+            "max": rolling.max(),
+            "p95": rolling.percentile(95),
+            "samples": len(rolling),
+        }
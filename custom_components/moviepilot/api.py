@@ -7,26 +7,76 @@
 from __future__ import annotations
 
 import asyncio
+from collections import deque
+from collections.abc import AsyncIterator, Callable, Hashable, Iterable
+import contextlib
+import hashlib
+import heapq
+import itertools
+import json
 import logging
-from typing import Any
+import random
+import ssl
+import time
+from typing import Any, NamedTuple
 
 import aiohttp
 import async_timeout
+from yarl import URL
 
 from .const import (
     API_ENDPOINT_CPU,
     API_ENDPOINT_DOWNLOADER,
     API_ENDPOINT_MEMORY,
     API_ENDPOINT_NETWORK,
+    API_ENDPOINT_PROBE,
     API_ENDPOINT_SCHEDULE,
     API_ENDPOINT_STATISTIC,
     API_ENDPOINT_STORAGE,
+    API_ENDPOINT_SYSTEM_ENV,
     API_ENDPOINT_TRANSFER_NOW,
+    CIRCUIT_AUTH_DELAY,
+    CIRCUIT_BASE_DELAY,
+    CIRCUIT_CLOSED,
+    CIRCUIT_FAILURE_THRESHOLD,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_JITTER,
+    CIRCUIT_MAX_DELAY,
+    CIRCUIT_OPEN,
+    CLIENT_MAX_CONCURRENCY,
+    CONNECTION_KEEPALIVE_TIMEOUT,
+    CONNECTION_LIMIT_PER_HOST,
+    DASHBOARD_ENDPOINTS,
+    DNS_CACHE_TTL,
     DEFAULT_TIMEOUT,
+    LATENCY_MIN_SAMPLES,
+    LATENCY_TIMEOUT_FACTOR,
+    LATENCY_WINDOW,
+    MIN_REQUEST_TIMEOUT,
+    PUSH_READ_TIMEOUT,
+    REQUEST_PRIORITY_INTERACTIVE,
+    REQUEST_PRIORITY_LIVE,
+    REQUEST_PRIORITY_NAMES,
+    STATUS_RUNNING,
+    STATUS_WAITING,
 )
 
 _LOGGER = logging.getLogger(__name__)
 
+# 可选的更快JSON解析器 (orjson 直接解析bytes)
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    json_loads = json.loads
+
+# aiohttp 只在安装了 brotli 时才能解码 br 响应
+try:
+    import brotli  # noqa: F401
+
+    ACCEPT_ENCODING = "gzip, deflate, br"
+except ImportError:
+    ACCEPT_ENCODING = "gzip, deflate"
+
 
 class MoviePilotAPIError(Exception):
     """Base exception for MoviePilot API errors."""
@@ -40,6 +90,310 @@ class MoviePilotConnectionError(MoviePilotAPIError):
     """Exception for connection errors."""
 
 
+class MoviePilotEndpointNotFoundError(MoviePilotAPIError):
+    """Exception for endpoints not provided by this MoviePilot version."""
+
+
+class CircuitBreaker:
+    """请求熔断器 (closed / open / half_open)
+
+    连续出现连接错误达到阈值后打开，打开期间所有请求立即失败；
+    等待带抖动的指数退避时间后进入半开状态，由一次探测请求决定
+    恢复还是继续打开。认证失败单独短路，避免无效令牌引发请求风暴。
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        base_delay: float = CIRCUIT_BASE_DELAY,
+        max_delay: float = CIRCUIT_MAX_DELAY,
+        auth_delay: float = CIRCUIT_AUTH_DELAY,
+    ) -> None:
+        """Initialize the circuit breaker."""
+        self._failure_threshold = failure_threshold
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._auth_delay = auth_delay
+        self.state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._open_count = 0
+        self._retry_at = 0.0
+        self._auth_error: MoviePilotAuthError | None = None
+
+    @property
+    def retry_in(self) -> float:
+        """Seconds until the next probe is allowed."""
+        return max(0.0, self._retry_at - time.monotonic())
+
+    def before_request(self) -> bool:
+        """检查请求是否允许发送
+
+        Returns:
+            True 表示调用方需要先发送一次探测请求
+
+        Raises:
+            MoviePilotAuthError: 令牌被拒绝后的短路期内
+            MoviePilotConnectionError: 熔断器打开或探测进行中
+        """
+        if self.state == CIRCUIT_CLOSED:
+            return False
+
+        if self.state == CIRCUIT_HALF_OPEN:
+            if self._auth_error is not None:
+                raise MoviePilotAuthError(str(self._auth_error))
+            raise MoviePilotConnectionError("Circuit breaker half-open, probe in progress")
+
+        if time.monotonic() < self._retry_at:
+            if self._auth_error is not None:
+                raise MoviePilotAuthError(str(self._auth_error))
+            raise MoviePilotConnectionError(
+                f"Circuit breaker open, retry in {self.retry_in:.0f}s"
+            )
+
+        self.state = CIRCUIT_HALF_OPEN
+        return True
+
+    def release_probe(self) -> None:
+        """Reopen the circuit when a probe was cancelled before finishing."""
+        if self.state == CIRCUIT_HALF_OPEN:
+            self.state = CIRCUIT_OPEN
+
+    def record_success(self) -> None:
+        """Close the circuit after a successful response."""
+        if self.state != CIRCUIT_CLOSED:
+            _LOGGER.info("MoviePilot恢复响应，熔断器关闭")
+        self.state = CIRCUIT_CLOSED
+        self._failures = 0
+        self._open_count = 0
+        self._auth_error = None
+
+    def record_failure(self) -> None:
+        """Record a connection error and open the circuit when needed."""
+        if self.state == CIRCUIT_HALF_OPEN:
+            self._open()
+            return
+
+        self._failures += 1
+        if self.state == CIRCUIT_CLOSED and self._failures >= self._failure_threshold:
+            self._open()
+
+    def record_auth_failure(self, err: MoviePilotAuthError) -> None:
+        """Short-circuit all requests after the token was rejected."""
+        if self._auth_error is None:
+            _LOGGER.warning(
+                "MoviePilot拒绝了API令牌，%d秒内不再发送请求", self._auth_delay
+            )
+        self._auth_error = err
+        self.state = CIRCUIT_OPEN
+        self._retry_at = time.monotonic() + self._jitter(self._auth_delay)
+
+    def _open(self) -> None:
+        """Open the circuit for the next backoff delay."""
+        delay = self._jitter(
+            min(self._max_delay, self._base_delay * 2 ** self._open_count)
+        )
+        if self._open_count == 0:
+            _LOGGER.warning(
+                "MoviePilot连续%d次请求失败，熔断器打开，%.0f秒后探测",
+                self._failures,
+                delay,
+            )
+        else:
+            _LOGGER.debug("熔断器探测失败，%.0f秒后重试", delay)
+        self._open_count += 1
+        self.state = CIRCUIT_OPEN
+        self._retry_at = time.monotonic() + delay
+
+    @staticmethod
+    def _jitter(delay: float) -> float:
+        """Spread a delay by +/- CIRCUIT_JITTER."""
+        return delay * random.uniform(1 - CIRCUIT_JITTER, 1 + CIRCUIT_JITTER)
+
+
+class EndpointLatencyTracker:
+    """按端点记录请求耗时，根据 p95 推算请求超时时间"""
+
+    def __init__(self) -> None:
+        """Initialize the tracker."""
+        self._samples: dict[str, deque[float]] = {}
+
+    def record(self, endpoint: str, latency: float) -> None:
+        """Record the latency of one request."""
+        samples = self._samples.get(endpoint)
+        if samples is None:
+            samples = self._samples[endpoint] = deque(maxlen=LATENCY_WINDOW)
+        samples.append(latency)
+
+    def percentile(self, endpoint: str, percent: float) -> float | None:
+        """Return the given latency percentile, or None without samples."""
+        samples = self._samples.get(endpoint)
+        if not samples:
+            return None
+        ordered = sorted(samples)
+        index = min(len(ordered) - 1, int(len(ordered) * percent / 100))
+        return ordered[index]
+
+    def timeout(self, endpoint: str) -> float:
+        """Return the request timeout learned for an endpoint."""
+        samples = self._samples.get(endpoint)
+        if samples is None or len(samples) < LATENCY_MIN_SAMPLES:
+            return DEFAULT_TIMEOUT
+        p95 = self.percentile(endpoint, 95)
+        return min(DEFAULT_TIMEOUT, max(MIN_REQUEST_TIMEOUT, p95 * LATENCY_TIMEOUT_FACTOR))
+
+
+class PriorityLimiter:
+    """按优先级分配并发名额的限流器
+
+    同时进行的请求数不超过 limit；名额不足时请求按 (优先级, 到达顺序)
+    排队，释放的名额直接交给优先级最高的等待者。记录每个优先级最近
+    的排队时间，用于观察限流造成的延迟。
+    """
+
+    def __init__(self, limit: int = CLIENT_MAX_CONCURRENCY) -> None:
+        """Initialize the limiter."""
+        self._limit = limit
+        self._active = 0
+        self._waiters: list[tuple[int, int, asyncio.Future[None]]] = []
+        self._sequence = itertools.count()
+        self._waits: dict[int, deque[float]] = {
+            priority: deque(maxlen=LATENCY_WINDOW) for priority in REQUEST_PRIORITY_NAMES
+        }
+
+    @property
+    def queued(self) -> int:
+        """Return the number of requests waiting for a slot."""
+        return sum(1 for _, _, future in self._waiters if not future.done())
+
+    @contextlib.asynccontextmanager
+    async def slot(self, priority: int) -> AsyncIterator[None]:
+        """Hold a slot for the duration of the block."""
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+    async def acquire(self, priority: int) -> None:
+        """Wait for a free slot."""
+        if self._active < self._limit and not self._waiters:
+            self._active += 1
+            self._waits[priority].append(0.0)
+            return
+
+        started = time.monotonic()
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._sequence), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # 名额已转交但调用方被取消，继续交给下一个等待者
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+        self._waits[priority].append(time.monotonic() - started)
+
+    def release(self) -> None:
+        """Hand the slot to the highest-priority waiter or free it."""
+        while self._waiters:
+            _, _, future = heapq.heappop(self._waiters)
+            if not future.done():
+                future.set_result(None)
+                return
+        self._active -= 1
+
+    def wait_stats(self) -> dict[str, dict[str, float | int]]:
+        """Return mean and max wait (ms) of recent acquisitions per priority class."""
+        return {
+            REQUEST_PRIORITY_NAMES[priority]: {
+                "mean_ms": round(sum(waits) / len(waits) * 1000, 1) if waits else 0.0,
+                "max_ms": round(max(waits) * 1000, 1) if waits else 0.0,
+                "samples": len(waits),
+            }
+            for priority, waits in self._waits.items()
+        }
+
+    def mean_wait(self) -> float | None:
+        """Return the mean wait (ms) of recent acquisitions across all classes."""
+        waits = [wait for samples in self._waits.values() for wait in samples]
+        if not waits:
+            return None
+        return round(sum(waits) / len(waits) * 1000, 1)
+
+
+class _InFlightRequest:
+    """一个被多个调用方共享的进行中请求"""
+
+    __slots__ = ("task", "waiters")
+
+    def __init__(self, task: asyncio.Future) -> None:
+        """Initialize the shared request."""
+        self.task = task
+        self.waiters = 0
+
+
+class _CachedPayload(NamedTuple):
+    """上一次GET响应的摘要、解析结果和校验信息"""
+
+    digest: bytes
+    result: Any
+    etag: str | None
+    last_modified: str | None
+
+
+class ServerSentEvent(NamedTuple):
+    """一条服务器推送事件 (SSE)"""
+
+    event: str
+    data: str
+    id: str | None
+    retry: int | None
+
+
+class _SSEDecoder:
+    """按行解析 text/event-stream，遇到空行时产出一个事件"""
+
+    __slots__ = ("_event", "_data", "_id", "_retry")
+
+    def __init__(self) -> None:
+        """Initialize the decoder."""
+        self._event = ""
+        self._data: list[str] = []
+        self._id: str | None = None
+        self._retry: int | None = None
+
+    def feed(self, line: str) -> ServerSentEvent | None:
+        """Process one line (without its line break)."""
+        if not line:
+            if not self._data:
+                self._event = ""
+                return None
+            event = ServerSentEvent(
+                self._event or "message", "\n".join(self._data), self._id, self._retry
+            )
+            self._event = ""
+            self._data = []
+            self._retry = None
+            return event
+
+        if line.startswith(":"):
+            # 注释行 (常用作心跳)
+            return None
+
+        name, _, value = line.partition(":")
+        if value.startswith(" "):
+            value = value[1:]
+        if name == "data":
+            self._data.append(value)
+        elif name == "event":
+            self._event = value
+        elif name == "id" and "\0" not in value:
+            self._id = value
+        elif name == "retry" and value.isdigit():
+            self._retry = int(value)
+        return None
+
+
 class MoviePilotAPIClient:
     """MoviePilot API客户端 - 只包含已验证可用的端点"""
 
@@ -48,8 +402,11 @@ class MoviePilotAPIClient:
         host: str,
         port: int,
         api_token: str,
-        session: aiohttp.ClientSession,
+        session: aiohttp.ClientSession | None = None,
         verify_ssl: bool = False,
+        cache_ttl: float = 0.0,
+        ssl_context: ssl.SSLContext | None = None,
+        request_limiter: asyncio.Semaphore | None = None,
     ) -> None:
         """初始化API客户端
 
@@ -57,14 +414,43 @@ class MoviePilotAPIClient:
             host: MoviePilot主机地址
             port: 端口号(默认3000)
             api_token: API令牌 (用于URL参数认证)
-            session: aiohttp会话
+            session: aiohttp会话，为None时创建客户端独占的连接池
+                (需要在事件循环中创建，并在不再使用时调用 close())
             verify_ssl: 是否验证SSL证书
+            cache_ttl: 相同GET请求的响应缓存时间(秒)，0表示不缓存
+            ssl_context: 独占连接池共享的SSL上下文 (验证证书时使用)
+            request_limiter: 限制同时进行的HTTP请求数 (可由多个客户端共享)
         """
         self.host = host
         self.port = port
         self.api_token = api_token
-        self.session = session
         self.verify_ssl = verify_ssl
+        self.cache_ttl = cache_ttl
+        self._limiter: contextlib.AbstractAsyncContextManager[Any] = (
+            request_limiter if request_limiter is not None else contextlib.nullcontext()
+        )
+
+        # 进行中的GET请求 (相同请求共享同一次HTTP调用)
+        self._inflight: dict[Hashable, _InFlightRequest] = {}
+        # GET响应缓存: key -> (过期时间, 响应数据)
+        self._response_cache: dict[Hashable, tuple[float, Any]] = {}
+        # 上一次GET响应 (用于条件请求和内容变化检测)
+        self._payloads: dict[Hashable, _CachedPayload] = {}
+        # 端点 -> (原始响应, 构建好的字段)，响应未变化时跳过字段构建
+        self._overview_fields: dict[str, tuple[Any, dict[str, Any]]] = {}
+        # 请求统计
+        self.stats: dict[str, int] = {
+            "requests": 0,
+            "coalesced": 0,
+            "cache_hits": 0,
+            "not_modified": 0,
+            "unchanged": 0,
+            "connections_created": 0,
+            "connections_reused": 0,
+        }
+
+        self._owns_session = session is None
+        self.session = session if session is not None else self._create_session(ssl_context)
 
         # 构建基础URL
         if host.startswith("http://") or host.startswith("https://"):
@@ -73,74 +459,292 @@ class MoviePilotAPIClient:
             protocol = "https" if port == 443 else "http"
             self.base_url = f"{protocol}://{host}:{port}"
 
+        # 每个端点的URL对象和认证参数只构建一次
+        self._urls: dict[str, URL] = {}
+        self._auth_params = {"token": api_token}
+
         self.headers = {
             "Content-Type": "application/json",
             "Accept": "application/json",
             "User-Agent": "HomeAssistant-MoviePilot/3.0",
+            "Accept-Encoding": ACCEPT_ENCODING,
         }
 
+        # 单主机并发限流 (按优先级排队)
+        self.limiter = PriorityLimiter()
+        # 熔断器 (服务不可用时快速失败)
+        self.breaker = CircuitBreaker()
+        # 端点耗时统计 (用于推算超时时间)
+        self.latency = EndpointLatencyTracker()
+
         _LOGGER.debug("MoviePilot API客户端初始化: %s", self.base_url)
 
+    def _create_session(self, ssl_context: ssl.SSLContext | None) -> aiohttp.ClientSession:
+        """创建客户端独占的连接池
+
+        长连接保持、单主机连接数上限和DNS缓存都只作用于 MoviePilot，
+        不与其他集成竞争共享会话的连接数；所有TLS连接共用同一个
+        SSL上下文，通过跟踪回调统计新建连接与复用连接的次数。
+        """
+        connector = aiohttp.TCPConnector(
+            limit_per_host=CONNECTION_LIMIT_PER_HOST,
+            keepalive_timeout=CONNECTION_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=DNS_CACHE_TTL,
+            ssl=ssl_context if self.verify_ssl and ssl_context is not None else False,
+        )
+
+        trace_config = aiohttp.TraceConfig()
+        trace_config.on_connection_create_end.append(self._on_connection_created)
+        trace_config.on_connection_reuseconn.append(self._on_connection_reused)
+
+        return aiohttp.ClientSession(
+            connector=connector,
+            trace_configs=[trace_config],
+        )
+
+    async def _on_connection_created(self, session: Any, context: Any, params: Any) -> None:
+        """统计新建连接 (TCP连接及TLS握手)"""
+        self.stats["connections_created"] += 1
+
+    async def _on_connection_reused(self, session: Any, context: Any, params: Any) -> None:
+        """统计复用的长连接"""
+        self.stats["connections_reused"] += 1
+
+    async def close(self) -> None:
+        """关闭客户端独占的连接池 (共享会话由调用方管理)"""
+        if self._owns_session and not self.session.closed:
+            await self.session.close()
+
     async def _request(
         self,
         method: str,
         endpoint: str,
         data: dict[str, Any] | None = None,
         params: dict[str, Any] | None = None,
-        timeout: int = DEFAULT_TIMEOUT,
+        timeout: float | None = None,
+        priority: int = REQUEST_PRIORITY_INTERACTIVE,
     ) -> Any:
         """发送API请求
 
+        相同的 (method, endpoint, params) GET请求在进行中时会被合并，
+        所有调用方共享同一次HTTP调用的结果；开启 cache_ttl 后结果还会
+        在短时间内被缓存。共享的响应对象不应被调用方修改。
+
         Args:
             method: HTTP方法
             endpoint: API端点路径
             data: POST数据
             params: URL参数
-            timeout: 超时时间(秒)
+            timeout: 超时时间(秒)，默认使用根据历史耗时推算的值
+            priority: 请求优先级，并发名额不足时优先级高 (值小) 的先发送
 
         Returns:
             API响应数据 (可能是dict、list、int或str)
 
         Raises:
             MoviePilotAuthError: 认证失败
-            MoviePilotConnectionError: 连接失败
+            MoviePilotConnectionError: 连接失败或熔断器打开
             MoviePilotAPIError: 其他API错误
         """
-        url = f"{self.base_url}{endpoint}"
-
-        # 添加token到URL参数
-        if params is None:
-            params = {}
-        params["token"] = self.api_token
-
-        # 记录请求(隐藏token)
-        safe_params = {k: "***" if k == "token" else v for k, v in params.items()}
-        _LOGGER.debug(
-            "API请求: %s %s?%s",
-            method,
-            endpoint,
-            "&".join(f"{k}={v}" for k, v in safe_params.items()),
-        )
+        if method != "GET" or data is not None:
+            return await self._request_once(method, endpoint, data, params, timeout, priority)
+
+        key = (method, endpoint, tuple(sorted(params.items())) if params else ())
+
+        if self.cache_ttl > 0:
+            cached = self._response_cache.get(key)
+            if cached is not None:
+                if cached[0] > time.monotonic():
+                    self.stats["cache_hits"] += 1
+                    return cached[1]
+                del self._response_cache[key]
+
+        flight = self._inflight.get(key)
+        if flight is None:
+            task = asyncio.ensure_future(
+                self._request_once(method, endpoint, data, params, timeout, priority)
+            )
+            flight = self._inflight[key] = _InFlightRequest(task)
+            task.add_done_callback(lambda done: self._request_done(key, done))
+        else:
+            self.stats["coalesced"] += 1
+
+        flight.waiters += 1
+        try:
+            return await asyncio.shield(flight.task)
+        except asyncio.CancelledError:
+            # 最后一个等待者取消时才取消共享请求
+            if flight.waiters == 1 and not flight.task.done():
+                flight.task.cancel()
+            raise
+        finally:
+            flight.waiters -= 1
+
+    def invalidate(self, endpoints: Iterable[str]) -> None:
+        """丢弃指定端点的缓存响应，下一次请求一定会访问服务器"""
+        endpoints = set(endpoints)
+        for key in [key for key in self._response_cache if key[1] in endpoints]:
+            del self._response_cache[key]
+
+    def _request_done(self, key: Hashable, task: asyncio.Future) -> None:
+        """Drop a finished shared request and cache its response."""
+        flight = self._inflight.get(key)
+        if flight is not None and flight.task is task:
+            del self._inflight[key]
+        if task.cancelled() or task.exception() is not None:
+            return
+        if self.cache_ttl > 0:
+            self._response_cache[key] = (time.monotonic() + self.cache_ttl, task.result())
+
+    async def _request_once(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+        priority: int = REQUEST_PRIORITY_INTERACTIVE,
+        record_auth: bool = True,
+    ) -> Any:
+        """发送一次API请求 (经过熔断器和并发限流)
+
+        record_auth 为 False 时用于辅助端点：其认证失败不代表令牌无效，
+        不计入熔断器，也只记录调试日志。
+        """
+        self.stats["requests"] += 1
+        if self.breaker.before_request():
+            await self._probe()
+
+        if timeout is None:
+            timeout = self.latency.timeout(endpoint)
+
+        # 等待并发名额的时间不计入耗时统计
+        async with self.limiter.slot(priority), self._limiter:
+            started = time.monotonic()
+            try:
+                result = await self._send(
+                    method, endpoint, data, params, timeout, quiet=not record_auth
+                )
+            except MoviePilotAuthError as err:
+                if record_auth:
+                    self.breaker.record_auth_failure(err)
+                raise
+            except MoviePilotConnectionError as err:
+                # 超时也计入耗时统计，使推算的超时时间能随服务变慢而增大
+                if isinstance(err.__cause__, asyncio.TimeoutError):
+                    self.latency.record(endpoint, timeout)
+                self.breaker.record_failure()
+                raise
+
+        self.latency.record(endpoint, time.monotonic() - started)
+        self.breaker.record_success()
+        return result
+
+    async def _probe(self) -> None:
+        """熔断器半开时发送一次轻量探测请求
+
+        等待并发名额也在保护范围内：探测在任何阶段被取消或意外失败时
+        都会释放半开状态，避免熔断器停留在"探测进行中"。
+
+        Raises:
+            MoviePilotAuthError: 令牌仍然无效
+            MoviePilotConnectionError: 服务仍不可用
+        """
+        _LOGGER.debug("熔断器半开，探测 %s", API_ENDPOINT_PROBE)
+        try:
+            async with self.limiter.slot(REQUEST_PRIORITY_INTERACTIVE), self._limiter:
+                await self._send("GET", API_ENDPOINT_PROBE, quiet=True)
+        except MoviePilotAuthError as err:
+            self.breaker.record_auth_failure(err)
+            raise
+        except MoviePilotConnectionError:
+            self.breaker.record_failure()
+            raise
+        except MoviePilotAPIError:
+            # 服务器有响应 (如HTTP错误) 也说明连接已恢复
+            pass
+        except BaseException:
+            # 取消 (周期截止时间、卸载) 或意外错误
+            self.breaker.release_probe()
+            raise
+        self.breaker.record_success()
+
+    async def _send(
+        self,
+        method: str,
+        endpoint: str,
+        data: dict[str, Any] | None = None,
+        params: dict[str, Any] | None = None,
+        timeout: float = DEFAULT_TIMEOUT,
+        quiet: bool = False,
+    ) -> Any:
+        """发送HTTP请求并解析响应
+
+        Args:
+            method: HTTP方法
+            endpoint: API端点路径
+            data: POST数据
+            params: URL参数
+            timeout: 超时时间(秒)
+            quiet: 认证和连接错误只记录调试日志 (用于探测请求和辅助端点)
+
+        Returns:
+            API响应数据 (可能是dict、list、int或str)；GET响应内容与上次
+            相同 (HTTP 304 或内容摘要一致) 时返回上次的解析结果对象
+        """
+        url = self._urls.get(endpoint)
+        if url is None:
+            url = self._urls[endpoint] = URL(f"{self.base_url}{endpoint}")
+
+        # 条件请求: 带上上次响应的 ETag / Last-Modified
+        headers = self.headers
+        payload_key: Hashable | None = None
+        cached: _CachedPayload | None = None
+        if method == "GET":
+            payload_key = (endpoint, tuple(sorted(params.items())) if params else ())
+            cached = self._payloads.get(payload_key)
+            if cached is not None and (cached.etag or cached.last_modified):
+                headers = dict(self.headers)
+                if cached.etag:
+                    headers["If-None-Match"] = cached.etag
+                if cached.last_modified:
+                    headers["If-Modified-Since"] = cached.last_modified
+
+        # 记录请求(隐藏token)，仅在开启调试日志时格式化
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            _LOGGER.debug(
+                "API请求: %s %s?%s",
+                method,
+                endpoint,
+                "&".join(f"{k}={v}" for k, v in (params or {}).items() if k != "token"),
+            )
+
+        # 添加token到URL参数 (不修改调用方传入的字典)
+        request_params = {**params, **self._auth_params} if params else self._auth_params
 
         try:
             async with async_timeout.timeout(timeout):
                 async with self.session.request(
                     method,
                     url,
-                    headers=self.headers,
+                    headers=headers,
                     json=data,
-                    params=params,
+                    params=request_params,
                     ssl=self.verify_ssl,
                 ) as response:
                     # 处理401认证失败
                     if response.status == 401:
-                        _LOGGER.error("API认证失败 %s: Token可能无效或已过期", endpoint)
+                        _LOGGER.log(
+                            logging.DEBUG if quiet else logging.ERROR,
+                            "API认证失败 %s: Token可能无效或已过期",
+                            endpoint,
+                        )
                         raise MoviePilotAuthError("Authentication failed. Please check your API token.")
 
                     # 处理404
                     if response.status == 404:
                         _LOGGER.error("API端点不存在 %s", endpoint)
-                        raise MoviePilotAPIError(f"API endpoint not found: {endpoint}")
+                        raise MoviePilotEndpointNotFoundError(f"API endpoint not found: {endpoint}")
 
                     # 处理其他错误
                     if response.status >= 400:
@@ -153,29 +757,47 @@ class MoviePilotAPIClient:
                         )
                         raise MoviePilotAPIError(f"API request failed: HTTP {response.status}")
 
-                    # 解析响应
-                    content_type = response.headers.get("Content-Type", "")
-
-                    if "application/json" in content_type:
-                        try:
-                            result = await response.json()
-                            _LOGGER.debug("API响应成功: %s", endpoint)
-                            return result
-                        except (aiohttp.ContentTypeError, ValueError) as err:
-                            _LOGGER.warning("API响应JSON解析失败 %s: %s", endpoint, err)
-                            # 尝试返回文本
-                            text = await response.text()
-                            return text if text else None
-                    else:
-                        text = await response.text()
-                        _LOGGER.debug("API返回非JSON响应: %s", text[:100])
-                        return text if text else None
+                    # 内容未修改
+                    if response.status == 304 and cached is not None:
+                        self.stats["not_modified"] += 1
+                        _LOGGER.debug("API响应未修改: %s", endpoint)
+                        return cached.result
+
+                    # 内容与上次相同时跳过解析
+                    body = await response.read()
+                    digest = hashlib.blake2b(body, digest_size=16).digest()
+                    if cached is not None and cached.digest == digest:
+                        self.stats["unchanged"] += 1
+                        _LOGGER.debug("API响应内容未变化: %s", endpoint)
+                        return cached.result
+
+                    result = self._decode_body(body, response.charset, endpoint)
+                    if payload_key is not None:
+                        self._payloads[payload_key] = _CachedPayload(
+                            digest,
+                            result,
+                            response.headers.get("ETag"),
+                            response.headers.get("Last-Modified"),
+                        )
+                    return result
 
+        except MoviePilotAPIError:
+            raise
         except asyncio.TimeoutError as err:
-            _LOGGER.error("API请求超时 %s (timeout=%ds)", endpoint, timeout)
-            raise MoviePilotConnectionError(f"Connection timeout after {timeout}s") from err
+            _LOGGER.log(
+                logging.DEBUG if quiet else logging.ERROR,
+                "API请求超时 %s (timeout=%.1fs)",
+                endpoint,
+                timeout,
+            )
+            raise MoviePilotConnectionError(f"Connection timeout after {timeout:.1f}s") from err
         except aiohttp.ClientConnectorError as err:
-            _LOGGER.error("API连接失败 %s: %s", endpoint, err)
+            _LOGGER.log(
+                logging.DEBUG if quiet else logging.ERROR,
+                "API连接失败 %s: %s",
+                endpoint,
+                err,
+            )
             raise MoviePilotConnectionError(f"Cannot connect to MoviePilot: {err}") from err
         except aiohttp.ClientError as err:
             _LOGGER.error("API客户端错误 %s: %s", endpoint, err)
@@ -184,6 +806,26 @@ class MoviePilotAPIClient:
             _LOGGER.exception("API意外错误 %s: %s", endpoint, err)
             raise MoviePilotAPIError(f"Unexpected error: {err}") from err
 
+    @staticmethod
+    def _decode_body(body: bytes, charset: str | None, endpoint: str) -> Any:
+        """解析响应内容 (直接从bytes解析JSON，失败时返回文本)
+
+        MoviePilot 的接口都返回JSON，因此不检查 Content-Type，
+        直接尝试解析；只有少数返回纯文本的情况才会再解码为字符串。
+        """
+        if not body:
+            return None
+
+        try:
+            result = json_loads(body)
+        except ValueError:
+            text = body.decode(charset or "utf-8", errors="replace")
+            _LOGGER.debug("API返回非JSON响应 %s: %s", endpoint, text[:100])
+            return text
+
+        _LOGGER.debug("API响应成功: %s", endpoint)
+        return result
+
     # ========== 连接测试 ==========
 
     async def test_connection(self) -> dict[str, Any]:
@@ -216,14 +858,7 @@ class MoviePilotAPIClient:
         Returns:
             CPU使用百分比 (0-100)
         """
-        result = await self._request("GET", API_ENDPOINT_CPU)
-
-        # API返回的是数字
-        if isinstance(result, (int, float)):
-            return float(result)
-        else:
-            _LOGGER.warning("CPU使用率返回格式异常: %s", result)
-            return 0.0
+        return _parse_cpu(await self._request("GET", API_ENDPOINT_CPU))
 
     async def get_memory_usage(self) -> dict[str, Any]:
         """获取内存使用情况
@@ -233,17 +868,7 @@ class MoviePilotAPIClient:
                 - used_bytes: 已用内存(字节)
                 - percent: 使用百分比
         """
-        result = await self._request("GET", API_ENDPOINT_MEMORY)
-
-        # API返回: [已用字节数, 百分比]
-        if isinstance(result, list) and len(result) >= 2:
-            return {
-                "used_bytes": int(result[0]) if result[0] else 0,
-                "percent": float(result[1]) if result[1] else 0.0,
-            }
-        else:
-            _LOGGER.warning("内存使用率返回格式异常: %s", result)
-            return {"used_bytes": 0, "percent": 0.0}
+        return _parse_memory(await self._request("GET", API_ENDPOINT_MEMORY))
 
     async def get_storage_usage(self) -> dict[str, Any]:
         """获取存储使用情况
@@ -254,23 +879,7 @@ class MoviePilotAPIClient:
                 - used_bytes: 已用存储空间(字节)
                 - percent: 使用百分比
         """
-        result = await self._request("GET", API_ENDPOINT_STORAGE)
-
-        # API返回: {"total_storage": xxx, "used_storage": xxx}
-        if isinstance(result, dict):
-            total = float(result.get("total_storage", 0))
-            used = float(result.get("used_storage", 0))
-            percent = (used / total * 100) if total > 0 else 0.0
-
-            return {
-                "total_bytes": total,
-                "used_bytes": used,
-                "free_bytes": total - used,
-                "percent": percent,
-            }
-        else:
-            _LOGGER.warning("存储使用率返回格式异常: %s", result)
-            return {"total_bytes": 0, "used_bytes": 0, "free_bytes": 0, "percent": 0.0}
+        return _parse_storage(await self._request("GET", API_ENDPOINT_STORAGE))
 
     async def get_network_usage(self) -> dict[str, Any]:
         """获取网络使用情况
@@ -280,17 +889,7 @@ class MoviePilotAPIClient:
                 - upload_speed: 上传速度 (bytes/s)
                 - download_speed: 下载速度 (bytes/s)
         """
-        result = await self._request("GET", API_ENDPOINT_NETWORK)
-
-        # API返回: [上传速度, 下载速度]
-        if isinstance(result, list) and len(result) >= 2:
-            return {
-                "upload_speed": float(result[0]) if result[0] else 0.0,
-                "download_speed": float(result[1]) if result[1] else 0.0,
-            }
-        else:
-            _LOGGER.warning("网络使用返回格式异常: %s", result)
-            return {"upload_speed": 0.0, "download_speed": 0.0}
+        return _parse_network(await self._request("GET", API_ENDPOINT_NETWORK))
 
     async def get_statistics(self) -> dict[str, Any]:
         """获取媒体库统计信息
@@ -302,24 +901,7 @@ class MoviePilotAPIClient:
                 - episode_count: 集数
                 - user_count: 用户数
         """
-        result = await self._request("GET", API_ENDPOINT_STATISTIC)
-
-        # API返回: {"movie_count": xx, "tv_count": xx, ...}
-        if isinstance(result, dict):
-            return {
-                "movie_count": int(result.get("movie_count", 0)),
-                "tv_count": int(result.get("tv_count", 0)),
-                "episode_count": int(result.get("episode_count", 0)),
-                "user_count": int(result.get("user_count", 0)),
-            }
-        else:
-            _LOGGER.warning("统计信息返回格式异常: %s", result)
-            return {
-                "movie_count": 0,
-                "tv_count": 0,
-                "episode_count": 0,
-                "user_count": 0,
-            }
+        return _parse_statistics(await self._request("GET", API_ENDPOINT_STATISTIC))
 
     async def get_downloader_info(self) -> dict[str, Any]:
         """获取下载器信息
@@ -332,26 +914,7 @@ class MoviePilotAPIClient:
                 - upload_size: 累计上传量 (bytes)
                 - free_space: 可用空间 (bytes)
         """
-        result = await self._request("GET", API_ENDPOINT_DOWNLOADER)
-
-        # API返回完整对象
-        if isinstance(result, dict):
-            return {
-                "download_speed": float(result.get("download_speed", 0.0)),
-                "upload_speed": float(result.get("upload_speed", 0.0)),
-                "download_size": float(result.get("download_size", 0.0)),
-                "upload_size": float(result.get("upload_size", 0.0)),
-                "free_space": float(result.get("free_space", 0.0)),
-            }
-        else:
-            _LOGGER.warning("下载器信息返回格式异常: %s", result)
-            return {
-                "download_speed": 0.0,
-                "upload_speed": 0.0,
-                "download_size": 0.0,
-                "upload_size": 0.0,
-                "free_space": 0.0,
-            }
+        return _parse_downloader(await self._request("GET", API_ENDPOINT_DOWNLOADER))
 
     async def get_scheduler_info(self) -> list[dict[str, Any]]:
         """获取计划任务信息
@@ -364,13 +927,7 @@ class MoviePilotAPIClient:
                 - status: 状态
                 - next_run: 下次运行时间
         """
-        result = await self._request("GET", API_ENDPOINT_SCHEDULE)
-
-        if isinstance(result, list):
-            return result
-        else:
-            _LOGGER.warning("计划任务返回格式异常: %s", result)
-            return []
+        return _parse_scheduler(await self._request("GET", API_ENDPOINT_SCHEDULE))
 
     async def get_transfer_now(self) -> dict[str, Any]:
         """获取当前传输状态
@@ -381,159 +938,161 @@ class MoviePilotAPIClient:
                 - message: 消息
                 - data: 传输数据（空表示无传输）
         """
-        result = await self._request("GET", API_ENDPOINT_TRANSFER_NOW)
-
-        if isinstance(result, dict):
-            return result
-        else:
-            _LOGGER.warning("传输状态返回格式异常: %s", result)
-            return {"success": False, "message": None, "data": {}}
+        return _parse_transfer(await self._request("GET", API_ENDPOINT_TRANSFER_NOW))
 
     # ========== 便捷方法 ==========
 
+    async def get_overview(
+        self,
+        endpoints: Iterable[str],
+        deadline: float | None = None,
+        priority: int = REQUEST_PRIORITY_LIVE,
+    ) -> dict[str, Any]:
+        """并发获取指定端点的Dashboard数据
+
+        每个端点只贡献自己负责的字段，调用方可以按不同频率分组获取。
+        失败或超过截止时间的端点不会出现在结果中，由调用方决定
+        是否沿用上一次的值，而不是用0填充。
+
+        Args:
+            endpoints: 需要请求的API端点
+            deadline: 本轮请求的截止时间(秒)，到期后未完成的请求被取消
+            priority: 请求优先级
+
+        Returns:
+            由成功端点的字段合并而成的数据字典
+
+        Raises:
+            MoviePilotAuthError: 认证失败
+            MoviePilotConnectionError: 没有任何端点在截止时间前成功返回
+        """
+        tasks = {
+            asyncio.ensure_future(self._request("GET", endpoint, priority=priority)): endpoint
+            for endpoint in endpoints
+        }
+        if not tasks:
+            return {}
+
+        done, pending = await asyncio.wait(tasks, timeout=deadline)
+        for task in pending:
+            task.cancel()
+        if pending:
+            _LOGGER.debug(
+                "以下端点超过本轮截止时间 %.1fs: %s",
+                deadline,
+                ", ".join(tasks[task] for task in pending),
+            )
+            await asyncio.wait(pending)
+
+        errors = {task: task.exception() for task in done}
+        for err in errors.values():
+            # 令牌失效时交给调用方处理 (触发重新认证)
+            if isinstance(err, MoviePilotAuthError):
+                raise err
+
+        overview: dict[str, Any] = {}
+        error: BaseException | None = None
+        for task, err in errors.items():
+            if err is not None:
+                error = err
+                continue
+            endpoint = tasks[task]
+            result = task.result()
+            # 响应对象未变化 (304/内容摘要一致) 时复用上次构建的字段
+            cached = self._overview_fields.get(endpoint)
+            if cached is not None and cached[0] is result:
+                fields = cached[1]
+            else:
+                fields = _OVERVIEW_BUILDERS[endpoint](result)
+                self._overview_fields[endpoint] = (result, fields)
+            overview.update(fields)
+
+        if not overview:
+            raise MoviePilotConnectionError(
+                f"No endpoint responded in time: {error or 'deadline exceeded'}"
+            )
+        return overview
+
     async def get_dashboard_overview(self) -> dict[str, Any]:
         """获取Dashboard完整数据 (并发请求所有端点)
 
         Returns:
             完整的Dashboard数据字典
         """
-        try:
-            # 并发获取所有Dashboard数据
-            results = await asyncio.gather(
-                self.get_cpu_usage(),
-                self.get_memory_usage(),
-                self.get_storage_usage(),
-                self.get_network_usage(),
-                self.get_statistics(),
-                self.get_downloader_info(),
-                self.get_scheduler_info(),
-                self.get_transfer_now(),
-                return_exceptions=True,
-            )
+        return await self.get_overview(DASHBOARD_ENDPOINTS)
 
-            # 解包结果
-            cpu, memory, storage, network, stats, downloader, tasks, transfer = results
-
-            # 处理异常结果
-            cpu = cpu if not isinstance(cpu, Exception) else 0.0
-            memory = memory if not isinstance(memory, Exception) else {"used_bytes": 0, "percent": 0.0}
-            storage = storage if not isinstance(storage, Exception) else {
-                "total_bytes": 0,
-                "used_bytes": 0,
-                "free_bytes": 0,
-                "percent": 0.0,
-            }
-            network = network if not isinstance(network, Exception) else {
-                "upload_speed": 0.0,
-                "download_speed": 0.0,
-            }
-            stats = stats if not isinstance(stats, Exception) else {
-                "movie_count": 0,
-                "tv_count": 0,
-                "episode_count": 0,
-                "user_count": 0,
-            }
-            downloader = downloader if not isinstance(downloader, Exception) else {
-                "download_speed": 0.0,
-                "upload_speed": 0.0,
-                "download_size": 0.0,
-                "upload_size": 0.0,
-                "free_space": 0.0,
-            }
-            tasks = tasks if not isinstance(tasks, Exception) else []
-            transfer = transfer if not isinstance(transfer, Exception) else {
-                "success": False,
-                "message": None,
-                "data": {},
-            }
+    # ========== 事件流 (推送模式) ==========
 
-            # 统计任务状态
-            running_tasks = 0
-            pending_tasks = 0
-            if isinstance(tasks, list):
-                for task in tasks:
-                    if isinstance(task, dict):
-                        status = task.get("status", "")
-                        if status == "运行中":
-                            running_tasks += 1
-                        elif status == "等待":
-                            pending_tasks += 1
-
-            # 检查是否有传输
-            is_transferring = False
-            if isinstance(transfer, dict) and transfer.get("data"):
-                is_transferring = True
-
-            # 检查是否在下载
-            is_downloading = False
-            if isinstance(downloader, dict) and downloader.get("download_speed", 0) > 0:
-                is_downloading = True
-
-            # 整合数据
-            overview = {
-                # 系统指标
-                "cpu_percent": cpu,
-                "memory_percent": memory.get("percent", 0.0),
-                "memory_used_bytes": memory.get("used_bytes", 0),
-                "disk_percent": storage.get("percent", 0.0),
-                "disk_total_bytes": storage.get("total_bytes", 0),
-                "disk_used_bytes": storage.get("used_bytes", 0),
-                "disk_free_bytes": storage.get("free_bytes", 0),
-                # 网络
-                "network_upload_speed": network.get("upload_speed", 0.0),
-                "network_download_speed": network.get("download_speed", 0.0),
-                # 媒体库统计
-                "movie_count": stats.get("movie_count", 0),
-                "tv_count": stats.get("tv_count", 0),
-                "episode_count": stats.get("episode_count", 0),
-                "user_count": stats.get("user_count", 0),
-                # 下载器
-                "downloader_download_speed": downloader.get("download_speed", 0.0),
-                "downloader_upload_speed": downloader.get("upload_speed", 0.0),
-                "downloader_total_downloaded": downloader.get("download_size", 0.0),
-                "downloader_total_uploaded": downloader.get("upload_size", 0.0),
-                "downloader_free_space": downloader.get("free_space", 0.0),
-                # 任务
-                "running_tasks": running_tasks,
-                "pending_tasks": pending_tasks,
-                "tasks": tasks,
-                # 状态
-                "is_transferring": is_transferring,
-                "is_downloading": is_downloading,
-                "transfer_data": transfer.get("data", {}),
-            }
+    async def stream_events(
+        self,
+        endpoint: str,
+        last_event_id: str | None = None,
+        on_open: Callable[[], None] | None = None,
+    ) -> AsyncIterator[ServerSentEvent]:
+        """订阅服务器推送事件流 (SSE)
 
-            return overview
+        长连接不经过并发限流和熔断器；超过 PUSH_READ_TIMEOUT 秒没有
+        收到任何数据时视为连接中断，由调用方负责重连。
 
-        except Exception as err:
-            _LOGGER.error("获取Dashboard概览失败: %s", err)
-            # 返回空数据而不是抛出异常
-            return {
-                "cpu_percent": 0.0,
-                "memory_percent": 0.0,
-                "memory_used_bytes": 0,
-                "disk_percent": 0.0,
-                "disk_total_bytes": 0,
-                "disk_used_bytes": 0,
-                "disk_free_bytes": 0,
-                "network_upload_speed": 0.0,
-                "network_download_speed": 0.0,
-                "movie_count": 0,
-                "tv_count": 0,
-                "episode_count": 0,
-                "user_count": 0,
-                "downloader_download_speed": 0.0,
-                "downloader_upload_speed": 0.0,
-                "downloader_total_downloaded": 0.0,
-                "downloader_total_uploaded": 0.0,
-                "downloader_free_space": 0.0,
-                "running_tasks": 0,
-                "pending_tasks": 0,
-                "tasks": [],
-                "is_transferring": False,
-                "is_downloading": False,
-                "transfer_data": {},
-            }
+        Args:
+            endpoint: 事件流端点路径
+            last_event_id: 上次收到的事件ID，用于断线后续传
+            on_open: 连接建立 (HTTP 200) 时的回调
+
+        Yields:
+            收到的事件
+
+        Raises:
+            MoviePilotAuthError: 认证失败
+            MoviePilotEndpointNotFoundError: 当前版本没有该事件流
+            MoviePilotConnectionError: 连接失败或中断
+            MoviePilotAPIError: 其他API错误
+        """
+        headers = {
+            **self.headers,
+            "Accept": "text/event-stream",
+            "Accept-Encoding": "identity",
+            "Cache-Control": "no-cache",
+        }
+        if last_event_id:
+            headers["Last-Event-ID"] = last_event_id
+        timeout = aiohttp.ClientTimeout(
+            total=None, sock_connect=DEFAULT_TIMEOUT, sock_read=PUSH_READ_TIMEOUT
+        )
+
+        try:
+            async with self.session.get(
+                URL(f"{self.base_url}{endpoint}"),
+                headers=headers,
+                params=self._auth_params,
+                timeout=timeout,
+                ssl=self.verify_ssl,
+            ) as response:
+                if response.status == 401:
+                    raise MoviePilotAuthError("Authentication failed. Please check your API token.")
+                if response.status == 404:
+                    raise MoviePilotEndpointNotFoundError(f"API endpoint not found: {endpoint}")
+                if response.status >= 400:
+                    raise MoviePilotAPIError(f"Event stream failed: HTTP {response.status}")
+
+                _LOGGER.debug("事件流已连接: %s", endpoint)
+                if on_open is not None:
+                    on_open()
+
+                decoder = _SSEDecoder()
+                async for raw_line in response.content:
+                    line = raw_line.decode("utf-8", errors="replace").rstrip("\r\n")
+                    if (event := decoder.feed(line)) is not None:
+                        yield event
+
+        except MoviePilotAPIError:
+            raise
+        except asyncio.TimeoutError as err:
+            raise MoviePilotConnectionError(f"Event stream idle for {PUSH_READ_TIMEOUT}s") from err
+        except aiohttp.ClientError as err:
+            raise MoviePilotConnectionError(f"Event stream interrupted: {err}") from err
+
+        raise MoviePilotConnectionError("Event stream closed by server")
 
     # ========== 系统信息 (兼容性方法) ==========
 
@@ -554,4 +1113,272 @@ class MoviePilotAPIClient:
             _LOGGER.warning("获取系统信息失败: %s", err)
             return {"version": "unknown"}
 
+    async def get_version(self) -> str | None:
+        """获取MoviePilot版本号
+
+        /system/env 需要超级用户会话，API令牌通常无权访问。此时视为
+        版本未知，不计入熔断器，仪表盘端点的轮询不受影响。
+
+        Returns:
+            版本号字符串，无法获取时返回None
+
+        Raises:
+            MoviePilotConnectionError: 连接失败
+        """
+        try:
+            result = await self._request_once(
+                "GET", API_ENDPOINT_SYSTEM_ENV, record_auth=False
+            )
+        except MoviePilotConnectionError:
+            raise
+        except MoviePilotAPIError as err:
+            _LOGGER.debug("获取MoviePilot版本失败: %s", err)
+            return None
+
+        if isinstance(result, dict):
+            env = result.get("data") if isinstance(result.get("data"), dict) else result
+            version = env.get("VERSION") or env.get("version")
+            if version:
+                return str(version)
+        return None
+
+    async def probe_capabilities(
+        self,
+        endpoints: Iterable[str] = DASHBOARD_ENDPOINTS,
+    ) -> dict[str, dict[str, Any]]:
+        """探测各端点是否可用及其响应结构
+
+        Args:
+            endpoints: 需要探测的API端点
+
+        Returns:
+            端点 -> {"supported": 是否可用, "shape": 响应类型, "keys": 顶层字段}
+
+        Raises:
+            MoviePilotAuthError: 认证失败
+            MoviePilotConnectionError: 连接失败 (此时无法判断端点是否存在)
+        """
+        endpoints = tuple(endpoints)
+        results = await asyncio.gather(
+            *(self._request("GET", endpoint) for endpoint in endpoints),
+            return_exceptions=True,
+        )
+
+        capabilities: dict[str, dict[str, Any]] = {}
+        for endpoint, result in zip(endpoints, results):
+            if isinstance(result, (MoviePilotAuthError, MoviePilotConnectionError)):
+                raise result
+            if isinstance(result, MoviePilotEndpointNotFoundError):
+                capabilities[endpoint] = {"supported": False, "shape": None, "keys": []}
+            elif isinstance(result, BaseException):
+                # 端点存在但本次返回错误，仍视为可用
+                capabilities[endpoint] = {"supported": True, "shape": None, "keys": []}
+            else:
+                capabilities[endpoint] = {
+                    "supported": True,
+                    "shape": type(result).__name__,
+                    "keys": sorted(result) if isinstance(result, dict) else [],
+                }
+        return capabilities
+
     # 发送通知相关接口已移除
+
+
+# ========== 响应解析 ==========
+
+
+def _parse_cpu(result: Any) -> float:
+    """解析CPU使用率响应 (API返回的是数字)"""
+    if isinstance(result, (int, float)):
+        return float(result)
+    _LOGGER.warning("CPU使用率返回格式异常: %s", result)
+    return 0.0
+
+
+def _parse_memory(result: Any) -> dict[str, Any]:
+    """解析内存响应 (API返回: [已用字节数, 百分比])"""
+    if isinstance(result, list) and len(result) >= 2:
+        return {
+            "used_bytes": int(result[0]) if result[0] else 0,
+            "percent": float(result[1]) if result[1] else 0.0,
+        }
+    _LOGGER.warning("内存使用率返回格式异常: %s", result)
+    return {"used_bytes": 0, "percent": 0.0}
+
+
+def _parse_storage(result: Any) -> dict[str, Any]:
+    """解析存储响应 (API返回: {"total_storage": xxx, "used_storage": xxx})"""
+    if isinstance(result, dict):
+        total = float(result.get("total_storage", 0))
+        used = float(result.get("used_storage", 0))
+        percent = (used / total * 100) if total > 0 else 0.0
+
+        return {
+            "total_bytes": total,
+            "used_bytes": used,
+            "free_bytes": total - used,
+            "percent": percent,
+        }
+    _LOGGER.warning("存储使用率返回格式异常: %s", result)
+    return {"total_bytes": 0, "used_bytes": 0, "free_bytes": 0, "percent": 0.0}
+
+
+def _parse_network(result: Any) -> dict[str, Any]:
+    """解析网络响应 (API返回: [上传速度, 下载速度])"""
+    if isinstance(result, list) and len(result) >= 2:
+        return {
+            "upload_speed": float(result[0]) if result[0] else 0.0,
+            "download_speed": float(result[1]) if result[1] else 0.0,
+        }
+    _LOGGER.warning("网络使用返回格式异常: %s", result)
+    return {"upload_speed": 0.0, "download_speed": 0.0}
+
+
+def _parse_statistics(result: Any) -> dict[str, Any]:
+    """解析媒体库统计响应 (API返回: {"movie_count": xx, "tv_count": xx, ...})"""
+    if isinstance(result, dict):
+        return {
+            "movie_count": int(result.get("movie_count", 0)),
+            "tv_count": int(result.get("tv_count", 0)),
+            "episode_count": int(result.get("episode_count", 0)),
+            "user_count": int(result.get("user_count", 0)),
+        }
+    _LOGGER.warning("统计信息返回格式异常: %s", result)
+    return {
+        "movie_count": 0,
+        "tv_count": 0,
+        "episode_count": 0,
+        "user_count": 0,
+    }
+
+
+def _parse_downloader(result: Any) -> dict[str, Any]:
+    """解析下载器响应 (API返回完整对象)"""
+    if isinstance(result, dict):
+        return {
+            "download_speed": float(result.get("download_speed", 0.0)),
+            "upload_speed": float(result.get("upload_speed", 0.0)),
+            "download_size": float(result.get("download_size", 0.0)),
+            "upload_size": float(result.get("upload_size", 0.0)),
+            "free_space": float(result.get("free_space", 0.0)),
+        }
+    _LOGGER.warning("下载器信息返回格式异常: %s", result)
+    return {
+        "download_speed": 0.0,
+        "upload_speed": 0.0,
+        "download_size": 0.0,
+        "upload_size": 0.0,
+        "free_space": 0.0,
+    }
+
+
+def _parse_scheduler(result: Any) -> list[dict[str, Any]]:
+    """解析计划任务响应 (API返回任务列表)"""
+    if isinstance(result, list):
+        return result
+    _LOGGER.warning("计划任务返回格式异常: %s", result)
+    return []
+
+
+def _parse_transfer(result: Any) -> dict[str, Any]:
+    """解析传输状态响应"""
+    if isinstance(result, dict):
+        return result
+    _LOGGER.warning("传输状态返回格式异常: %s", result)
+    return {"success": False, "message": None, "data": {}}
+
+
+# ========== Dashboard字段构建 ==========
+
+
+def _build_cpu_fields(result: Any) -> dict[str, Any]:
+    """构建CPU相关字段"""
+    return {"cpu_percent": _parse_cpu(result)}
+
+
+def _build_memory_fields(result: Any) -> dict[str, Any]:
+    """构建内存相关字段"""
+    memory = _parse_memory(result)
+    return {
+        "memory_percent": memory["percent"],
+        "memory_used_bytes": memory["used_bytes"],
+    }
+
+
+def _build_storage_fields(result: Any) -> dict[str, Any]:
+    """构建存储相关字段"""
+    storage = _parse_storage(result)
+    return {
+        "disk_percent": storage["percent"],
+        "disk_total_bytes": storage["total_bytes"],
+        "disk_used_bytes": storage["used_bytes"],
+        "disk_free_bytes": storage["free_bytes"],
+    }
+
+
+def _build_network_fields(result: Any) -> dict[str, Any]:
+    """构建网络相关字段"""
+    network = _parse_network(result)
+    return {
+        "network_upload_speed": network["upload_speed"],
+        "network_download_speed": network["download_speed"],
+    }
+
+
+def _build_statistics_fields(result: Any) -> dict[str, Any]:
+    """构建媒体库统计字段"""
+    return _parse_statistics(result)
+
+
+def _build_downloader_fields(result: Any) -> dict[str, Any]:
+    """构建下载器相关字段"""
+    downloader = _parse_downloader(result)
+    return {
+        "downloader_download_speed": downloader["download_speed"],
+        "downloader_upload_speed": downloader["upload_speed"],
+        "downloader_total_downloaded": downloader["download_size"],
+        "downloader_total_uploaded": downloader["upload_size"],
+        "downloader_free_space": downloader["free_space"],
+        "is_downloading": downloader["download_speed"] > 0,
+    }
+
+
+def _build_scheduler_fields(result: Any) -> dict[str, Any]:
+    """构建计划任务字段 (统计运行中和等待中的任务)"""
+    tasks = _parse_scheduler(result)
+    running_tasks = 0
+    pending_tasks = 0
+    for task in tasks:
+        if isinstance(task, dict):
+            status = task.get("status", "")
+            if status == STATUS_RUNNING:
+                running_tasks += 1
+            elif status == STATUS_WAITING:
+                pending_tasks += 1
+    return {
+        "running_tasks": running_tasks,
+        "pending_tasks": pending_tasks,
+        "tasks": tasks,
+    }
+
+
+def _build_transfer_fields(result: Any) -> dict[str, Any]:
+    """构建传输状态字段"""
+    transfer_data = _parse_transfer(result).get("data") or {}
+    return {
+        "is_transferring": bool(transfer_data),
+        "transfer_data": transfer_data,
+    }
+
+
+# 端点 -> 字段构建函数
+_OVERVIEW_BUILDERS: dict[str, Callable[[Any], dict[str, Any]]] = {
+    API_ENDPOINT_CPU: _build_cpu_fields,
+    API_ENDPOINT_MEMORY: _build_memory_fields,
+    API_ENDPOINT_STORAGE: _build_storage_fields,
+    API_ENDPOINT_NETWORK: _build_network_fields,
+    API_ENDPOINT_STATISTIC: _build_statistics_fields,
+    API_ENDPOINT_DOWNLOADER: _build_downloader_fields,
+    API_ENDPOINT_SCHEDULE: _build_scheduler_fields,
+    API_ENDPOINT_TRANSFER_NOW: _build_transfer_fields,
+}
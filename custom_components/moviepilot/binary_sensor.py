@@ -14,12 +14,15 @@ from homeassistant.helpers.entity_platform import AddEntitiesCallback
 from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
 from .const import (
+    ATTR_DATA_AGE,
+    DATA_COORDINATORS,
     DOMAIN,
     ICON_CLOUD,
     ICON_DOWNLOAD,
     ICON_TASK,
+    UPDATE_GROUP_LIVE,
 )
-from .sensor import MoviePilotDataUpdateCoordinator
+from .coordinator import MoviePilotDataUpdateCoordinator
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -30,11 +33,11 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up MoviePilot binary sensors from a config entry."""
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    coordinators = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATORS]
 
     sensors: list[BinarySensorEntity] = [
-        MoviePilotOnlineSensor(coordinator, entry),
-        MoviePilotDownloadingSensor(coordinator, entry),
+        MoviePilotOnlineSensor(coordinators, entry),
+        MoviePilotDownloadingSensor(coordinators, entry),
     ]
 
     async_add_entities(sensors)
@@ -46,15 +49,23 @@ class MoviePilotBinarySensorBase(
     """Base class for MoviePilot binary sensors."""
 
     _attr_has_entity_name = True
+    # 数据所属的更新组
+    _update_group: str = UPDATE_GROUP_LIVE
+    # 依赖的数据字段
+    _overview_keys: tuple[str, ...] = ()
 
     def __init__(
         self,
-        coordinator: MoviePilotDataUpdateCoordinator,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
         entry: ConfigEntry,
         sensor_type: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        # 以依赖字段作为 context，coordinator 只在这些字段变化时通知
+        super().__init__(
+            coordinators[self._update_group],
+            context=frozenset(self._overview_keys) or None,
+        )
         self._entry = entry
         self._sensor_type = sensor_type
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
@@ -66,6 +77,12 @@ class MoviePilotBinarySensorBase(
             "sw_version": "moviepilot V2",
         }
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the data age while serving values from an earlier cycle."""
+        age = self.coordinator.data_age(self._overview_keys)
+        return {} if age is None else {ATTR_DATA_AGE: age}
+
 
 class MoviePilotOnlineSensor(MoviePilotBinarySensorBase):
     """MoviePilot online status sensor."""
@@ -76,11 +93,11 @@ class MoviePilotOnlineSensor(MoviePilotBinarySensorBase):
 
     def __init__(
         self,
-        coordinator: MoviePilotDataUpdateCoordinator,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "online")
+        super().__init__(coordinators, entry, "online")
 
     @property
     def is_on(self) -> bool:
@@ -100,24 +117,34 @@ class MoviePilotDownloadingSensor(MoviePilotBinarySensorBase):
     _attr_name = "下载中"
     _attr_icon = ICON_DOWNLOAD
     _attr_device_class = BinarySensorDeviceClass.RUNNING
+    _overview_keys = (
+        "is_downloading",
+        "downloader_download_speed",
+        "downloader_upload_speed",
+        "is_transferring",
+        "transfer_progress",
+    )
 
     def __init__(
         self,
-        coordinator: MoviePilotDataUpdateCoordinator,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
         entry: ConfigEntry,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "downloading")
+        super().__init__(coordinators, entry, "downloading")
 
     @property
     def is_on(self) -> bool:
         """Return True if downloading."""
-        return self.coordinator.data.get("is_downloading", False)
+        return self.coordinator.data.downloader.is_downloading
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         return {
-            "download_speed": self.coordinator.data.get("downloader_download_speed", 0),
-            "upload_speed": self.coordinator.data.get("downloader_upload_speed", 0),
+            **super().extra_state_attributes,
+            "download_speed": self.coordinator.data.downloader.download_speed or 0,
+            "upload_speed": self.coordinator.data.downloader.upload_speed or 0,
+            "transferring": self.coordinator.data.downloader.is_transferring,
+            "transfer_progress": self.coordinator.data.downloader.transfer_progress,
         }
@@ -0,0 +1,114 @@
+"""Endpoint capability map for the MoviePilot integration."""
+from __future__ import annotations
+
+import logging
+from typing import Any
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+from homeassistant.util import dt as dt_util
+
+from .api import MoviePilotAPIClient
+from .const import CAPABILITY_STORAGE_VERSION, DASHBOARD_ENDPOINTS, DOMAIN
+from .coordinator import MoviePilotDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+def _capability_store(hass: HomeAssistant, entry_id: str) -> Store[dict[str, Any]]:
+    """Return the store holding the capability map of a config entry."""
+    return Store(hass, CAPABILITY_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.capabilities")
+
+
+async def async_remove_capabilities(hass: HomeAssistant, entry_id: str) -> None:
+    """Remove the persisted capability map of a config entry."""
+    await _capability_store(hass, entry_id).async_remove()
+
+
+class MoviePilotCapabilities:
+    """Track which dashboard endpoints this MoviePilot version provides.
+
+    探测结果按配置条目持久化，只有在 MoviePilot 版本变化或通过服务
+    显式请求时才重新探测；不支持的端点从各更新组的请求计划中移除。
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        client: MoviePilotAPIClient,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+    ) -> None:
+        """Initialize the capability map."""
+        self._store = _capability_store(hass, entry_id)
+        self._client = client
+        self._coordinators = coordinators
+        self.version: str | None = None
+        self.endpoints: dict[str, dict[str, Any]] = {}
+        self.probed_at: str | None = None
+
+    @property
+    def unsupported(self) -> frozenset[str]:
+        """Return the endpoints known to be missing."""
+        return frozenset(
+            endpoint
+            for endpoint, capability in self.endpoints.items()
+            if not capability.get("supported", True)
+        )
+
+    async def async_load(self) -> bool:
+        """Load and apply the persisted capability map.
+
+        Returns:
+            True 表示存在已保存的探测结果
+        """
+        stored = await self._store.async_load()
+        if not stored or not stored.get("endpoints"):
+            return False
+
+        self.version = stored.get("version")
+        self.endpoints = stored["endpoints"]
+        self.probed_at = stored.get("probed_at")
+        self._async_apply()
+        return True
+
+    async def async_refresh(self, force: bool = False) -> None:
+        """Re-probe when forced, never probed, or the MoviePilot version changed."""
+        version = await self._client.get_version()
+        if not force and self.endpoints and (version is None or version == self.version):
+            return
+
+        if self.endpoints and not force:
+            _LOGGER.info("MoviePilot版本变化 (%s -> %s)，重新探测端点", self.version, version)
+        await self.async_probe(version)
+
+    async def async_probe(self, version: str | None) -> None:
+        """Probe all dashboard endpoints and persist the result."""
+        self.endpoints = await self._client.probe_capabilities(DASHBOARD_ENDPOINTS)
+        self.version = version
+        self.probed_at = dt_util.utcnow().isoformat()
+
+        if unsupported := self.unsupported:
+            _LOGGER.warning(
+                "MoviePilot %s 不支持以下端点，已停止请求: %s",
+                version or "",
+                ", ".join(sorted(unsupported)),
+            )
+        else:
+            _LOGGER.debug("MoviePilot %s 支持全部端点", version or "")
+
+        self._async_apply()
+        await self._store.async_save(
+            {
+                "version": self.version,
+                "probed_at": self.probed_at,
+                "endpoints": self.endpoints,
+            }
+        )
+
+    @callback
+    def _async_apply(self) -> None:
+        """Drop unsupported endpoints from every update group."""
+        unsupported = self.unsupported
+        for coordinator in self._coordinators.values():
+            coordinator.async_set_unsupported_endpoints(unsupported)
@@ -14,17 +14,42 @@ from homeassistant.core import HomeAssistant, callback
 from homeassistant.data_entry_flow import FlowResult
 from homeassistant.exceptions import HomeAssistantError
 from homeassistant.helpers.aiohttp_client import async_get_clientsession
+from homeassistant.helpers.selector import TextSelector, TextSelectorConfig
 
 from .api import MoviePilotAPIClient
 from .const import (
+    CONF_ADAPTIVE_POLLING,
+    CONF_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    CONF_PUSH_MODE,
     CONF_SCAN_INTERVAL,
+    CONF_WEBHOOK_BATCH_EVENT,
+    CONF_WEBHOOK_MAX_BODY_SIZE,
+    CONF_WEBHOOK_OVERFLOW,
+    CONF_WEBHOOK_ROUTES,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_DEADBANDS,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
     DEFAULT_NAME,
     DEFAULT_PORT,
+    DEFAULT_PUSH_MODE,
     DEFAULT_SCAN_INTERVAL,
+    DEFAULT_WEBHOOK_BATCH_EVENT,
+    DEFAULT_WEBHOOK_MAX_BODY_SIZE,
+    DEFAULT_WEBHOOK_OVERFLOW,
     DOMAIN,
+    MAX_PUBLISH_INTERVAL,
     MAX_SCAN_INTERVAL,
+    MAX_WEBHOOK_MAX_BODY_SIZE,
     MIN_SCAN_INTERVAL,
+    MIN_WEBHOOK_MAX_BODY_SIZE,
+    RESPONSE_CACHE_TTL,
+    WEBHOOK_OVERFLOW_POLICIES,
 )
+from .routing import compile_routes
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -48,6 +73,7 @@ async def validate_input(hass: HomeAssistant, data: dict[str, Any]) -> dict[str,
         data[CONF_API_TOKEN],
         session,
         verify_ssl=False,  # MoviePilot 通常使用自签名证书
+        cache_ttl=RESPONSE_CACHE_TTL,  # 连接测试与系统信息共用统计端点的响应
     )
 
     # Test connection with API token
@@ -224,36 +250,115 @@ class MoviePilotOptionsFlowHandler(config_entries.OptionsFlow):
     def __init__(self, config_entry: config_entries.ConfigEntry) -> None:
         """Initialize options flow."""
         self._config_entry = config_entry
+        # 保留配置流程写入的其他选项 (如 version)
+        self._options: dict[str, Any] = dict(config_entry.options)
 
     async def async_step_init(
         self, user_input: dict[str, Any] | None = None
     ) -> FlowResult:
-        """Manage the MoviePilot options."""
+        """Manage the MoviePilot polling options."""
         if user_input is not None:
-            interval = max(
+            self._options.update(user_input)
+            self._options[CONF_SCAN_INTERVAL] = max(
                 MIN_SCAN_INTERVAL,
                 min(MAX_SCAN_INTERVAL, user_input[CONF_SCAN_INTERVAL]),
             )
-            return self.async_create_entry(
-                title="",
-                data={CONF_SCAN_INTERVAL: interval},
-            )
+            return await self.async_step_publishing()
 
-        current = self._config_entry.options.get(
-            CONF_SCAN_INTERVAL,
-            DEFAULT_SCAN_INTERVAL,
-        )
+        options = self._options
 
         schema = vol.Schema(
             {
                 vol.Required(
                     CONF_SCAN_INTERVAL,
-                    default=current,
+                    default=options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL),
                 ): vol.All(
                     vol.Coerce(int),
                     vol.Range(min=MIN_SCAN_INTERVAL, max=MAX_SCAN_INTERVAL),
                 ),
+                vol.Required(
+                    CONF_ADAPTIVE_POLLING,
+                    default=options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING),
+                ): bool,
+                vol.Required(
+                    CONF_PUSH_MODE,
+                    default=options.get(CONF_PUSH_MODE, DEFAULT_PUSH_MODE),
+                ): bool,
             }
         )
 
         return self.async_show_form(step_id="init", data_schema=schema)
+
+    async def async_step_publishing(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage deadband publishing of noisy measurement sensors."""
+        if user_input is not None:
+            self._options.update(user_input)
+            return await self.async_step_webhook()
+
+        options = self._options
+        fields: dict[Any, Any] = {}
+        for sensor_type, (absolute, relative) in DEFAULT_DEADBANDS.items():
+            absolute_key = f"{sensor_type}_{CONF_DEADBAND_ABSOLUTE}"
+            relative_key = f"{sensor_type}_{CONF_DEADBAND_RELATIVE}"
+            fields[
+                vol.Required(absolute_key, default=options.get(absolute_key, absolute))
+            ] = vol.All(vol.Coerce(float), vol.Range(min=0))
+            fields[
+                vol.Required(relative_key, default=options.get(relative_key, relative))
+            ] = vol.All(vol.Coerce(float), vol.Range(min=0, max=100))
+
+        for key, default in (
+            (CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL),
+            (CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL),
+        ):
+            fields[vol.Required(key, default=options.get(key, default))] = vol.All(
+                vol.Coerce(int), vol.Range(min=0, max=MAX_PUBLISH_INTERVAL)
+            )
+
+        return self.async_show_form(step_id="publishing", data_schema=vol.Schema(fields))
+
+    async def async_step_webhook(
+        self, user_input: dict[str, Any] | None = None
+    ) -> FlowResult:
+        """Manage how webhook notifications are received and routed."""
+        errors: dict[str, str] = {}
+        if user_input is not None:
+            routes = user_input.get(CONF_WEBHOOK_ROUTES, "")
+            try:
+                compile_routes(routes)
+            except vol.Invalid as err:
+                _LOGGER.warning("Webhook路由规则无效: %s", err)
+                errors[CONF_WEBHOOK_ROUTES] = "invalid_routes"
+            else:
+                self._options.update(user_input)
+                self._options[CONF_WEBHOOK_ROUTES] = routes
+                return self.async_create_entry(title="", data=self._options)
+
+        options = {**self._options, **(user_input or {})}
+        schema = vol.Schema(
+            {
+                vol.Required(
+                    CONF_WEBHOOK_OVERFLOW,
+                    default=options.get(CONF_WEBHOOK_OVERFLOW, DEFAULT_WEBHOOK_OVERFLOW),
+                ): vol.In(WEBHOOK_OVERFLOW_POLICIES),
+                vol.Required(
+                    CONF_WEBHOOK_BATCH_EVENT,
+                    default=options.get(CONF_WEBHOOK_BATCH_EVENT, DEFAULT_WEBHOOK_BATCH_EVENT),
+                ): bool,
+                vol.Required(
+                    CONF_WEBHOOK_MAX_BODY_SIZE,
+                    default=options.get(CONF_WEBHOOK_MAX_BODY_SIZE, DEFAULT_WEBHOOK_MAX_BODY_SIZE),
+                ): vol.All(
+                    vol.Coerce(int),
+                    vol.Range(min=MIN_WEBHOOK_MAX_BODY_SIZE, max=MAX_WEBHOOK_MAX_BODY_SIZE),
+                ),
+                vol.Optional(
+                    CONF_WEBHOOK_ROUTES,
+                    description={"suggested_value": options.get(CONF_WEBHOOK_ROUTES, "")},
+                ): TextSelector(TextSelectorConfig(multiline=True)),
+            }
+        )
+
+        return self.async_show_form(step_id="webhook", data_schema=schema, errors=errors)
@@ -7,6 +7,17 @@ DOMAIN: Final = "moviepilot"
 
 # Configuration keys
 CONF_SCAN_INTERVAL: Final = "scan_interval"
+CONF_ADAPTIVE_POLLING: Final = "adaptive_polling"
+CONF_PUSH_MODE: Final = "push_mode"
+# Deadband options are stored per sensor type, e.g. "cpu_deadband_absolute"
+CONF_DEADBAND_ABSOLUTE: Final = "deadband_absolute"
+CONF_DEADBAND_RELATIVE: Final = "deadband_relative"
+CONF_MIN_PUBLISH_INTERVAL: Final = "min_publish_interval"
+CONF_HEARTBEAT_INTERVAL: Final = "heartbeat_interval"
+CONF_WEBHOOK_OVERFLOW: Final = "webhook_overflow"
+CONF_WEBHOOK_BATCH_EVENT: Final = "webhook_batch_event"
+CONF_WEBHOOK_MAX_BODY_SIZE: Final = "webhook_max_body_size"
+CONF_WEBHOOK_ROUTES: Final = "webhook_routes"
 
 # Default values
 DEFAULT_NAME: Final = "MoviePilot"
@@ -15,9 +26,77 @@ DEFAULT_SCAN_INTERVAL: Final = 30  # seconds
 MIN_SCAN_INTERVAL: Final = 10  # seconds
 MAX_SCAN_INTERVAL: Final = 300  # seconds (5 minutes)
 DEFAULT_TIMEOUT: Final = 30  # seconds
+MIN_REQUEST_TIMEOUT: Final = 3  # seconds, lower bound for learned timeouts
+
+# Learned per-endpoint timeouts: p95 of recent latencies times a safety factor
+LATENCY_WINDOW: Final = 50  # samples kept per endpoint
+LATENCY_MIN_SAMPLES: Final = 5  # use DEFAULT_TIMEOUT until this many samples
+LATENCY_TIMEOUT_FACTOR: Final = 3
+
+# Short-lived cache for identical GET responses (0 disables)
+RESPONSE_CACHE_TTL: Final = 5  # seconds
+
+# Per-client concurrency limiter with priority classes (lower value goes first)
+CLIENT_MAX_CONCURRENCY: Final = 2  # concurrent requests to one MoviePilot host
+REQUEST_PRIORITY_INTERACTIVE: Final = 0  # service actions, config flow validation
+REQUEST_PRIORITY_LIVE: Final = 1  # live metrics
+REQUEST_PRIORITY_BACKGROUND: Final = 2  # slow-changing statistics
+REQUEST_PRIORITY_NAMES: Final = {
+    REQUEST_PRIORITY_INTERACTIVE: "interactive",
+    REQUEST_PRIORITY_LIVE: "live",
+    REQUEST_PRIORITY_BACKGROUND: "background",
+}
+
+# Integration-wide scheduling across config entries
+SCHEDULER_MAX_INFLIGHT: Final = 6  # concurrent HTTP requests across all entries
+STAGGER_MAX_OFFSET: Final = 60  # seconds, upper bound of a group's start offset
+STAGGER_JITTER: Final = 2.0  # seconds of random jitter added to the offset
+
+# Push mode (server-sent events)
+PUSH_RECONCILE_INTERVAL: Final = timedelta(minutes=5)  # live polling while connected
+PUSH_READ_TIMEOUT: Final = 300  # seconds without any data before reconnecting
+PUSH_RECONNECT_BASE_DELAY: Final = 2  # seconds
+PUSH_RECONNECT_MAX_DELAY: Final = 300  # seconds
+
+# Endpoint capability map (persisted per config entry)
+CAPABILITY_STORAGE_VERSION: Final = 1
+
+# Connection pool (per config entry)
+CONNECTION_LIMIT_PER_HOST: Final = 4
+CONNECTION_KEEPALIVE_TIMEOUT: Final = 60  # seconds
+DNS_CACHE_TTL: Final = 300  # seconds
+
+# Persisted coordinator snapshot used for fast startup
+SNAPSHOT_STORAGE_VERSION: Final = 1
+SNAPSHOT_SAVE_DELAY: Final = 60  # seconds, batches writes to disk
+
+# Cycle deadline: fraction of the update interval a refresh may take
+CYCLE_DEADLINE_RATIO: Final = 0.8
+DEFAULT_ADAPTIVE_POLLING: Final = False
+DEFAULT_PUSH_MODE: Final = False
+DEFAULT_WEBHOOK_BATCH_EVENT: Final = False
+DEFAULT_WEBHOOK_MAX_BODY_SIZE: Final = 1024  # KiB
+
+# Adaptive polling: stay fast while active, back off after being idle this long
+ADAPTIVE_IDLE_DELAY: Final = 120  # seconds
+ADAPTIVE_BACKOFF_FACTOR: Final = 2
+
+# Circuit breaker: stop hitting an unreachable server and probe with backoff
+CIRCUIT_FAILURE_THRESHOLD: Final = 3  # consecutive connection errors
+CIRCUIT_BASE_DELAY: Final = 5  # seconds, doubled on every failed probe
+CIRCUIT_MAX_DELAY: Final = 300  # seconds
+CIRCUIT_AUTH_DELAY: Final = 600  # seconds before retrying a rejected token
+CIRCUIT_JITTER: Final = 0.2  # +/- fraction applied to every delay
+
+CIRCUIT_CLOSED: Final = "closed"
+CIRCUIT_OPEN: Final = "open"
+CIRCUIT_HALF_OPEN: Final = "half_open"
 
 # Update intervals for different data types
 UPDATE_INTERVAL_DASHBOARD: Final = timedelta(seconds=30)  # System metrics
+UPDATE_INTERVAL_TASKS: Final = timedelta(seconds=60)  # Scheduler tasks
+UPDATE_INTERVAL_STORAGE: Final = timedelta(minutes=10)  # Disk totals
+UPDATE_INTERVAL_LIBRARY: Final = timedelta(minutes=30)  # Library counts
 
 # API endpoints (all tested and verified)
 API_ENDPOINT_CPU: Final = "/api/v1/dashboard/cpu2"
@@ -29,6 +108,146 @@ API_ENDPOINT_DOWNLOADER: Final = "/api/v1/dashboard/downloader2"
 API_ENDPOINT_SCHEDULE: Final = "/api/v1/dashboard/schedule2"
 API_ENDPOINT_TRANSFER_NOW: Final = "/api/v1/transfer/now"
 
+# Webhook notification type -> endpoints whose data it changes
+WEBHOOK_REFRESH_ENDPOINTS: Final = {
+    "Download": (API_ENDPOINT_DOWNLOADER,),
+    "Transfer": (API_ENDPOINT_TRANSFER_NOW, API_ENDPOINT_STATISTIC),
+    "Subscribe": (API_ENDPOINT_STATISTIC,),
+}
+WEBHOOK_REFRESH_DELAY: Final = 0.5  # seconds, batches notifications into one refresh
+
+# Notification types MoviePilot sends to the webhook
+WEBHOOK_NOTIFICATION_TYPES: Final = (
+    "Manual",
+    "System",
+    "Download",
+    "Transfer",
+    "Subscribe",
+    "Media",
+    "Plugin",
+)
+
+# Webhook ingest queue: requests are acknowledged at once and processed in batches
+WEBHOOK_QUEUE_SIZE: Final = 1000  # notifications waiting to be processed
+WEBHOOK_BATCH_SIZE: Final = 100  # notifications processed per batch
+WEBHOOK_BATCH_WINDOW: Final = 0.1  # seconds to collect a burst before processing
+WEBHOOK_OVERFLOW_DROP_OLDEST: Final = "drop_oldest"
+WEBHOOK_OVERFLOW_DROP_NEWEST: Final = "drop_newest"
+WEBHOOK_OVERFLOW_REJECT: Final = "reject"  # answer 503 so the sender retries
+WEBHOOK_OVERFLOW_POLICIES: Final = (
+    WEBHOOK_OVERFLOW_DROP_OLDEST,
+    WEBHOOK_OVERFLOW_DROP_NEWEST,
+    WEBHOOK_OVERFLOW_REJECT,
+)
+DEFAULT_WEBHOOK_OVERFLOW: Final = WEBHOOK_OVERFLOW_DROP_OLDEST
+
+# Webhook request bodies: checked before decoding, read as a stream up to a cap
+WEBHOOK_CONTENT_TYPES: Final = frozenset(
+    {"application/json", "application/x-ndjson", "text/plain"}
+)
+MIN_WEBHOOK_MAX_BODY_SIZE: Final = 16  # KiB
+MAX_WEBHOOK_MAX_BODY_SIZE: Final = 16384  # KiB, Home Assistant's own request limit
+WEBHOOK_READ_CHUNK_SIZE: Final = 65536  # bytes
+
+# Webhook deduplication of retried or repeated notifications
+WEBHOOK_DEDUP_TTL: Final = 300  # seconds a notification key is remembered
+WEBHOOK_DEDUP_SIZE: Final = 2048  # keys kept at most, oldest evicted first
+WEBHOOK_ID_FIELD: Final = "id"  # explicit notification id, used as key when present
+
+# Webhook rate limiting (token buckets per source address and for all sources)
+WEBHOOK_RATE_LIMIT: Final = 20  # notifications per second per source
+WEBHOOK_RATE_BURST: Final = 200  # notifications a source may send at once
+WEBHOOK_GLOBAL_RATE_LIMIT: Final = 50  # notifications per second for all sources
+WEBHOOK_GLOBAL_RATE_BURST: Final = 500
+WEBHOOK_RATE_IDLE_TIMEOUT: Final = 300  # seconds before an idle source is forgotten
+WEBHOOK_RATE_MAX_SOURCES: Final = 1024  # sources tracked at most, least recent evicted
+
+# Webhook sensors exist once for the integration and are updated by a dispatcher signal
+SIGNAL_WEBHOOK_UPDATED: Final = f"{DOMAIN}_webhook_updated"
+SIGNAL_WEBHOOK_SENSORS_RELEASED: Final = f"{DOMAIN}_webhook_sensors_released"
+WEBHOOK_SENSOR_UPDATE_INTERVAL: Final = 1  # seconds, counter updates are coalesced
+
+# Server-sent event streams (push mode)
+API_ENDPOINT_MESSAGE_STREAM: Final = "/api/v1/system/message"
+API_ENDPOINT_TRANSFER_PROGRESS_STREAM: Final = "/api/v1/system/progress/filetransfer"
+
+# Server environment (reports the MoviePilot version)
+API_ENDPOINT_SYSTEM_ENV: Final = "/api/v1/system/env"
+
+# Cheapest endpoint, used to probe a server while the circuit is open
+API_ENDPOINT_PROBE: Final = API_ENDPOINT_CPU
+
+DASHBOARD_ENDPOINTS: Final = (
+    API_ENDPOINT_CPU,
+    API_ENDPOINT_MEMORY,
+    API_ENDPOINT_STORAGE,
+    API_ENDPOINT_NETWORK,
+    API_ENDPOINT_STATISTIC,
+    API_ENDPOINT_DOWNLOADER,
+    API_ENDPOINT_SCHEDULE,
+    API_ENDPOINT_TRANSFER_NOW,
+)
+
+# Update groups: endpoints polled together, each group has its own coordinator
+UPDATE_GROUP_LIVE: Final = "live"
+UPDATE_GROUP_TASKS: Final = "tasks"
+UPDATE_GROUP_STORAGE: Final = "storage"
+UPDATE_GROUP_LIBRARY: Final = "library"
+
+UPDATE_GROUP_ENDPOINTS: Final = {
+    UPDATE_GROUP_LIVE: (
+        API_ENDPOINT_CPU,
+        API_ENDPOINT_MEMORY,
+        API_ENDPOINT_NETWORK,
+        API_ENDPOINT_DOWNLOADER,
+        API_ENDPOINT_TRANSFER_NOW,
+    ),
+    UPDATE_GROUP_TASKS: (API_ENDPOINT_SCHEDULE,),
+    UPDATE_GROUP_STORAGE: (API_ENDPOINT_STORAGE,),
+    UPDATE_GROUP_LIBRARY: (API_ENDPOINT_STATISTIC,),
+}
+
+# Overview fields produced by each endpoint (used to plan which endpoints to fetch)
+ENDPOINT_FIELDS: Final = {
+    API_ENDPOINT_CPU: ("cpu_percent",),
+    API_ENDPOINT_MEMORY: ("memory_percent", "memory_used_bytes"),
+    API_ENDPOINT_NETWORK: ("network_upload_speed", "network_download_speed"),
+    API_ENDPOINT_DOWNLOADER: (
+        "downloader_download_speed",
+        "downloader_upload_speed",
+        "downloader_total_downloaded",
+        "downloader_total_uploaded",
+        "downloader_free_space",
+        "is_downloading",
+    ),
+    API_ENDPOINT_TRANSFER_NOW: ("is_transferring", "transfer_data"),
+    API_ENDPOINT_SCHEDULE: ("running_tasks", "pending_tasks", "tasks"),
+    API_ENDPOINT_STORAGE: (
+        "disk_percent",
+        "disk_total_bytes",
+        "disk_used_bytes",
+        "disk_free_bytes",
+    ),
+    API_ENDPOINT_STATISTIC: ("movie_count", "tv_count", "episode_count", "user_count"),
+}
+
+# Fields needed by adaptive polling regardless of the enabled entities
+ADAPTIVE_ACTIVITY_FIELDS: Final = ("is_downloading", "is_transferring", "running_tasks")
+
+UPDATE_GROUP_PRIORITIES: Final = {
+    UPDATE_GROUP_LIVE: REQUEST_PRIORITY_LIVE,
+    UPDATE_GROUP_TASKS: REQUEST_PRIORITY_LIVE,
+    UPDATE_GROUP_STORAGE: REQUEST_PRIORITY_BACKGROUND,
+    UPDATE_GROUP_LIBRARY: REQUEST_PRIORITY_BACKGROUND,
+}
+
+UPDATE_GROUP_INTERVALS: Final = {
+    UPDATE_GROUP_LIVE: UPDATE_INTERVAL_DASHBOARD,
+    UPDATE_GROUP_TASKS: UPDATE_INTERVAL_TASKS,
+    UPDATE_GROUP_STORAGE: UPDATE_INTERVAL_STORAGE,
+    UPDATE_GROUP_LIBRARY: UPDATE_INTERVAL_LIBRARY,
+}
+
 # Sensor types (only used sensors)
 SENSOR_TYPE_CPU: Final = "cpu"
 SENSOR_TYPE_MEMORY: Final = "memory"
@@ -37,6 +256,27 @@ SENSOR_TYPE_DISK_FREE: Final = "disk_free"
 SENSOR_TYPE_DOWNLOADER_SPEED: Final = "downloader_speed"
 SENSOR_TYPE_RUNNING_TASKS: Final = "running_tasks"
 
+# Noisy measurement sensors published through a deadband filter
+# sensor type -> (absolute deadband in native unit, relative deadband in %)
+DEFAULT_DEADBANDS: Final = {
+    SENSOR_TYPE_CPU: (1.0, 0.0),
+    SENSOR_TYPE_MEMORY: (0.5, 0.0),
+    SENSOR_TYPE_DOWNLOADER_SPEED: (0.0, 10.0),
+}
+DEFAULT_MIN_PUBLISH_INTERVAL: Final = 0  # seconds, 0 disables rate limiting
+DEFAULT_HEARTBEAT_INTERVAL: Final = 900  # seconds, 0 disables the heartbeat
+MAX_PUBLISH_INTERVAL: Final = 3600  # seconds
+
+# Rolling-window aggregates: window name -> length in seconds
+AGGREGATE_WINDOWS: Final = {"1m": 60, "5m": 300, "15m": 900}
+AGGREGATE_METRICS: Final = (
+    "cpu_percent",
+    "memory_percent",
+    "network_upload_speed",
+    "network_download_speed",
+    "downloader_download_speed",
+)
+
 # Binary sensor types (only used sensors)
 BINARY_SENSOR_TYPE_ONLINE: Final = "online"
 BINARY_SENSOR_TYPE_TASKS_RUNNING: Final = "tasks_running"
@@ -55,6 +295,7 @@ ATTR_RUNNING_TASKS: Final = "running_tasks"
 ATTR_PENDING_TASKS: Final = "pending_tasks"
 ATTR_LAST_UPDATE: Final = "last_update"
 ATTR_API_VERSION: Final = "api_version"
+ATTR_DATA_AGE: Final = "data_age"
 
 # Icons (only used icons)
 ICON_CPU: Final = "mdi:chip"
@@ -66,6 +307,8 @@ ICON_CLOUD: Final = "mdi:cloud"
 ICON_MOVIE: Final = "mdi:movie"
 ICON_TV: Final = "mdi:television"
 ICON_USER: Final = "mdi:account-multiple"
+ICON_QUEUE: Final = "mdi:timer-sand"
+ICON_WEBHOOK: Final = "mdi:webhook"
 
 # Device information
 MANUFACTURER: Final = "MoviePilot"
@@ -92,6 +335,17 @@ BYTES_TO_KB: Final = 1024
 
 # Coordinator data keys
 DATA_COORDINATOR: Final = "coordinator"
+DATA_COORDINATORS: Final = "coordinators"
+DATA_CAPABILITIES: Final = "capabilities"
+DATA_SCHEDULER: Final = "scheduler"
+DATA_PUSH: Final = "push"
+DATA_WEBHOOK: Final = "webhook"
+DATA_WEBHOOK_SENSORS: Final = "webhook_sensors"  # entry providing the webhook sensors
+
+# Services
+SERVICE_PROBE_CAPABILITIES: Final = "probe_capabilities"
+# homeassistant.const lacks this in the minimum supported version (2024.1)
+ATTR_CONFIG_ENTRY_ID: Final = "config_entry_id"
 DATA_CLIENT: Final = "client"
 
 # Platforms (notification service removed)
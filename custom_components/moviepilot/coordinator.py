@@ -0,0 +1,564 @@
+"""Data update coordinators for the MoviePilot integration."""
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable
+from datetime import datetime, timedelta
+import logging
+import time
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.exceptions import ConfigEntryAuthFailed
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.storage import Store
+from homeassistant.helpers.update_coordinator import DataUpdateCoordinator, UpdateFailed
+from homeassistant.util import dt as dt_util
+
+from .aggregates import MetricAggregator, aggregate_key
+from .api import MoviePilotAPIClient, MoviePilotAPIError, MoviePilotAuthError
+from .const import (
+    ADAPTIVE_ACTIVITY_FIELDS,
+    ADAPTIVE_BACKOFF_FACTOR,
+    ADAPTIVE_IDLE_DELAY,
+    AGGREGATE_METRICS,
+    CONF_ADAPTIVE_POLLING,
+    CONF_SCAN_INTERVAL,
+    CYCLE_DEADLINE_RATIO,
+    DEFAULT_ADAPTIVE_POLLING,
+    DEFAULT_SCAN_INTERVAL,
+    DOMAIN,
+    ENDPOINT_FIELDS,
+    MAX_SCAN_INTERVAL,
+    MIN_SCAN_INTERVAL,
+    PUSH_RECONCILE_INTERVAL,
+    REQUEST_PRIORITY_INTERACTIVE,
+    SNAPSHOT_SAVE_DELAY,
+    SNAPSHOT_STORAGE_VERSION,
+    UPDATE_GROUP_ENDPOINTS,
+    UPDATE_GROUP_INTERVALS,
+    UPDATE_GROUP_LIVE,
+    UPDATE_GROUP_PRIORITIES,
+    UPDATE_GROUP_TASKS,
+    WEBHOOK_REFRESH_DELAY,
+)
+from .models import MoviePilotSnapshot
+
+_LOGGER = logging.getLogger(__name__)
+
+# 聚合传感器依赖的伪字段 -> 实际采样的字段
+_AGGREGATE_SOURCE_FIELDS = {aggregate_key(metric): metric for metric in AGGREGATE_METRICS}
+
+
+class AdaptivePollingController:
+    """根据活动状态调整刷新间隔
+
+    有下载/传输/运行中任务时立即切换到最小间隔；空闲持续
+    ADAPTIVE_IDLE_DELAY 秒后才开始退避，之后每个空闲周期按倍数
+    增大间隔直到最大值，避免在活动边界来回抖动。
+    """
+
+    def __init__(
+        self,
+        base_interval: timedelta,
+        min_interval: timedelta = timedelta(seconds=MIN_SCAN_INTERVAL),
+        max_interval: timedelta = timedelta(seconds=MAX_SCAN_INTERVAL),
+        idle_delay: float = ADAPTIVE_IDLE_DELAY,
+    ) -> None:
+        """Initialize the controller."""
+        self._base_interval = base_interval
+        self._min_interval = min_interval
+        self._max_interval = max_interval
+        self._idle_delay = idle_delay
+        self._idle_since: float | None = None
+        self.interval = base_interval
+
+    def update(self, active: bool, now: float | None = None) -> timedelta:
+        """Record the latest activity state and return the next interval."""
+        if now is None:
+            now = time.monotonic()
+
+        if active:
+            self._idle_since = None
+            self.interval = self._min_interval
+            return self.interval
+
+        if self._idle_since is None:
+            self._idle_since = now
+        elif now - self._idle_since >= self._idle_delay:
+            # 先回到基础间隔，再逐步退避
+            if self.interval < self._base_interval:
+                interval = self._base_interval
+            else:
+                interval = self.interval * ADAPTIVE_BACKOFF_FACTOR
+            self.interval = min(interval, self._max_interval)
+            self._idle_since = now
+
+        return self.interval
+
+
+class MoviePilotDataUpdateCoordinator(DataUpdateCoordinator[MoviePilotSnapshot]):
+    """Class to manage fetching one update group of MoviePilot endpoints.
+
+    每个更新组拥有独立的刷新周期，实体只会收到其所属组的数据回调。
+    本轮失败或超时的端点沿用上一次成功获取的值，并记录每个字段的
+    更新时间，供实体展示数据陈旧程度。实体读取的 data 是由合并后的
+    字段构建的不可变快照。
+
+    实体以依赖的字段集合作为监听 context 注册，刷新后只通知字段值
+    (或陈旧状态) 发生变化的实体；没有 context 的监听者总会被通知。
+    同样根据这些 context 规划需要请求的端点：只被已禁用实体使用的
+    端点 (禁用的实体不会注册监听) 不再请求。
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: MoviePilotAPIClient,
+        group: str,
+        update_interval: timedelta | None = None,
+        adaptive: AdaptivePollingController | None = None,
+        aggregator: MetricAggregator | None = None,
+    ) -> None:
+        """Initialize coordinator."""
+        super().__init__(
+            hass,
+            _LOGGER,
+            name=f"{DOMAIN}_{group}",
+            update_interval=update_interval or UPDATE_GROUP_INTERVALS[group],
+        )
+        self.client = client
+        self.group = group
+        self.endpoints: tuple[str, ...] = UPDATE_GROUP_ENDPOINTS[group]
+        # 与实体无关、但内部逻辑需要的字段 (如自适应轮询的活动状态)
+        self.required_keys: frozenset[str] = frozenset()
+        # 本组实际请求的端点，监听者变化时重新规划
+        self._fetch_plan: tuple[str, ...] | None = None
+        self.adaptive = adaptive
+        # 滚动窗口聚合 (只有包含相关指标的更新组才有)
+        self.aggregator = aggregator
+        # 同一配置条目下的其他更新组 (用于读取任务状态等)
+        self.peers: dict[str, MoviePilotDataUpdateCoordinator] = {}
+        # 合并后的全部字段 (快照的数据来源)
+        self.fields: dict[str, Any] = {}
+        # 每个字段最后一次成功获取的时间
+        self.field_updated: dict[str, datetime] = {}
+        # 本轮未能刷新、沿用旧值的字段
+        self.stale_keys: frozenset[str] = frozenset()
+        # 本轮值发生变化的字段
+        self.changed_keys: frozenset[str] = frozenset()
+        # 需要通知监听者的字段 (值变化或陈旧状态变化)
+        self._dirty_keys: frozenset[str] | None = None
+        self._notified_success: bool | None = None
+        # 推送模式: 事件流连接期间只以较长间隔对账轮询
+        self.push_connected = False
+        self._polling_interval = self.update_interval
+        # 等待定向刷新的端点 (短时间内的多次通知合并为一次请求)
+        self._pending_endpoints: set[str] = set()
+        self._pending_unsub: CALLBACK_TYPE | None = None
+        # 持久化快照 (用于快速启动)
+        self.snapshot_store: MoviePilotSnapshotStore | None = None
+        # 刷新统计 (用于观察省去了多少处理)
+        self.stats: dict[str, int] = {
+            "cycles": 0,
+            "fields_fetched": 0,
+            "fields_changed": 0,
+        }
+
+    async def _async_update_data(self) -> MoviePilotSnapshot:
+        """Fetch data for this group from MoviePilot API."""
+        deadline = self.update_interval.total_seconds() * CYCLE_DEADLINE_RATIO
+        plan = self.fetch_plan
+        try:
+            fields = await self.client.get_overview(
+                plan, deadline=deadline, priority=UPDATE_GROUP_PRIORITIES[self.group]
+            )
+        except MoviePilotAuthError as err:
+            # 令牌失效: 停止轮询并启动重新认证流程
+            raise ConfigEntryAuthFailed(f"Authentication failed: {err}") from err
+        except Exception as err:
+            _LOGGER.error("更新MoviePilot数据失败 [%s]: %s", self.group, err)
+            raise UpdateFailed(f"Error communicating with MoviePilot: {err}") from err
+
+        previous = self.fields
+        now = dt_util.utcnow()
+        for key in fields:
+            self.field_updated[key] = now
+        data = {**previous, **fields}
+        previous_stale = self.stale_keys
+        # 只有计划内端点的字段才算陈旧，未请求端点的字段没有实体使用
+        planned_keys = {key for endpoint in plan for key in ENDPOINT_FIELDS[endpoint]}
+        self.stale_keys = frozenset((data.keys() & planned_keys) - fields.keys())
+        self.changed_keys = frozenset(
+            key
+            for key, value in fields.items()
+            if key not in previous or (previous[key] is not value and previous[key] != value)
+        )
+        # 陈旧字段每轮都通知以更新 data_age，恢复新鲜的字段也需要通知一次
+        self._dirty_keys = self.changed_keys | self.stale_keys | previous_stale
+
+        if self.aggregator is not None:
+            sampled = self._async_add_samples(fields)
+            self._dirty_keys |= sampled
+
+        self.stats["cycles"] += 1
+        self.stats["fields_fetched"] += len(fields)
+        self.stats["fields_changed"] += len(self.changed_keys)
+        _LOGGER.debug(
+            "更新MoviePilot数据成功 [%s]: %d个指标, %d个变化, %d个沿用旧值 "
+            "(累计新建连接 %d, 复用连接 %d)",
+            self.group,
+            len(fields),
+            len(self.changed_keys),
+            len(self.stale_keys),
+            self.client.stats["connections_created"],
+            self.client.stats["connections_reused"],
+        )
+
+        self.fields = data
+        snapshot = MoviePilotSnapshot.from_fields(data, self.data, self.changed_keys)
+
+        if self.adaptive is not None and not self.push_connected:
+            self._async_adjust_interval(snapshot)
+        if self.snapshot_store is not None:
+            self.snapshot_store.async_schedule_save()
+        return snapshot
+
+    @callback
+    def async_push_fields(self, fields: dict[str, Any]) -> None:
+        """Merge fields received from an event stream and notify affected entities.
+
+        不重置轮询计时器，频繁推送时对账轮询仍按时进行。
+        """
+        previous = self.fields
+        changed = frozenset(
+            key for key, value in fields.items() if key not in previous or previous[key] != value
+        )
+        now = dt_util.utcnow()
+        for key in fields:
+            self.field_updated[key] = now
+        if not changed:
+            return
+
+        self.fields = {**previous, **fields}
+        self.stale_keys = self.stale_keys - fields.keys()
+        self.changed_keys = changed
+        self._dirty_keys = changed
+        self.data = MoviePilotSnapshot.from_fields(self.fields, self.data, changed)
+        self.async_update_listeners()
+        if self.snapshot_store is not None:
+            self.snapshot_store.async_schedule_save()
+
+    @callback
+    def async_schedule_endpoint_refresh(self, endpoints: Iterable[str]) -> None:
+        """Refresh only the given endpoints after a short debounce delay.
+
+        用于外部通知 (如 Webhook) 触发的更新：不改变基础轮询频率，
+        只请求受影响的端点并通知相关实体。
+        """
+        endpoints = set(endpoints).intersection(self.endpoints)
+        if not endpoints:
+            return
+        self._pending_endpoints |= endpoints
+        if self._pending_unsub is None:
+            self._pending_unsub = async_call_later(
+                self.hass, WEBHOOK_REFRESH_DELAY, self._async_refresh_pending
+            )
+
+    @callback
+    def _async_refresh_pending(self, _now: datetime) -> None:
+        """Start the debounced targeted refresh."""
+        self._pending_unsub = None
+        endpoints = tuple(self._pending_endpoints)
+        self._pending_endpoints.clear()
+        self.hass.async_create_task(self._async_refresh_endpoints(endpoints))
+
+    async def _async_refresh_endpoints(self, endpoints: tuple[str, ...]) -> None:
+        """Fetch the given endpoints, bypassing the response cache, and merge them."""
+        self.client.invalidate(endpoints)
+        try:
+            fields = await self.client.get_overview(
+                endpoints, priority=REQUEST_PRIORITY_INTERACTIVE
+            )
+        except MoviePilotAPIError as err:
+            # 失败时等待下一次常规轮询
+            _LOGGER.debug("定向刷新失败 [%s] %s: %s", self.group, ", ".join(endpoints), err)
+            return
+        _LOGGER.debug("定向刷新 [%s]: %s", self.group, ", ".join(endpoints))
+        self.async_push_fields(fields)
+
+    async def async_shutdown(self) -> None:
+        """Cancel a pending targeted refresh and stop polling."""
+        if self._pending_unsub is not None:
+            self._pending_unsub()
+            self._pending_unsub = None
+        await super().async_shutdown()
+
+    @callback
+    def async_shift_schedule(self, offset: float) -> None:
+        """Delay the next scheduled refresh once, shifting the refresh phase."""
+        if self.update_interval is None or offset <= 0:
+            return
+        interval = self.update_interval
+        self.update_interval = interval + timedelta(seconds=offset)
+        self._schedule_refresh()
+        # 之后的刷新恢复原间隔，保持新的相位
+        self.update_interval = interval
+
+    @callback
+    def async_set_push_connected(self, connected: bool) -> None:
+        """Switch between push (slow reconciliation) and normal polling."""
+        if connected == self.push_connected:
+            return
+        self.push_connected = connected
+        if connected:
+            self._polling_interval = self.update_interval
+            self.update_interval = PUSH_RECONCILE_INTERVAL
+            _LOGGER.debug("推送模式 [%s]: 事件流已连接，对账间隔 %s", self.group, self.update_interval)
+        else:
+            self.update_interval = self._polling_interval
+            _LOGGER.debug("推送模式 [%s]: 事件流断开，恢复轮询", self.group)
+            # 立即刷新一次，补上断开期间的变化
+            self.hass.async_create_task(self.async_request_refresh())
+
+    @callback
+    def async_restore(self, data: dict[str, Any], updated: dict[str, datetime]) -> None:
+        """Start from persisted data; every restored field is marked stale."""
+        self.fields = data
+        self.data = MoviePilotSnapshot.from_fields(data)
+        self.field_updated = updated
+        self.stale_keys = frozenset(data)
+
+    @property
+    def fetch_plan(self) -> tuple[str, ...]:
+        """Return the endpoints to request in the next refresh."""
+        if self._fetch_plan is None:
+            self._fetch_plan = self._async_build_fetch_plan()
+        return self._fetch_plan
+
+    def _async_build_fetch_plan(self) -> tuple[str, ...]:
+        """Plan the endpoints from the fields declared by the registered listeners."""
+        # 首次刷新时实体尚未注册监听，请求全部端点
+        if not self._listeners:
+            return self.endpoints
+
+        demanded = set(self.required_keys)
+        for _, context in self._listeners.values():
+            if context:
+                demanded.update(_AGGREGATE_SOURCE_FIELDS.get(key, key) for key in context)
+
+        plan = tuple(
+            endpoint
+            for endpoint in self.endpoints
+            if not demanded.isdisjoint(ENDPOINT_FIELDS[endpoint])
+        )
+        # 没有实体依赖具体字段时 (如只有在线状态) 仍请求一个端点以检测连通性
+        plan = plan or self.endpoints[:1]
+
+        if plan != self.endpoints:
+            _LOGGER.debug(
+                "请求计划 [%s]: 跳过无实体使用的端点 %s",
+                self.group,
+                ", ".join(sorted(set(self.endpoints) - set(plan))),
+            )
+        return plan
+
+    @callback
+    def async_set_unsupported_endpoints(self, unsupported: frozenset[str]) -> None:
+        """Stop requesting endpoints this MoviePilot version does not provide."""
+        endpoints = tuple(
+            endpoint
+            for endpoint in UPDATE_GROUP_ENDPOINTS[self.group]
+            if endpoint not in unsupported
+        )
+        if endpoints != self.endpoints:
+            self.endpoints = endpoints
+            self._fetch_plan = None
+
+    @callback
+    def async_add_listener(
+        self, update_callback: CALLBACK_TYPE, context: Any = None
+    ) -> Callable[[], None]:
+        """Listen for data updates and replan the endpoints to fetch."""
+        remove_listener = super().async_add_listener(update_callback, context)
+        self._fetch_plan = None
+
+        @callback
+        def async_remove_listener() -> None:
+            """Remove the listener and replan the endpoints to fetch."""
+            remove_listener()
+            self._fetch_plan = None
+
+        return async_remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify only the listeners whose fields changed."""
+        dirty = self._dirty_keys
+        self._dirty_keys = None
+        # 可用性变化或没有变化信息时通知全部监听者
+        if dirty is None or self.last_update_success != self._notified_success:
+            self._notified_success = self.last_update_success
+            super().async_update_listeners()
+            return
+
+        for update_callback, context in list(self._listeners.values()):
+            if context is None or not dirty.isdisjoint(context):
+                update_callback()
+
+    def data_age(self, keys: Iterable[str]) -> int | None:
+        """Return the age in seconds of the oldest stale field among keys.
+
+        Returns None when every field was refreshed in the latest cycle.
+        """
+        updated = [
+            self.field_updated[key]
+            for key in keys
+            if key in self.stale_keys and key in self.field_updated
+        ]
+        if not updated:
+            return None
+        return int((dt_util.utcnow() - min(updated)).total_seconds())
+
+    def _async_add_samples(self, fields: dict[str, Any]) -> frozenset[str]:
+        """Feed freshly fetched metrics into the rolling windows.
+
+        Returns the aggregate keys whose windows received a sample.
+        """
+        now = time.monotonic()
+        sampled = []
+        for metric in self.aggregator.metrics:
+            value = fields.get(metric)
+            if isinstance(value, (int, float)):
+                self.aggregator.add(metric, float(value), now)
+                sampled.append(aggregate_key(metric))
+        return frozenset(sampled)
+
+    def _is_active(self, data: MoviePilotSnapshot) -> bool:
+        """Return True if MoviePilot is downloading, transferring or running tasks."""
+        if data.downloader.is_downloading or data.downloader.is_transferring:
+            return True
+        tasks_coordinator = self.peers.get(UPDATE_GROUP_TASKS)
+        if tasks_coordinator is not None and tasks_coordinator.data is not None:
+            return (tasks_coordinator.data.tasks.running_tasks or 0) > 0
+        return False
+
+    def _async_adjust_interval(self, data: MoviePilotSnapshot) -> None:
+        """Apply the adaptive interval for the next refresh."""
+        interval = self.adaptive.update(self._is_active(data))
+        if interval != self.update_interval:
+            _LOGGER.debug(
+                "自适应轮询 [%s]: 刷新间隔调整为 %ss",
+                self.group,
+                interval.total_seconds(),
+            )
+            self.update_interval = interval
+
+
+class MoviePilotSnapshotStore:
+    """Persist the latest coordinator data so entities can start from it."""
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        entry_id: str,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+    ) -> None:
+        """Initialize the snapshot store."""
+        self._store: Store[dict[str, Any]] = Store(
+            hass, SNAPSHOT_STORAGE_VERSION, f"{DOMAIN}.{entry_id}.snapshot"
+        )
+        self._coordinators = coordinators
+        for coordinator in coordinators.values():
+            coordinator.snapshot_store = self
+
+    async def async_restore(self) -> bool:
+        """Restore the persisted data into the coordinators.
+
+        快照中缺少的更新组 (如唯一端点不受支持，或尚未成功刷新过) 以
+        空数据开始，等待后台首次刷新，实体不会读到 None。
+
+        Returns:
+            True 表示至少恢复了一个更新组的数据
+        """
+        stored = await self._store.async_load()
+        if not stored:
+            return False
+
+        missing = []
+        for group, coordinator in self._coordinators.items():
+            group_data = stored.get(group)
+            if not group_data or not group_data.get("data"):
+                missing.append(coordinator)
+                continue
+            updated = {
+                key: parsed
+                for key, value in group_data.get("updated", {}).items()
+                if (parsed := dt_util.parse_datetime(value)) is not None
+            }
+            coordinator.async_restore(group_data["data"], updated)
+
+        if len(missing) == len(self._coordinators):
+            return False
+        for coordinator in missing:
+            coordinator.async_restore({}, {})
+        return True
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule a delayed write of the latest data."""
+        self._store.async_delay_save(self._data_to_save, SNAPSHOT_SAVE_DELAY)
+
+    async def async_remove(self) -> None:
+        """Remove the persisted snapshot."""
+        await self._store.async_remove()
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of all coordinators."""
+        return {
+            group: {
+                "data": coordinator.fields,
+                "updated": {
+                    key: value.isoformat()
+                    for key, value in coordinator.field_updated.items()
+                },
+            }
+            for group, coordinator in self._coordinators.items()
+            if coordinator.fields
+        }
+
+
+def async_create_coordinators(
+    hass: HomeAssistant,
+    client: MoviePilotAPIClient,
+    entry: ConfigEntry,
+) -> dict[str, MoviePilotDataUpdateCoordinator]:
+    """Create one coordinator per update group."""
+    live_interval = timedelta(
+        seconds=entry.options.get(CONF_SCAN_INTERVAL, DEFAULT_SCAN_INTERVAL)
+    )
+    adaptive = None
+    if entry.options.get(CONF_ADAPTIVE_POLLING, DEFAULT_ADAPTIVE_POLLING):
+        adaptive = AdaptivePollingController(live_interval)
+
+    coordinators = {
+        group: MoviePilotDataUpdateCoordinator(hass, client, group)
+        for group in UPDATE_GROUP_ENDPOINTS
+        if group != UPDATE_GROUP_LIVE
+    }
+    coordinators[UPDATE_GROUP_LIVE] = MoviePilotDataUpdateCoordinator(
+        hass,
+        client,
+        UPDATE_GROUP_LIVE,
+        update_interval=live_interval,
+        adaptive=adaptive,
+        aggregator=MetricAggregator(AGGREGATE_METRICS),
+    )
+
+    for coordinator in coordinators.values():
+        coordinator.peers = coordinators
+        if adaptive is not None:
+            # 自适应轮询需要活动状态，即使相关实体都被禁用
+            coordinator.required_keys = frozenset(ADAPTIVE_ACTIVITY_FIELDS)
+    return coordinators
@@ -0,0 +1,215 @@
+"""Typed snapshot of the data reported by MoviePilot.
+
+coordinator 内部仍按字段合并数据 (用于变化检测、沿用旧值和持久化)，
+每轮刷新后构建一个不可变快照供实体读取；派生值 (GB换算、运行中
+任务名称) 在构建时计算一次，字段没有变化的记录直接复用上一次的对象。
+"""
+from __future__ import annotations
+
+from collections.abc import Mapping, Set
+from dataclasses import dataclass
+from typing import Any, ClassVar
+
+from .const import BYTES_TO_GB, STATUS_RUNNING
+
+
+def _to_gb(value: float | None) -> float:
+    """Convert bytes to GB rounded to two decimals."""
+    return round(value / BYTES_TO_GB, 2) if value else 0
+
+
+@dataclass(frozen=True, slots=True)
+class SystemRecord:
+    """CPU, memory, storage and network metrics."""
+
+    KEYS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "cpu_percent",
+            "memory_percent",
+            "memory_used_bytes",
+            "disk_percent",
+            "disk_total_bytes",
+            "disk_used_bytes",
+            "disk_free_bytes",
+            "network_upload_speed",
+            "network_download_speed",
+        }
+    )
+
+    cpu_percent: float | None = None
+    memory_percent: float | None = None
+    memory_used_bytes: int | None = None
+    memory_used_gb: float = 0
+    disk_percent: float | None = None
+    disk_total_bytes: int | None = None
+    disk_used_bytes: int | None = None
+    disk_free_bytes: int | None = None
+    disk_total_gb: float = 0
+    disk_used_gb: float = 0
+    disk_free_gb: float = 0
+    network_upload_speed: float | None = None
+    network_download_speed: float | None = None
+
+    @classmethod
+    def from_fields(cls, fields: Mapping[str, Any]) -> SystemRecord:
+        """Build the record from overview fields."""
+        get = fields.get
+        return cls(
+            cpu_percent=get("cpu_percent"),
+            memory_percent=get("memory_percent"),
+            memory_used_bytes=get("memory_used_bytes"),
+            memory_used_gb=_to_gb(get("memory_used_bytes")),
+            disk_percent=get("disk_percent"),
+            disk_total_bytes=get("disk_total_bytes"),
+            disk_used_bytes=get("disk_used_bytes"),
+            disk_free_bytes=get("disk_free_bytes"),
+            disk_total_gb=_to_gb(get("disk_total_bytes")),
+            disk_used_gb=_to_gb(get("disk_used_bytes")),
+            disk_free_gb=_to_gb(get("disk_free_bytes")),
+            network_upload_speed=get("network_upload_speed"),
+            network_download_speed=get("network_download_speed"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class LibraryRecord:
+    """Media library statistics."""
+
+    KEYS: ClassVar[frozenset[str]] = frozenset(
+        {"movie_count", "tv_count", "episode_count", "user_count"}
+    )
+
+    movie_count: int | None = None
+    tv_count: int | None = None
+    episode_count: int | None = None
+    user_count: int | None = None
+
+    @classmethod
+    def from_fields(cls, fields: Mapping[str, Any]) -> LibraryRecord:
+        """Build the record from overview fields."""
+        get = fields.get
+        return cls(
+            movie_count=get("movie_count"),
+            tv_count=get("tv_count"),
+            episode_count=get("episode_count"),
+            user_count=get("user_count"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class DownloaderRecord:
+    """Downloader speeds and transfer state."""
+
+    KEYS: ClassVar[frozenset[str]] = frozenset(
+        {
+            "downloader_download_speed",
+            "downloader_upload_speed",
+            "downloader_total_downloaded",
+            "downloader_total_uploaded",
+            "downloader_free_space",
+            "is_downloading",
+            "is_transferring",
+            "transfer_data",
+            "transfer_progress",
+        }
+    )
+
+    download_speed: float | None = None
+    upload_speed: float | None = None
+    total_downloaded: int | None = None
+    total_downloaded_gb: float = 0
+    total_uploaded: int | None = None
+    free_space: int | None = None
+    is_downloading: bool = False
+    is_transferring: bool = False
+    transfer_data: Any = None
+    transfer_progress: float | None = None
+
+    @classmethod
+    def from_fields(cls, fields: Mapping[str, Any]) -> DownloaderRecord:
+        """Build the record from overview fields."""
+        get = fields.get
+        return cls(
+            download_speed=get("downloader_download_speed"),
+            upload_speed=get("downloader_upload_speed"),
+            total_downloaded=get("downloader_total_downloaded"),
+            total_downloaded_gb=_to_gb(get("downloader_total_downloaded")),
+            total_uploaded=get("downloader_total_uploaded"),
+            free_space=get("downloader_free_space"),
+            is_downloading=bool(get("is_downloading")),
+            is_transferring=bool(get("is_transferring")),
+            transfer_data=get("transfer_data"),
+            transfer_progress=get("transfer_progress"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class TasksRecord:
+    """Scheduler task counts."""
+
+    KEYS: ClassVar[frozenset[str]] = frozenset(
+        {"running_tasks", "pending_tasks", "tasks"}
+    )
+
+    running_tasks: int | None = None
+    pending_tasks: int | None = None
+    tasks: tuple[Any, ...] = ()
+    running_task_names: tuple[str | None, ...] = ()
+
+    @classmethod
+    def from_fields(cls, fields: Mapping[str, Any]) -> TasksRecord:
+        """Build the record from overview fields."""
+        tasks = tuple(fields.get("tasks") or ())
+        return cls(
+            running_tasks=fields.get("running_tasks"),
+            pending_tasks=fields.get("pending_tasks"),
+            tasks=tasks,
+            running_task_names=tuple(
+                task.get("name")
+                for task in tasks
+                if isinstance(task, dict) and task.get("status") == STATUS_RUNNING
+            ),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class MoviePilotSnapshot:
+    """Immutable view of one update group's data."""
+
+    system: SystemRecord = SystemRecord()
+    library: LibraryRecord = LibraryRecord()
+    downloader: DownloaderRecord = DownloaderRecord()
+    tasks: TasksRecord = TasksRecord()
+
+    @classmethod
+    def from_fields(
+        cls,
+        fields: Mapping[str, Any],
+        previous: MoviePilotSnapshot | None = None,
+        changed: Set[str] | None = None,
+    ) -> MoviePilotSnapshot:
+        """Build a snapshot, reusing records of previous whose keys did not change.
+
+        Args:
+            fields: 合并后的全部字段
+            previous: 上一次的快照
+            changed: 值发生变化的字段，为None时重建全部记录
+        """
+
+        def build(record: Any, record_cls: Any) -> Any:
+            if previous is not None and changed is not None and record_cls.KEYS.isdisjoint(changed):
+                return record
+            if record_cls.KEYS.isdisjoint(fields):
+                return record_cls()
+            return record_cls.from_fields(fields)
+
+        base = previous or _EMPTY_SNAPSHOT
+        return cls(
+            system=build(base.system, SystemRecord),
+            library=build(base.library, LibraryRecord),
+            downloader=build(base.downloader, DownloaderRecord),
+            tasks=build(base.tasks, TasksRecord),
+        )
+
+
+_EMPTY_SNAPSHOT = MoviePilotSnapshot()
@@ -0,0 +1,165 @@
+"""Push mode: follow MoviePilot server-sent event streams."""
+from __future__ import annotations
+
+import asyncio
+from collections.abc import Callable
+import logging
+import random
+from typing import Any
+
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant, callback
+
+from .api import (
+    MoviePilotAPIClient,
+    MoviePilotAPIError,
+    MoviePilotAuthError,
+    MoviePilotEndpointNotFoundError,
+    ServerSentEvent,
+    json_loads,
+)
+from .const import (
+    API_ENDPOINT_MESSAGE_STREAM,
+    API_ENDPOINT_TRANSFER_PROGRESS_STREAM,
+    CIRCUIT_JITTER,
+    PUSH_RECONNECT_BASE_DELAY,
+    PUSH_RECONNECT_MAX_DELAY,
+)
+from .coordinator import MoviePilotDataUpdateCoordinator
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class MoviePilotPushListener:
+    """Keep MoviePilot event streams open and feed them into the live coordinator.
+
+    消息流中的每条通知都会触发一次 (防抖的) 实时数据刷新，整理进度流
+    直接更新传输状态字段。消息流连接期间实时指标降为对账轮询；断线后
+    按带抖动的指数退避重连，并携带 Last-Event-ID 续传。
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: MoviePilotAPIClient,
+        coordinator: MoviePilotDataUpdateCoordinator,
+    ) -> None:
+        """Initialize the listener."""
+        self._hass = hass
+        self._client = client
+        self._coordinator = coordinator
+        self._tasks: list[asyncio.Task[None]] = []
+        # 推送统计
+        self.stats: dict[str, int] = {
+            "connects": 0,
+            "events": 0,
+        }
+
+    @callback
+    def async_start(self, entry: ConfigEntry) -> None:
+        """Start following the event streams until the entry is unloaded."""
+        streams: dict[str, Callable[[ServerSentEvent], None]] = {
+            API_ENDPOINT_MESSAGE_STREAM: self._async_handle_message,
+            API_ENDPOINT_TRANSFER_PROGRESS_STREAM: self._async_handle_transfer_progress,
+        }
+        for endpoint, handler in streams.items():
+            self._tasks.append(
+                entry.async_create_background_task(
+                    self._hass,
+                    self._async_follow(endpoint, handler),
+                    f"moviepilot_push_{endpoint}",
+                )
+            )
+
+    @callback
+    def async_stop(self) -> None:
+        """Close the event streams before the client is closed."""
+        for task in self._tasks:
+            task.cancel()
+        self._tasks.clear()
+
+    async def _async_follow(
+        self,
+        endpoint: str,
+        handler: Callable[[ServerSentEvent], None],
+    ) -> None:
+        """Follow one event stream, reconnecting with backoff."""
+        is_primary = endpoint == API_ENDPOINT_MESSAGE_STREAM
+        last_event_id: str | None = None
+        base_delay: float = PUSH_RECONNECT_BASE_DELAY
+        attempt = 0
+
+        @callback
+        def _async_on_open() -> None:
+            nonlocal attempt
+            attempt = 0
+            self.stats["connects"] += 1
+            if is_primary:
+                self._coordinator.async_set_push_connected(True)
+
+        while True:
+            try:
+                async for event in self._client.stream_events(
+                    endpoint, last_event_id, on_open=_async_on_open
+                ):
+                    self.stats["events"] += 1
+                    if event.id is not None:
+                        last_event_id = event.id
+                    if event.retry is not None:
+                        # 服务器建议的重连间隔
+                        base_delay = event.retry / 1000
+                    handler(event)
+            except MoviePilotEndpointNotFoundError:
+                _LOGGER.info("MoviePilot 不支持事件流 %s，继续使用轮询", endpoint)
+                return
+            except MoviePilotAuthError as err:
+                # 重新认证由轮询的 coordinator 触发
+                _LOGGER.warning("事件流认证失败 %s: %s", endpoint, err)
+                if is_primary:
+                    self._coordinator.async_set_push_connected(False)
+                return
+            except MoviePilotAPIError as err:
+                _LOGGER.debug("事件流中断 %s: %s", endpoint, err)
+
+            if is_primary:
+                self._coordinator.async_set_push_connected(False)
+
+            delay = min(PUSH_RECONNECT_MAX_DELAY, base_delay * 2**attempt)
+            delay *= 1 + random.uniform(-CIRCUIT_JITTER, CIRCUIT_JITTER)
+            attempt += 1
+            _LOGGER.debug("%.1f秒后重连事件流 %s", delay, endpoint)
+            await asyncio.sleep(delay)
+
+    @callback
+    def _async_handle_message(self, event: ServerSentEvent) -> None:
+        """Refresh the live data when MoviePilot reports something."""
+        if not event.data.strip():
+            return
+        self._hass.async_create_task(self._coordinator.async_request_refresh())
+
+    @callback
+    def _async_handle_transfer_progress(self, event: ServerSentEvent) -> None:
+        """Apply a file transfer progress update."""
+        progress = _decode_json(event.data)
+        if not isinstance(progress, dict):
+            return
+        enabled = bool(progress.get("enable"))
+        value = progress.get("value")
+        self._coordinator.async_push_fields(
+            {
+                "is_transferring": enabled,
+                "transfer_progress": (
+                    round(float(value), 1)
+                    if enabled and isinstance(value, (int, float))
+                    else None
+                ),
+            }
+        )
+
+
+def _decode_json(data: str) -> Any:
+    """Decode the JSON payload of an event, returning None if it is not JSON."""
+    try:
+        return json_loads(data)
+    except ValueError:
+        return None
@@ -0,0 +1,161 @@
+"""Routing rules that fan webhook notifications out to specific events."""
+from __future__ import annotations
+
+from collections.abc import Iterable, Mapping
+from dataclasses import dataclass
+import re
+from typing import Any
+
+import voluptuous as vol
+
+from homeassistant.exceptions import HomeAssistantError
+import homeassistant.helpers.config_validation as cv
+from homeassistant.util.yaml import parse_yaml
+
+from .const import DOMAIN, WEBHOOK_NOTIFICATION_TYPES
+
+CONF_EVENT = "event"
+CONF_TYPE = "type"
+CONF_TITLE = "title"
+CONF_MESSAGE = "message"
+CONF_TITLE_REGEX = "title_regex"
+CONF_MESSAGE_REGEX = "message_regex"
+CONF_EXTRA = "extra"
+
+# 接收器自身触发的 moviepilot_notification / moviepilot_notifications_batch
+RESERVED_EVENTS = frozenset({"notification", "notifications_batch"})
+
+
+def _regex(value: Any) -> re.Pattern[str]:
+    """Compile a regular expression, raising vol.Invalid if it is malformed."""
+    try:
+        return re.compile(cv.string(value))
+    except re.error as err:
+        raise vol.Invalid(f"Invalid regular expression: {err}") from err
+
+
+ROUTE_SCHEMA = vol.Schema(
+    {
+        vol.Required(CONF_EVENT): vol.All(
+            cv.string,
+            vol.Match(r"^[a-z0-9_]+$"),
+            vol.NotIn(RESERVED_EVENTS, msg="Event name is reserved by the integration"),
+        ),
+        vol.Optional(CONF_TYPE): vol.All(
+            cv.ensure_list, [vol.In(WEBHOOK_NOTIFICATION_TYPES)]
+        ),
+        vol.Optional(CONF_TITLE): cv.string,
+        vol.Optional(CONF_MESSAGE): cv.string,
+        vol.Optional(CONF_TITLE_REGEX): _regex,
+        vol.Optional(CONF_MESSAGE_REGEX): _regex,
+        vol.Optional(CONF_EXTRA): {cv.string: vol.Any(str, int, float, bool)},
+    }
+)
+ROUTES_SCHEMA = vol.All(cv.ensure_list, [ROUTE_SCHEMA])
+
+_MISSING = object()
+
+
+@dataclass(frozen=True, slots=True)
+class RoutingRule:
+    """One compiled routing rule."""
+
+    event_type: str
+    types: frozenset[str] | None = None
+    title: str | None = None
+    message: str | None = None
+    title_pattern: re.Pattern[str] | None = None
+    message_pattern: re.Pattern[str] | None = None
+    # (字段路径, 期望值的字符串形式)，路径按 "." 拆分以匹配嵌套字段
+    extra: tuple[tuple[tuple[str, ...], str], ...] = ()
+
+    @classmethod
+    def from_config(cls, config: Mapping[str, Any]) -> RoutingRule:
+        """Build the rule from a validated configuration."""
+        types = config.get(CONF_TYPE)
+        return cls(
+            event_type=f"{DOMAIN}_{config[CONF_EVENT]}",
+            types=frozenset(types) if types else None,
+            title=config.get(CONF_TITLE),
+            message=config.get(CONF_MESSAGE),
+            title_pattern=config.get(CONF_TITLE_REGEX),
+            message_pattern=config.get(CONF_MESSAGE_REGEX),
+            extra=tuple(
+                (tuple(key.split(".")), str(value))
+                for key, value in config.get(CONF_EXTRA, {}).items()
+            ),
+        )
+
+    def matches(self, event_data: Mapping[str, Any]) -> bool:
+        """Return True if a notification satisfies every condition of the rule."""
+        # 先比较开销小的子串条件，再执行正则
+        title: str = event_data["title"]
+        message: str = event_data["message"]
+        if self.title is not None and self.title not in title:
+            return False
+        if self.message is not None and self.message not in message:
+            return False
+        if self.title_pattern is not None and not self.title_pattern.search(title):
+            return False
+        if self.message_pattern is not None and not self.message_pattern.search(message):
+            return False
+
+        if self.extra:
+            extra = event_data.get("extra") or {}
+            for path, expected in self.extra:
+                value: Any = extra
+                for key in path:
+                    value = value.get(key, _MISSING) if isinstance(value, Mapping) else _MISSING
+                if value is _MISSING or str(value) != expected:
+                    return False
+        return True
+
+
+class NotificationRouter:
+    """Match notifications against routing rules indexed by notification type.
+
+    规则在配置时编译一次：按通知类型分桶，每个桶包含适用于该类型的规则
+    (含不限类型的规则) 并保持配置顺序，匹配时只检查对应的桶。所有匹配
+    规则的事件都会触发，同名事件只触发一次。
+    """
+
+    def __init__(self, rules: Iterable[RoutingRule] = ()) -> None:
+        """Initialize the router."""
+        self.rules = rules = tuple(rules)
+        self._buckets: dict[str, tuple[RoutingRule, ...]] = {
+            notification_type: tuple(
+                rule
+                for rule in rules
+                if rule.types is None or notification_type in rule.types
+            )
+            for notification_type in WEBHOOK_NOTIFICATION_TYPES
+        }
+
+    def __len__(self) -> int:
+        """Return the number of rules."""
+        return len(self.rules)
+
+    def route(self, event_data: Mapping[str, Any]) -> list[str]:
+        """Return the event types a notification is routed to."""
+        events: list[str] = []
+        for rule in self._buckets.get(event_data["type"], ()):
+            if rule.event_type not in events and rule.matches(event_data):
+                events.append(rule.event_type)
+        return events
+
+
+def compile_routes(text: str | None) -> NotificationRouter:
+    """Parse, validate and compile YAML routing rules.
+
+    Raises:
+        vol.Invalid: 规则不是有效的YAML或不符合格式
+    """
+    if not text or not text.strip():
+        return NotificationRouter()
+    try:
+        config = parse_yaml(text)
+    except HomeAssistantError as err:
+        raise vol.Invalid(f"Invalid YAML: {err}") from err
+    return NotificationRouter(
+        RoutingRule.from_config(route) for route in ROUTES_SCHEMA(config)
+    )
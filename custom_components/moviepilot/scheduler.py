@@ -0,0 +1,63 @@
+"""Integration-wide scheduling shared by all MoviePilot config entries."""
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+import hashlib
+import random
+
+from homeassistant.core import HomeAssistant
+
+from .const import (
+    DATA_SCHEDULER,
+    DOMAIN,
+    SCHEDULER_MAX_INFLIGHT,
+    STAGGER_JITTER,
+    STAGGER_MAX_OFFSET,
+)
+
+
+class MoviePilotScheduler:
+    """Spread refreshes of several config entries and cap their requests.
+
+    每个配置条目根据 entry_id 的哈希得到固定的相位 (0~1)，各更新组
+    的首次刷新按该相位在刷新间隔内错开，再叠加少量随机抖动；之后的
+    刷新以首次刷新为基准周期进行，因此各实例的请求不会同时爆发。
+    没有快照的冷启动必须阻塞完成首次刷新，改为推迟其后的下一次刷新。
+    所有条目的客户端共享同一个信号量，限制同时进行的HTTP请求数。
+    """
+
+    def __init__(
+        self,
+        max_inflight: int = SCHEDULER_MAX_INFLIGHT,
+        max_offset: float = STAGGER_MAX_OFFSET,
+        jitter: float = STAGGER_JITTER,
+    ) -> None:
+        """Initialize the scheduler."""
+        self.request_limiter = asyncio.Semaphore(max_inflight)
+        self._max_offset = max_offset
+        self._jitter = jitter
+
+    @staticmethod
+    def phase(entry_id: str) -> float:
+        """Return the deterministic phase (0 <= phase < 1) of a config entry."""
+        digest = hashlib.blake2b(entry_id.encode(), digest_size=8).digest()
+        return int.from_bytes(digest, "big") / 2**64
+
+    def offset(self, entry_id: str, interval: timedelta) -> float:
+        """Return the delay in seconds before the first refresh of a group.
+
+        偏移 (含抖动) 始终小于刷新间隔，超出窗口的部分回绕到窗口开头。
+        """
+        window = min(interval.total_seconds(), self._max_offset)
+        if window <= 0:
+            return 0.0
+        return (self.phase(entry_id) * window + random.uniform(0, self._jitter)) % window
+
+
+def async_get_scheduler(hass: HomeAssistant) -> MoviePilotScheduler:
+    """Return the scheduler shared by all config entries, creating it if needed."""
+    domain_data = hass.data.setdefault(DOMAIN, {})
+    if (scheduler := domain_data.get(DATA_SCHEDULER)) is None:
+        scheduler = domain_data[DATA_SCHEDULER] = MoviePilotScheduler()
+    return scheduler
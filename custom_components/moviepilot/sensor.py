@@ -1,8 +1,10 @@
 """MoviePilot sensor platform."""
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+from abc import abstractmethod
+from datetime import datetime
 import logging
+import time
 from typing import Any
 
 from homeassistant.components.sensor import (
@@ -15,18 +17,21 @@ from homeassistant.const import (
     PERCENTAGE,
     UnitOfDataRate,
     UnitOfInformation,
+    UnitOfTime,
 )
-from homeassistant.core import HomeAssistant
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.device_registry import DeviceEntryType
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import EntityCategory
 from homeassistant.helpers.entity_platform import AddEntitiesCallback
-from homeassistant.helpers.update_coordinator import (
-    CoordinatorEntity,
-    DataUpdateCoordinator,
-    UpdateFailed,
-)
+from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.update_coordinator import CoordinatorEntity
 
-from .api import MoviePilotAPIClient
+from .aggregates import aggregate_key
 from .const import (
+    AGGREGATE_METRICS,
+    AGGREGATE_WINDOWS,
+    ATTR_DATA_AGE,
     ATTR_EPISODE_COUNT,
     ATTR_FREE_STORAGE,
     ATTR_MOVIE_COUNT,
@@ -36,8 +41,16 @@ from .const import (
     ATTR_TV_COUNT,
     ATTR_USER_COUNT,
     ATTR_USED_STORAGE,
-    BYTES_TO_GB,
-    DATA_CLIENT,
+    CONF_DEADBAND_ABSOLUTE,
+    CONF_DEADBAND_RELATIVE,
+    CONF_HEARTBEAT_INTERVAL,
+    CONF_MIN_PUBLISH_INTERVAL,
+    DATA_COORDINATORS,
+    DATA_WEBHOOK,
+    DATA_WEBHOOK_SENSORS,
+    DEFAULT_DEADBANDS,
+    DEFAULT_HEARTBEAT_INTERVAL,
+    DEFAULT_MIN_PUBLISH_INTERVAL,
     DOMAIN,
     ICON_CLOUD,
     ICON_CPU,
@@ -45,15 +58,61 @@ from .const import (
     ICON_DOWNLOAD,
     ICON_MEMORY,
     ICON_MOVIE,
+    ICON_QUEUE,
     ICON_TASK,
     ICON_TV,
     ICON_USER,
+    ICON_WEBHOOK,
+    SENSOR_TYPE_CPU,
+    SENSOR_TYPE_DOWNLOADER_SPEED,
+    SENSOR_TYPE_MEMORY,
+    SIGNAL_WEBHOOK_SENSORS_RELEASED,
+    SIGNAL_WEBHOOK_UPDATED,
+    UPDATE_GROUP_LIBRARY,
+    UPDATE_GROUP_LIVE,
+    UPDATE_GROUP_STORAGE,
+    UPDATE_GROUP_TASKS,
 )
+from .coordinator import MoviePilotDataUpdateCoordinator
+from .webhook import MoviePilotWebhookView
 
 _LOGGER = logging.getLogger(__name__)
 
-# 更新间隔
-SCAN_INTERVAL = timedelta(seconds=30)
+# Webhook 限流计数 -> 名称
+WEBHOOK_REQUEST_SENSOR_NAMES: dict[str, str] = {
+    "accepted": "Webhook已接受请求",
+    "throttled": "Webhook限流请求",
+}
+
+# 聚合指标 -> (名称, 图标, 单位, 设备类别)
+AGGREGATE_SENSOR_INFO: dict[str, tuple[str, str, str, SensorDeviceClass | None]] = {
+    "cpu_percent": ("CPU使用率", ICON_CPU, PERCENTAGE, None),
+    "memory_percent": ("内存使用率", ICON_MEMORY, PERCENTAGE, None),
+    "network_upload_speed": (
+        "网络上传速度",
+        ICON_CLOUD,
+        UnitOfDataRate.BYTES_PER_SECOND,
+        SensorDeviceClass.DATA_RATE,
+    ),
+    "network_download_speed": (
+        "网络下载速度",
+        ICON_CLOUD,
+        UnitOfDataRate.BYTES_PER_SECOND,
+        SensorDeviceClass.DATA_RATE,
+    ),
+    "downloader_download_speed": (
+        "下载速度",
+        ICON_DOWNLOAD,
+        UnitOfDataRate.BYTES_PER_SECOND,
+        SensorDeviceClass.DATA_RATE,
+    ),
+}
+
+AGGREGATE_WINDOW_NAMES: dict[str, str] = {
+    "1m": "1分钟",
+    "5m": "5分钟",
+    "15m": "15分钟",
+}
 
 
 async def async_setup_entry(
@@ -62,71 +121,89 @@ async def async_setup_entry(
     async_add_entities: AddEntitiesCallback,
 ) -> None:
     """Set up MoviePilot sensors from a config entry."""
-    # 获取已创建的coordinator（在__init__.py中创建）
-    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    # 获取已创建的coordinator（在__init__.py中按更新组创建）
+    coordinators = hass.data[DOMAIN][entry.entry_id][DATA_COORDINATORS]
 
     # 创建所有传感器（不包含消息通知传感器）
     sensors: list[SensorEntity] = [
         # 系统监控传感器 (4个)
-        MoviePilotCPUSensor(coordinator, entry),
-        MoviePilotMemorySensor(coordinator, entry),
-        MoviePilotDiskSensor(coordinator, entry),
-        MoviePilotDiskFreeSensor(coordinator, entry),
+        MoviePilotCPUSensor(coordinators, entry),
+        MoviePilotMemorySensor(coordinators, entry),
+        MoviePilotDiskSensor(coordinators, entry),
+        MoviePilotDiskFreeSensor(coordinators, entry),
         # 下载器传感器 (1个)
-        MoviePilotDownloaderSpeedSensor(coordinator, entry),
+        MoviePilotDownloaderSpeedSensor(coordinators, entry),
         # 任务传感器 (1个)
-        MoviePilotRunningTasksSensor(coordinator, entry),
+        MoviePilotRunningTasksSensor(coordinators, entry),
         # 媒体统计传感器 (4个)
-        MoviePilotMovieCountSensor(coordinator, entry),
-        MoviePilotTVCountSensor(coordinator, entry),
-        MoviePilotEpisodeCountSensor(coordinator, entry),
-        MoviePilotUserCountSensor(coordinator, entry),
+        MoviePilotMovieCountSensor(coordinators, entry),
+        MoviePilotTVCountSensor(coordinators, entry),
+        MoviePilotEpisodeCountSensor(coordinators, entry),
+        MoviePilotUserCountSensor(coordinators, entry),
     ]
 
-    async_add_entities(sensors)
+    # 请求排队时间 (诊断)
+    sensors.append(MoviePilotRequestWaitSensor(coordinators, entry))
 
+    # 滚动窗口聚合传感器 (默认禁用，按需启用)
+    sensors.extend(
+        MoviePilotAggregateSensor(coordinators, entry, metric, window)
+        for metric in AGGREGATE_METRICS
+        for window in AGGREGATE_WINDOWS
+    )
 
-class MoviePilotDataUpdateCoordinator(DataUpdateCoordinator[dict[str, Any]]):
-    """Class to manage fetching MoviePilot data."""
+    async_add_entities(sensors)
 
-    def __init__(
-        self,
-        hass: HomeAssistant,
-        client: MoviePilotAPIClient,
-    ) -> None:
-        """Initialize coordinator."""
-        super().__init__(
-            hass,
-            _LOGGER,
-            name=DOMAIN,
-            update_interval=SCAN_INTERVAL,
+    @callback
+    def _async_add_webhook_sensors() -> None:
+        """Provide the webhook sensors if no other entry does."""
+        domain_data = hass.data[DOMAIN]
+        # 正在卸载的条目不再接管
+        if DATA_WEBHOOK_SENSORS in domain_data or entry.entry_id not in domain_data:
+            return
+        if (webhook := domain_data.get(DATA_WEBHOOK)) is None:
+            return
+        domain_data[DATA_WEBHOOK_SENSORS] = entry.entry_id
+        async_add_entities(
+            [
+                MoviePilotWebhookSensor(webhook),
+                *(
+                    MoviePilotWebhookRequestsSensor(webhook, counter)
+                    for counter in WEBHOOK_REQUEST_SENSOR_NAMES
+                ),
+            ]
         )
-        self.client = client
 
-    async def _async_update_data(self) -> dict[str, Any]:
-        """Fetch data from MoviePilot API."""
-        try:
-            data = await self.client.get_dashboard_overview()
-            _LOGGER.debug("更新MoviePilot数据成功: %d个指标", len(data))
-            return data
-        except Exception as err:
-            _LOGGER.error("更新MoviePilot数据失败: %s", err)
-            raise UpdateFailed(f"Error communicating with MoviePilot: {err}") from err
+    # Webhook 统计传感器 (诊断) 全局只创建一次；提供它们的条目卸载后由其他条目接管
+    _async_add_webhook_sensors()
+    entry.async_on_unload(
+        async_dispatcher_connect(
+            hass, SIGNAL_WEBHOOK_SENSORS_RELEASED, _async_add_webhook_sensors
+        )
+    )
 
 
 class MoviePilotSensorBase(CoordinatorEntity[MoviePilotDataUpdateCoordinator], SensorEntity):
     """Base class for MoviePilot sensors."""
 
     _attr_has_entity_name = True
+    # 数据所属的更新组
+    _update_group: str = UPDATE_GROUP_LIVE
+    # 依赖的数据字段
+    _overview_keys: tuple[str, ...] = ()
 
     def __init__(
         self,
-        coordinator: MoviePilotDataUpdateCoordinator,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
         entry: ConfigEntry,
         sensor_type: str,
     ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator)
+        # 以依赖字段作为 context，coordinator 只在这些字段变化时通知
+        super().__init__(
+            coordinators[self._update_group],
+            context=frozenset(self._overview_keys) or None,
+        )
         self._entry = entry
         self._sensor_type = sensor_type
         self._attr_unique_id = f"{entry.entry_id}_{sensor_type}"
@@ -138,51 +215,211 @@ class MoviePilotSensorBase(CoordinatorEntity[MoviePilotDataUpdateCoordinator], S
             "sw_version": "moviepilot V2",
         }
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the data age while serving values from an earlier cycle."""
+        age = self.coordinator.data_age(self._overview_keys)
+        return {} if age is None else {ATTR_DATA_AGE: age}
+
+
+class DeadbandFilter:
+    """决定测量值是否值得发布到状态机
+
+    变化量不超过死区 (绝对值与相对百分比取较大者) 时不发布；
+    两次发布之间至少间隔 min_interval 秒；超过 heartbeat 秒未发布时
+    强制发布一次当前值。数值在0与非0之间切换总会发布。
+
+    coordinator 只在字段变化时通知实体，因此被暂缓的值或保持不变的值
+    需要由调用方按 next_check 返回的时间重新检查。
+    """
+
+    def __init__(
+        self,
+        absolute: float = 0.0,
+        relative: float = 0.0,
+        min_interval: float = 0.0,
+        heartbeat: float = 0.0,
+    ) -> None:
+        """Initialize the filter."""
+        self._absolute = absolute
+        self._relative = relative / 100
+        self._min_interval = min_interval
+        self._heartbeat = heartbeat
+        self._published: float | None = None
+        self._published_at: float | None = None
+
+    def should_publish(self, value: float | None, now: float) -> bool:
+        """Return True if value differs significantly from the last published one."""
+        published = self._published
+        if self._published_at is None or value is None or published is None:
+            return value != published or self._published_at is None
+
+        elapsed = now - self._published_at
+        if self._heartbeat and elapsed >= self._heartbeat:
+            return True
+        if elapsed < self._min_interval:
+            return False
+        if (value == 0) != (published == 0):
+            return True
+
+        band = max(self._absolute, abs(published) * self._relative)
+        return abs(value - published) > band if band else value != published
+
+    def next_check(self, held: bool, now: float) -> float | None:
+        """Return the seconds until the decision may change without a new value.
+
+        Args:
+            held: 当前值与已发布的值不同但被暂缓发布
+            now: 当前时间 (time.monotonic)
+        """
+        if self._published_at is None:
+            return None
+        elapsed = now - self._published_at
+        delays: list[float] = []
+        if held and elapsed < self._min_interval:
+            delays.append(self._min_interval - elapsed)
+        if self._heartbeat:
+            delays.append(max(0.0, self._heartbeat - elapsed))
+        return min(delays) if delays else None
+
+    def mark_published(self, value: float | None, now: float) -> None:
+        """Remember the value written to the state machine."""
+        self._published = value
+        self._published_at = now
+
+
+class MoviePilotFilteredSensor(MoviePilotSensorBase):
+    """Measurement sensor that suppresses insignificant changes."""
+
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+        sensor_type: str,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinators, entry, sensor_type)
+        options = entry.options
+        absolute, relative = DEFAULT_DEADBANDS[sensor_type]
+        self._filter = DeadbandFilter(
+            absolute=options.get(f"{sensor_type}_{CONF_DEADBAND_ABSOLUTE}", absolute),
+            relative=options.get(f"{sensor_type}_{CONF_DEADBAND_RELATIVE}", relative),
+            min_interval=options.get(CONF_MIN_PUBLISH_INTERVAL, DEFAULT_MIN_PUBLISH_INTERVAL),
+            heartbeat=options.get(CONF_HEARTBEAT_INTERVAL, DEFAULT_HEARTBEAT_INTERVAL),
+        )
+        self._published_value: float | None = None
+        self._published_available: bool | None = None
+        self._recheck_unsub: CALLBACK_TYPE | None = None
+
+    @abstractmethod
+    def _current_value(self) -> float | None:
+        """Return the latest value reported by the coordinator."""
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the last published state."""
+        return self._published_value
+
+    async def async_added_to_hass(self) -> None:
+        """Publish the initial value when added to hass."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_cancel_recheck)
+        self._publish(self._current_value())
+        self._async_schedule_recheck(held=False)
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Write state only for significant changes or availability changes."""
+        value = self._current_value()
+        if self.available == self._published_available and not self._filter.should_publish(
+            value, time.monotonic()
+        ):
+            self._async_schedule_recheck(held=value != self._published_value)
+            return
+        self._publish(value)
+        super()._handle_coordinator_update()
+        self._async_schedule_recheck(held=False)
+
+    @callback
+    def _async_schedule_recheck(self, held: bool) -> None:
+        """Check again once the publish interval or heartbeat expires."""
+        self._async_cancel_recheck()
+        delay = self._filter.next_check(held, time.monotonic())
+        if delay is not None:
+            self._recheck_unsub = async_call_later(self.hass, delay, self._async_recheck)
+
+    @callback
+    def _async_recheck(self, _now: datetime) -> None:
+        """Re-evaluate the current value without a coordinator update."""
+        self._recheck_unsub = None
+        self._handle_coordinator_update()
+
+    @callback
+    def _async_cancel_recheck(self) -> None:
+        """Cancel a scheduled re-check."""
+        if self._recheck_unsub is not None:
+            self._recheck_unsub()
+            self._recheck_unsub = None
+
+    def _publish(self, value: float | None) -> None:
+        """Record the value that is about to be written."""
+        self._published_value = value
+        self._published_available = self.available
+        self._filter.mark_published(value, time.monotonic())
+
 
 # ========== 系统监控传感器 ==========
 
 
-class MoviePilotCPUSensor(MoviePilotSensorBase):
+class MoviePilotCPUSensor(MoviePilotFilteredSensor):
     """CPU usage sensor."""
 
     _attr_name = "CPU使用率"
     _attr_icon = ICON_CPU
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _overview_keys = ("cpu_percent",)
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "cpu")
+        super().__init__(coordinators, entry, SENSOR_TYPE_CPU)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        return self.coordinator.data.get("cpu_percent")
+    def _current_value(self) -> float | None:
+        """Return the latest value reported by the coordinator."""
+        return self.coordinator.data.system.cpu_percent
 
 
-class MoviePilotMemorySensor(MoviePilotSensorBase):
+class MoviePilotMemorySensor(MoviePilotFilteredSensor):
     """Memory usage sensor."""
 
     _attr_name = "内存使用率"
     _attr_icon = ICON_MEMORY
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _overview_keys = ("memory_percent", "memory_used_bytes")
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "memory")
+        super().__init__(coordinators, entry, SENSOR_TYPE_MEMORY)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        return self.coordinator.data.get("memory_percent")
+    def _current_value(self) -> float | None:
+        """Return the latest value reported by the coordinator."""
+        return self.coordinator.data.system.memory_percent
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        used_bytes = self.coordinator.data.get("memory_used_bytes", 0)
         return {
-            "used_gb": round(used_bytes / BYTES_TO_GB, 2) if used_bytes else 0,
+            **super().extra_state_attributes,
+            "used_gb": self.coordinator.data.system.memory_used_gb,
         }
 
 
@@ -193,29 +430,36 @@ class MoviePilotDiskSensor(MoviePilotSensorBase):
     _attr_icon = ICON_DISK
     _attr_native_unit_of_measurement = PERCENTAGE
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _update_group = UPDATE_GROUP_STORAGE
+    _overview_keys = (
+        "disk_percent",
+        "disk_total_bytes",
+        "disk_used_bytes",
+        "disk_free_bytes",
+    )
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "disk")
+        super().__init__(coordinators, entry, "disk")
 
     @property
     def native_value(self) -> float | None:
         """Return the state."""
-        return self.coordinator.data.get("disk_percent")
+        return self.coordinator.data.system.disk_percent
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
+        system = self.coordinator.data.system
         return {
-            ATTR_TOTAL_STORAGE: round(
-                self.coordinator.data.get("disk_total_bytes", 0) / BYTES_TO_GB, 2
-            ),
-            ATTR_USED_STORAGE: round(
-                self.coordinator.data.get("disk_used_bytes", 0) / BYTES_TO_GB, 2
-            ),
-            ATTR_FREE_STORAGE: round(
-                self.coordinator.data.get("disk_free_bytes", 0) / BYTES_TO_GB, 2
-            ),
+            **super().extra_state_attributes,
+            ATTR_TOTAL_STORAGE: system.disk_total_gb,
+            ATTR_USED_STORAGE: system.disk_used_gb,
+            ATTR_FREE_STORAGE: system.disk_free_gb,
         }
 
 
@@ -228,22 +472,28 @@ class MoviePilotDiskFreeSensor(MoviePilotSensorBase):
     _attr_device_class = SensorDeviceClass.DATA_SIZE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 2
+    _update_group = UPDATE_GROUP_STORAGE
+    _overview_keys = ("disk_free_bytes",)
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "disk_free")
+        super().__init__(coordinators, entry, "disk_free")
 
     @property
     def native_value(self) -> float | None:
         """Return the state."""
-        free_bytes = self.coordinator.data.get("disk_free_bytes")
-        return round(free_bytes / BYTES_TO_GB, 2) if free_bytes else None
+        system = self.coordinator.data.system
+        return system.disk_free_gb if system.disk_free_bytes else None
 
 
 # ========== 下载器传感器 ==========
 
 
-class MoviePilotDownloaderSpeedSensor(MoviePilotSensorBase):
+class MoviePilotDownloaderSpeedSensor(MoviePilotFilteredSensor):
     """Downloader download speed sensor."""
 
     _attr_name = "下载速度"
@@ -252,23 +502,26 @@ class MoviePilotDownloaderSpeedSensor(MoviePilotSensorBase):
     _attr_device_class = SensorDeviceClass.DATA_RATE
     _attr_state_class = SensorStateClass.MEASUREMENT
     _attr_suggested_display_precision = 0
+    _overview_keys = ("downloader_download_speed", "downloader_total_downloaded")
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "downloader_speed")
+        super().__init__(coordinators, entry, SENSOR_TYPE_DOWNLOADER_SPEED)
 
-    @property
-    def native_value(self) -> float | None:
-        """Return the state."""
-        return self.coordinator.data.get("downloader_download_speed")
+    def _current_value(self) -> float | None:
+        """Return the latest value reported by the coordinator."""
+        return self.coordinator.data.downloader.download_speed
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
         return {
-            ATTR_TOTAL_DOWNLOADED: round(
-                self.coordinator.data.get("downloader_total_downloaded", 0) / BYTES_TO_GB, 2
-            ),
+            **super().extra_state_attributes,
+            ATTR_TOTAL_DOWNLOADED: self.coordinator.data.downloader.total_downloaded_gb,
         }
 
 
@@ -281,25 +534,28 @@ class MoviePilotRunningTasksSensor(MoviePilotSensorBase):
     _attr_name = "运行中任务"
     _attr_icon = ICON_TASK
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _update_group = UPDATE_GROUP_TASKS
+    _overview_keys = ("running_tasks", "tasks")
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "running_tasks")
+        super().__init__(coordinators, entry, "running_tasks")
 
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        return self.coordinator.data.get("running_tasks")
+        return self.coordinator.data.tasks.running_tasks
 
     @property
     def extra_state_attributes(self) -> dict[str, Any]:
         """Return additional attributes."""
-        tasks = self.coordinator.data.get("tasks", [])
-        running_task_names = [
-            task.get("name") for task in tasks if task.get("status") == "运行中"
-        ]
         return {
-            "task_names": running_task_names,
+            **super().extra_state_attributes,
+            "task_names": self.coordinator.data.tasks.running_task_names,
         }
 
 
@@ -312,15 +568,21 @@ class MoviePilotMovieCountSensor(MoviePilotSensorBase):
     _attr_name = "电影数量"
     _attr_icon = ICON_MOVIE
     _attr_state_class = SensorStateClass.TOTAL
+    _update_group = UPDATE_GROUP_LIBRARY
+    _overview_keys = ("movie_count",)
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "movie_count")
+        super().__init__(coordinators, entry, "movie_count")
 
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        return self.coordinator.data.get("movie_count")
+        return self.coordinator.data.library.movie_count
 
 
 class MoviePilotTVCountSensor(MoviePilotSensorBase):
@@ -329,15 +591,21 @@ class MoviePilotTVCountSensor(MoviePilotSensorBase):
     _attr_name = "剧集数量"
     _attr_icon = ICON_TV
     _attr_state_class = SensorStateClass.TOTAL
+    _update_group = UPDATE_GROUP_LIBRARY
+    _overview_keys = ("tv_count",)
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "tv_count")
+        super().__init__(coordinators, entry, "tv_count")
 
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        return self.coordinator.data.get("tv_count")
+        return self.coordinator.data.library.tv_count
 
 
 class MoviePilotEpisodeCountSensor(MoviePilotSensorBase):
@@ -346,15 +614,21 @@ class MoviePilotEpisodeCountSensor(MoviePilotSensorBase):
     _attr_name = "剧集集数"
     _attr_icon = ICON_TV
     _attr_state_class = SensorStateClass.TOTAL
+    _update_group = UPDATE_GROUP_LIBRARY
+    _overview_keys = ("episode_count",)
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "episode_count")
+        super().__init__(coordinators, entry, "episode_count")
 
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        return self.coordinator.data.get("episode_count")
+        return self.coordinator.data.library.episode_count
 
 
 class MoviePilotUserCountSensor(MoviePilotSensorBase):
@@ -363,16 +637,191 @@ class MoviePilotUserCountSensor(MoviePilotSensorBase):
     _attr_name = "用户数量"
     _attr_icon = ICON_USER
     _attr_state_class = SensorStateClass.MEASUREMENT
+    _update_group = UPDATE_GROUP_LIBRARY
+    _overview_keys = ("user_count",)
 
-    def __init__(self, coordinator: MoviePilotDataUpdateCoordinator, entry: ConfigEntry) -> None:
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
         """Initialize the sensor."""
-        super().__init__(coordinator, entry, "user_count")
+        super().__init__(coordinators, entry, "user_count")
 
     @property
     def native_value(self) -> int | None:
         """Return the state."""
-        return self.coordinator.data.get("user_count")
+        return self.coordinator.data.library.user_count
+
+
+# ========== 滚动窗口聚合传感器 ==========
+
+
+class MoviePilotAggregateSensor(MoviePilotSensorBase):
+    """Rolling-window average of a live metric, with max and p95 attributes."""
+
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_entity_registry_enabled_default = False
+    _attr_suggested_display_precision = 2
+
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+        metric: str,
+        window: str,
+    ) -> None:
+        """Initialize the sensor."""
+        self._metric = metric
+        self._window = window
+        # 只在该指标采样后收到通知
+        self._overview_keys = (aggregate_key(metric),)
+        super().__init__(coordinators, entry, f"{metric}_{window}_avg")
+
+        name, icon, unit, device_class = AGGREGATE_SENSOR_INFO[metric]
+        self._attr_name = f"{name} {AGGREGATE_WINDOW_NAMES[window]}平均"
+        self._attr_icon = icon
+        self._attr_native_unit_of_measurement = unit
+        self._attr_device_class = device_class
+
+        self._stats: dict[str, float | int | None] = {}
+
+    async def async_added_to_hass(self) -> None:
+        """Compute the initial aggregates when added to hass."""
+        self._stats = self.coordinator.aggregator.stats(self._metric, self._window)
+        await super().async_added_to_hass()
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Recompute the aggregates once per sample."""
+        self._stats = self.coordinator.aggregator.stats(self._metric, self._window)
+        super()._handle_coordinator_update()
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the rolling mean."""
+        return self._stats.get("mean")
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return max, p95 and sample count of the window."""
+        return {
+            "max": self._stats.get("max"),
+            "p95": self._stats.get("p95"),
+            "samples": self._stats.get("samples"),
+        }
+
+
+# ========== 诊断传感器 ==========
+
+
+class MoviePilotRequestWaitSensor(MoviePilotSensorBase):
+    """Mean time recent requests waited for a concurrency slot."""
+
+    _attr_name = "请求排队时间"
+    _attr_icon = ICON_QUEUE
+    _attr_native_unit_of_measurement = UnitOfTime.MILLISECONDS
+    _attr_device_class = SensorDeviceClass.DURATION
+    _attr_state_class = SensorStateClass.MEASUREMENT
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(
+        self,
+        coordinators: dict[str, MoviePilotDataUpdateCoordinator],
+        entry: ConfigEntry,
+    ) -> None:
+        """Initialize the sensor."""
+        super().__init__(coordinators, entry, "request_wait")
+
+    @property
+    def native_value(self) -> float | None:
+        """Return the mean wait across all priority classes."""
+        return self.coordinator.client.limiter.mean_wait()
 
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the wait statistics per priority class."""
+        limiter = self.coordinator.client.limiter
+        return {
+            "queued": limiter.queued,
+            **{
+                f"{name}_{key}": value
+                for name, stats in limiter.wait_stats().items()
+                for key, value in stats.items()
+            },
+        }
 
-# ========== 消息通知传感器 ==========
 
+class MoviePilotWebhookSensorBase(SensorEntity):
+    """Base class for the integration-wide webhook sensors."""
+
+    _attr_has_entity_name = True
+    _attr_should_poll = False
+    _attr_icon = ICON_WEBHOOK
+    _attr_state_class = SensorStateClass.TOTAL_INCREASING
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+
+    def __init__(self, webhook: MoviePilotWebhookView, sensor_type: str) -> None:
+        """Initialize the sensor."""
+        self._webhook = webhook
+        # 接收器由所有配置条目共享，传感器不属于某个 MoviePilot 服务器
+        self._attr_unique_id = f"{DOMAIN}_{sensor_type}"
+        self._attr_device_info = {
+            "identifiers": {(DOMAIN, "webhook")},
+            "name": "MoviePilot Webhook",
+            "manufacturer": "buynow",
+            "model": "Webhook Receiver",
+            "entry_type": DeviceEntryType.SERVICE,
+        }
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the counter updates of the receiver."""
+        await super().async_added_to_hass()
+        self.async_on_remove(
+            async_dispatcher_connect(
+                self.hass, SIGNAL_WEBHOOK_UPDATED, self.async_write_ha_state
+            )
+        )
+
+
+class MoviePilotWebhookSensor(MoviePilotWebhookSensorBase):
+    """Notifications processed by the shared webhook receiver."""
+
+    _attr_name = "Webhook通知"
+
+    def __init__(self, webhook: MoviePilotWebhookView) -> None:
+        """Initialize the sensor."""
+        super().__init__(webhook, "webhook")
+
+    @property
+    def native_value(self) -> int:
+        """Return the number of processed notifications."""
+        return self._webhook.stats["processed"]
+
+    @property
+    def extra_state_attributes(self) -> dict[str, Any]:
+        """Return the ingest and deduplication counters."""
+        webhook = self._webhook
+        return {
+            **webhook.stats,
+            "dedup_hits": webhook.dedup.hits,
+            "dedup_misses": webhook.dedup.misses,
+            "dedup_size": len(webhook.dedup),
+            "rate_limited_sources": len(webhook.rate_limiter),
+        }
+
+
+class MoviePilotWebhookRequestsSensor(MoviePilotWebhookSensorBase):
+    """Webhook requests accepted or throttled by the rate limiter."""
+
+    def __init__(self, webhook: MoviePilotWebhookView, counter: str) -> None:
+        """Initialize the sensor."""
+        super().__init__(webhook, f"webhook_{counter}")
+        self._counter = counter
+        self._attr_name = WEBHOOK_REQUEST_SENSOR_NAMES[counter]
+
+    @property
+    def native_value(self) -> int:
+        """Return the counter of the shared rate limiter."""
+        return getattr(self._webhook.rate_limiter, self._counter)
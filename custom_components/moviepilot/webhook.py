@@ -1,21 +1,302 @@
 """MoviePilot Webhook notification receiver.
 
 Allows MoviePilot to push notifications directly to Home Assistant.
+Requests are acknowledged as soon as they are parsed and queued; a consumer
+task turns them into events in batches, so a burst of notifications (e.g. a
+whole season being organized) does not hold up the HTTP handler.
 """
 from __future__ import annotations
 
+import asyncio
+from collections import Counter, OrderedDict
+from collections.abc import Mapping
 from datetime import datetime
+import hashlib
 import logging
-from typing import Any
+import math
+import time
+from typing import Any, NamedTuple
 
 from aiohttp import web
 from homeassistant.components.http import HomeAssistantView
-from homeassistant.core import HomeAssistant
-
-from .const import DOMAIN
+from homeassistant.const import CONF_HOST
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+from homeassistant.helpers.event import async_call_later
+import voluptuous as vol
+
+from .api import json_loads
+from .const import (
+    CONF_WEBHOOK_BATCH_EVENT,
+    CONF_WEBHOOK_MAX_BODY_SIZE,
+    CONF_WEBHOOK_OVERFLOW,
+    CONF_WEBHOOK_ROUTES,
+    DATA_COORDINATORS,
+    DATA_WEBHOOK,
+    DEFAULT_WEBHOOK_BATCH_EVENT,
+    DEFAULT_WEBHOOK_MAX_BODY_SIZE,
+    DEFAULT_WEBHOOK_OVERFLOW,
+    DOMAIN,
+    SIGNAL_WEBHOOK_UPDATED,
+    WEBHOOK_BATCH_SIZE,
+    WEBHOOK_BATCH_WINDOW,
+    WEBHOOK_CONTENT_TYPES,
+    WEBHOOK_DEDUP_SIZE,
+    WEBHOOK_DEDUP_TTL,
+    WEBHOOK_GLOBAL_RATE_BURST,
+    WEBHOOK_GLOBAL_RATE_LIMIT,
+    WEBHOOK_ID_FIELD,
+    WEBHOOK_NOTIFICATION_TYPES,
+    WEBHOOK_OVERFLOW_DROP_NEWEST,
+    WEBHOOK_OVERFLOW_REJECT,
+    WEBHOOK_QUEUE_SIZE,
+    WEBHOOK_RATE_BURST,
+    WEBHOOK_RATE_IDLE_TIMEOUT,
+    WEBHOOK_RATE_LIMIT,
+    WEBHOOK_RATE_MAX_SOURCES,
+    WEBHOOK_READ_CHUNK_SIZE,
+    WEBHOOK_REFRESH_ENDPOINTS,
+    WEBHOOK_SENSOR_UPDATE_INTERVAL,
+)
+from .routing import NotificationRouter, RoutingRule, compile_routes
 
 _LOGGER = logging.getLogger(__name__)
 
+RESERVED_FIELDS = frozenset({"title", "text", "message", "type", "timestamp"})
+NDJSON_CONTENT_TYPE = "application/x-ndjson"
+
+# Per-item results of bulk requests
+ATTR_STATUS = "status"
+STATUS_QUEUED = "queued"
+STATUS_DUPLICATE = "duplicate"
+STATUS_REJECTED = "rejected"
+STATUS_DROPPED = "dropped"
+STATUS_INVALID = "invalid"
+STATUS_THROTTLED = "throttled"
+ATTR_RETRY_AFTER = "retry_after"
+
+
+class QueuedNotification(NamedTuple):
+    """A parsed webhook request waiting to be processed."""
+
+    data: dict[str, Any]
+    remote: str | None
+    entry_id: str | None
+    received: str
+    key: bytes
+
+
+class NotificationDeduplicator:
+    """Remember recently seen notification keys for a limited time.
+
+    Keys are kept in insertion order, which with a fixed TTL is also expiry
+    order, so expired keys are dropped from the front and the oldest key is
+    evicted once the cache is full. Every operation is amortized O(1).
+    Checking and remembering are separate so that only notifications that
+    were actually queued are remembered.
+    """
+
+    def __init__(self, ttl: float = WEBHOOK_DEDUP_TTL, max_size: int = WEBHOOK_DEDUP_SIZE) -> None:
+        """Initialize the cache.
+
+        Args:
+            ttl: Seconds a key is remembered
+            max_size: Maximum number of keys kept
+        """
+        self._ttl = ttl
+        self._max_size = max_size
+        self._expires: OrderedDict[bytes, float] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        """Return the number of remembered keys."""
+        return len(self._expires)
+
+    def seen(self, key: bytes) -> bool:
+        """Check whether a key was remembered within the TTL.
+
+        Args:
+            key: Notification key
+
+        Returns:
+            True if the notification is a duplicate
+        """
+        now = time.monotonic()
+        expires = self._expires
+        while expires:
+            oldest = next(iter(expires))
+            if expires[oldest] > now:
+                break
+            del expires[oldest]
+
+        if key in expires:
+            self.hits += 1
+            return True
+        self.misses += 1
+        return False
+
+    def remember(self, key: bytes) -> None:
+        """Remember the key of a queued notification.
+
+        Args:
+            key: Notification key
+        """
+        expires = self._expires
+        expires[key] = time.monotonic() + self._ttl
+        if len(expires) > self._max_size:
+            expires.popitem(last=False)
+
+    def forget(self, key: bytes) -> None:
+        """Forget the key of a notification that was dropped from the queue.
+
+        Args:
+            key: Notification key
+        """
+        self._expires.pop(key, None)
+
+
+class TokenBucket:
+    """Token bucket refilled continuously at a fixed rate."""
+
+    __slots__ = ("rate", "capacity", "tokens", "updated")
+
+    def __init__(self, rate: float, capacity: float, now: float) -> None:
+        """Initialize a full bucket.
+
+        Args:
+            rate: Tokens added per second
+            capacity: Maximum number of tokens
+            now: Current monotonic time
+        """
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated = now
+
+    def refill(self, now: float) -> None:
+        """Add the tokens accrued since the last update.
+
+        Args:
+            now: Current monotonic time
+        """
+        self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait(self) -> float:
+        """Return the seconds until a token is available, 0 if one is.
+
+        Returns:
+            Seconds to wait
+        """
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+
+class WebhookRateLimiter:
+    """Rate limit webhook requests per source address and globally.
+
+    A request needs a token from both its source bucket and the global
+    bucket, and so does every further notification of a bulk request. Source buckets are kept in least recently used order, so idle
+    sources are evicted from the front and memory stays bounded by the
+    number of recently active sources.
+    """
+
+    def __init__(
+        self,
+        rate: float = WEBHOOK_RATE_LIMIT,
+        burst: float = WEBHOOK_RATE_BURST,
+        global_rate: float = WEBHOOK_GLOBAL_RATE_LIMIT,
+        global_burst: float = WEBHOOK_GLOBAL_RATE_BURST,
+        idle_timeout: float = WEBHOOK_RATE_IDLE_TIMEOUT,
+        max_sources: int = WEBHOOK_RATE_MAX_SOURCES,
+    ) -> None:
+        """Initialize the rate limiter.
+
+        Args:
+            rate: Requests per second per source
+            burst: Requests a source may send at once
+            global_rate: Requests per second for all sources
+            global_burst: Requests all sources may send at once
+            idle_timeout: Seconds before an idle source is forgotten
+            max_sources: Maximum number of tracked sources
+        """
+        self._rate = rate
+        self._burst = burst
+        self._idle_timeout = idle_timeout
+        self._max_sources = max_sources
+        self._global = TokenBucket(global_rate, global_burst, time.monotonic())
+        self._sources: OrderedDict[str | None, TokenBucket] = OrderedDict()
+        self.accepted = 0
+        self.throttled = 0
+
+    def __len__(self) -> int:
+        """Return the number of tracked sources."""
+        return len(self._sources)
+
+    def acquire(self, source: str | None) -> float:
+        """Take a token for a request.
+
+        Args:
+            source: Address of the sender
+
+        Returns:
+            0 if the request is allowed, otherwise seconds until it would be
+        """
+        now = time.monotonic()
+        sources = self._sources
+
+        # A source idle this long has a full bucket again, forgetting it is lossless
+        while sources:
+            oldest = next(iter(sources))
+            if now - sources[oldest].updated < self._idle_timeout:
+                break
+            del sources[oldest]
+
+        if (bucket := sources.get(source)) is None:
+            bucket = sources[source] = TokenBucket(self._rate, self._burst, now)
+            if len(sources) > self._max_sources:
+                sources.popitem(last=False)
+        else:
+            sources.move_to_end(source)
+
+        bucket.refill(now)
+        self._global.refill(now)
+        if wait := max(bucket.wait(), self._global.wait()):
+            self.throttled += 1
+            return wait
+
+        bucket.tokens -= 1
+        self._global.tokens -= 1
+        self.accepted += 1
+        return 0.0
+
+
+def notification_key(data: Mapping[str, Any]) -> bytes:
+    """Return the deduplication key of a notification.
+
+    Uses the explicit id field when present, otherwise the type, title,
+    message and timestamp.
+
+    Args:
+        data: Notification payload
+
+    Returns:
+        Fixed-size digest identifying the notification
+    """
+    explicit = data.get(WEBHOOK_ID_FIELD)
+    if explicit is not None and explicit != "":
+        content = f"{WEBHOOK_ID_FIELD}\x00{explicit}"
+    else:
+        content = "\x00".join(
+            (
+                str(data.get("type", "")),
+                str(data.get("title", "")),
+                str(data.get("text") or data.get("message", "")),
+                str(data.get("timestamp", "")),
+            )
+        )
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
 
 class MoviePilotWebhookView(HomeAssistantView):
     """MoviePilot Webhook receiver view."""
@@ -24,100 +305,556 @@ class MoviePilotWebhookView(HomeAssistantView):
     name = "api:moviepilot:webhook"
     requires_auth = False  # No HA auth required, validated by optional token
 
-    def __init__(self, hass: HomeAssistant) -> None:
+    def __init__(self, hass: HomeAssistant, queue_size: int = WEBHOOK_QUEUE_SIZE) -> None:
         """Initialize the webhook view.
 
         Args:
             hass: Home Assistant instance
+            queue_size: Maximum number of notifications waiting to be processed
         """
         self.hass = hass
+        self._queue: asyncio.Queue[QueuedNotification] = asyncio.Queue(queue_size)
+        self.overflow = DEFAULT_WEBHOOK_OVERFLOW
+        self.batch_event = DEFAULT_WEBHOOK_BATCH_EVENT
+        self.max_body_size = DEFAULT_WEBHOOK_MAX_BODY_SIZE * 1024
+        self.router = NotificationRouter()
+        self._overflowing = False
+        self.dedup = NotificationDeduplicator()
+        self.rate_limiter = WebhookRateLimiter()
+        self._throttle_logged = 0.0
+        self._update_unsub: CALLBACK_TYPE | None = None
+        # Ingest statistics
+        self.stats: dict[str, int] = {
+            "received": 0,
+            "processed": 0,
+            "routed": 0,
+            "dropped": 0,
+            "rejected": 0,
+            "batches": 0,
+            "too_large": 0,
+            "unsupported_type": 0,
+        }
+
+    @callback
+    def async_configure(self) -> None:
+        """Apply the merged webhook options of all loaded config entries.
+
+        The receiver is shared by all config entries, so their options are
+        merged in config entry order, independent of which entry was set up
+        last: the overflow policy of the first entry applies, the batch event
+        is fired if any entry enables it, the largest body size cap applies
+        and the routing rules of all entries are combined. Called whenever an
+        entry is set up or unloaded.
+        """
+        domain_data = self.hass.data.get(DOMAIN, {})
+        entries = [
+            entry
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.entry_id in domain_data
+        ]
+        if not entries:
+            self.overflow = DEFAULT_WEBHOOK_OVERFLOW
+            self.batch_event = DEFAULT_WEBHOOK_BATCH_EVENT
+            self.max_body_size = DEFAULT_WEBHOOK_MAX_BODY_SIZE * 1024
+            self.router = NotificationRouter()
+            return
+
+        self.overflow = entries[0].options.get(CONF_WEBHOOK_OVERFLOW, DEFAULT_WEBHOOK_OVERFLOW)
+        self.batch_event = any(
+            entry.options.get(CONF_WEBHOOK_BATCH_EVENT, DEFAULT_WEBHOOK_BATCH_EVENT)
+            for entry in entries
+        )
+        self.max_body_size = (
+            max(
+                entry.options.get(CONF_WEBHOOK_MAX_BODY_SIZE, DEFAULT_WEBHOOK_MAX_BODY_SIZE)
+                for entry in entries
+            )
+            * 1024
+        )
+
+        rules: list[RoutingRule] = []
+        for entry in entries:
+            try:
+                rules.extend(compile_routes(entry.options.get(CONF_WEBHOOK_ROUTES)).rules)
+            except vol.Invalid as err:
+                _LOGGER.error(
+                    "Invalid webhook routing rules in %s, ignoring them: %s", entry.title, err
+                )
+        self.router = NotificationRouter(rules)
 
     async def post(self, request: web.Request) -> web.Response:
         """Handle MoviePilot webhook POST requests.
 
+        Accepts a single JSON object, a JSON array of objects, or an
+        ``application/x-ndjson`` stream with one object per line. Requests with
+        another content type or a body over the size cap are rejected before
+        anything is decoded. Only parsing and validation happen here;
+        notifications are queued and the request acknowledged before any
+        event is fired.
+
         Args:
             request: The aiohttp web request
 
         Returns:
-            JSON response with success status
+            JSON response with success status, per item for bulk requests
         """
         try:
-            # Parse request data
+            # Throttle floods before doing any other work
+            retry_after = self.rate_limiter.acquire(request.remote)
+            self._async_schedule_update()
+            if retry_after:
+                return self._throttled_response(request, retry_after)
+
+            # Reject by headers alone, before reading the body
+            if request.content_type not in WEBHOOK_CONTENT_TYPES:
+                self.stats["unsupported_type"] += 1
+                return self._error_response(
+                    f"Unsupported content type: {request.content_type}", 415
+                )
+            if request.content_length is not None and request.content_length > self.max_body_size:
+                return self._too_large_response()
+
+            if request.content_type == NDJSON_CONTENT_TYPE:
+                return await self._async_post_ndjson(request)
+
+            # Read the body up to the cap and decode it from bytes
+            if (body := await self._async_read_body(request)) is None:
+                return self._too_large_response()
             try:
-                data = await request.json()
+                data = json_loads(body)
             except ValueError as err:
                 _LOGGER.warning("Invalid JSON in webhook request: %s", err)
                 return self._error_response("Invalid JSON format", 400)
 
+            if isinstance(data, list):
+                # The request's token pays for the first notification
+                return self._bulk_response(
+                    [
+                        self._async_ingest(request, item, charge=index > 0)
+                        for index, item in enumerate(data)
+                    ],
+                )
+
             # Validate request data
             if not isinstance(data, dict):
                 _LOGGER.warning("Webhook data is not a dictionary: %s", type(data))
-                return self._error_response("Request data must be a JSON object", 400)
+                return self._error_response("Request data must be a JSON object or array", 400)
+
+            status = self._async_ingest(request, data)[ATTR_STATUS]
+            if status == STATUS_DUPLICATE:
+                return web.json_response(
+                    {
+                        "success": True,
+                        "message": "Duplicate notification ignored",
+                        "duplicate": True,
+                    }
+                )
+            if status == STATUS_REJECTED:
+                response = self._error_response("Notification queue is full", 503)
+                response.headers["Retry-After"] = "1"
+                return response
+            if status == STATUS_DROPPED:
+                return web.json_response(
+                    {
+                        "success": True,
+                        "message": "Notification queue is full, notification dropped",
+                        "dropped": True,
+                    }
+                )
 
-            # Log incoming webhook (redacted for security)
-            _LOGGER.debug(
-                "Received MoviePilot webhook: title=%s, type=%s",
-                data.get("title", "N/A"),
-                data.get("type", "N/A"),
+            # Return success response
+            return web.json_response(
+                {
+                    "success": True,
+                    "message": "Notification queued",
+                    "event_fired": f"{DOMAIN}_notification",
+                }
             )
 
-            # Extract notification information
-            title = str(data.get("title", "MoviePilot Notification"))
-            message = str(data.get("text") or data.get("message", ""))
-            notification_type = str(data.get("type", "Manual"))
-
-            # Validate notification type
-            valid_types = ["Manual", "System", "Download", "Transfer", "Subscribe", "Media", "Plugin"]
-            if notification_type not in valid_types:
-                _LOGGER.warning(
-                    "Unknown notification type '%s', using 'Manual'. Valid types: %s",
-                    notification_type,
-                    ", ".join(valid_types),
-                )
-                notification_type = "Manual"
-
-            # Prepare event data
-            event_data = {
-                "type": notification_type,
-                "title": title,
-                "message": message,
-                "timestamp": data.get("timestamp") or datetime.now().isoformat(),
-                "source": "moviepilot_webhook",
+        except Exception as err:
+            # Log unexpected errors
+            _LOGGER.exception("Unexpected error processing webhook: %s", err)
+            return self._error_response(f"Internal server error: {str(err)}", 500)
+
+    async def _async_post_ndjson(self, request: web.Request) -> web.Response:
+        """Ingest a newline-delimited JSON stream line by line as it arrives.
+
+        Args:
+            request: The aiohttp web request
+
+        Returns:
+            JSON response with one result per non-empty line
+        """
+        results: list[dict[str, Any]] = []
+        size = 0
+        ingested = 0
+        try:
+            async for line in request.content:
+                size += len(line)
+                if size > self.max_body_size:
+                    # Notifications queued so far stay queued, a retry is deduplicated
+                    return self._too_large_response()
+                if not line.strip():
+                    continue
+                try:
+                    item = json_loads(line)
+                except ValueError:
+                    results.append(_invalid("Invalid JSON format"))
+                    continue
+                # The request's token pays for the first notification
+                results.append(self._async_ingest(request, item, charge=ingested > 0))
+                ingested += 1
+        except ValueError as err:
+            # Line longer than the stream reader accepts
+            _LOGGER.warning("Invalid NDJSON webhook request: %s", err)
+            results.append(_invalid("Line too long"))
+
+        return self._bulk_response(results)
+
+    async def _async_read_body(self, request: web.Request) -> bytes | None:
+        """Read the request body in chunks, stopping at the size cap.
+
+        Args:
+            request: The aiohttp web request
+
+        Returns:
+            Raw body, or None if it exceeds the cap
+        """
+        body = bytearray()
+        async for chunk in request.content.iter_chunked(WEBHOOK_READ_CHUNK_SIZE):
+            body += chunk
+            if len(body) > self.max_body_size:
+                return None
+        return bytes(body)
+
+    def _throttled_response(self, request: web.Request, retry_after: float) -> web.Response:
+        """Create the response for a rate limited request.
+
+        Args:
+            request: The aiohttp web request
+            retry_after: Seconds until the request would be allowed
+
+        Returns:
+            JSON error response with status 429
+        """
+        now = time.monotonic()
+        if now - self._throttle_logged >= 60:
+            # Warn at most once a minute while a flood lasts
+            self._throttle_logged = now
+            _LOGGER.warning(
+                "Rate limiting webhook requests from %s (%d throttled so far)",
+                request.remote,
+                self.rate_limiter.throttled,
+            )
+        response = self._error_response("Too many requests", 429)
+        response.headers["Retry-After"] = str(math.ceil(retry_after))
+        return response
+
+    def _too_large_response(self) -> web.Response:
+        """Create the response for a body over the size cap.
+
+        Returns:
+            JSON error response with status 413
+        """
+        self.stats["too_large"] += 1
+        _LOGGER.debug("Webhook request body exceeds %d bytes", self.max_body_size)
+        return self._error_response(
+            f"Request body exceeds {self.max_body_size} bytes", 413
+        )
+
+    @callback
+    def _async_ingest(
+        self, request: web.Request, data: Any, charge: bool = False
+    ) -> dict[str, Any]:
+        """Validate, deduplicate and queue one notification.
+
+        Args:
+            request: The aiohttp web request the notification arrived with
+            data: Decoded notification
+            charge: Take a rate limiter token for the notification, so bulk
+                requests are limited per notification rather than per request
+
+        Returns:
+            Result with the status of the notification
+        """
+        if not isinstance(data, dict):
+            return _invalid("Notification must be a JSON object")
+
+        if charge and (retry_after := self.rate_limiter.acquire(request.remote)):
+            return {ATTR_STATUS: STATUS_THROTTLED, ATTR_RETRY_AFTER: math.ceil(retry_after)}
+
+        # Acknowledge retried and repeated notifications without processing them
+        key = notification_key(data)
+        if self.dedup.seen(key):
+            _LOGGER.debug("Ignoring duplicate webhook notification: %s", data.get("title", "N/A"))
+            return {ATTR_STATUS: STATUS_DUPLICATE}
+
+        notification = QueuedNotification(
+            data,
+            request.remote,
+            request.query.get("entry_id"),
+            datetime.now().isoformat(),
+            key,
+        )
+        return {ATTR_STATUS: self._async_enqueue(notification)}
+
+    def _bulk_response(self, results: list[dict[str, Any]]) -> web.Response:
+        """Create the response of a bulk request.
+
+        Answers 503 only when every notification was rejected because the
+        queue is full, so the sender retries the whole request. A request
+        without any token left was answered 429 before its body was read.
+
+        Args:
+            results: Per-item results in request order
+
+        Returns:
+            JSON response with the per-item results
+        """
+        counts = Counter(result[ATTR_STATUS] for result in results)
+        if results and counts[STATUS_REJECTED] == len(results):
+            response = self._error_response("Notification queue is full", 503)
+            response.headers["Retry-After"] = "1"
+            return response
+
+        return web.json_response(
+            {
+                "success": (
+                    counts[STATUS_INVALID] == 0
+                    and counts[STATUS_REJECTED] == 0
+                    and counts[STATUS_THROTTLED] == 0
+                ),
+                "queued": counts[STATUS_QUEUED],
+                "duplicates": counts[STATUS_DUPLICATE],
+                "rejected": counts[STATUS_REJECTED],
+                "dropped": counts[STATUS_DROPPED],
+                "invalid": counts[STATUS_INVALID],
+                "throttled": counts[STATUS_THROTTLED],
+                "results": results,
             }
+        )
 
-            # Only include raw_data if there are extra fields
-            extra_fields = {k: v for k, v in data.items() if k not in ["title", "text", "message", "type", "timestamp"]}
-            if extra_fields:
-                event_data["extra"] = extra_fields
+    @callback
+    def _async_enqueue(self, notification: QueuedNotification) -> str:
+        """Queue a notification, applying the overflow policy when the queue is full.
+
+        Only queued notifications are remembered for deduplication, so a
+        rejected or dropped notification is accepted again when resent.
+
+        Args:
+            notification: Parsed notification
+
+        Returns:
+            Status of the notification: queued, rejected or dropped
+        """
+        self.stats["received"] += 1
+        try:
+            self._queue.put_nowait(notification)
+        except asyncio.QueueFull:
+            pass
+        else:
+            self.dedup.remember(notification.key)
+            return STATUS_QUEUED
+
+        if not self._overflowing:
+            # Warn once per burst, the consumer resets the flag once drained
+            self._overflowing = True
+            _LOGGER.warning(
+                "Webhook queue is full (%d notifications), overflow policy: %s",
+                self._queue.maxsize,
+                self.overflow,
+            )
+
+        if self.overflow == WEBHOOK_OVERFLOW_REJECT:
+            self.stats["rejected"] += 1
+            return STATUS_REJECTED
+
+        self.stats["dropped"] += 1
+        if self.overflow == WEBHOOK_OVERFLOW_DROP_NEWEST:
+            return STATUS_DROPPED
+
+        self.dedup.forget(self._queue.get_nowait().key)
+        self._queue.put_nowait(notification)
+        self.dedup.remember(notification.key)
+        return STATUS_QUEUED
+
+    async def async_consume(self) -> None:
+        """Process queued notifications in batches until cancelled."""
+        queue = self._queue
+        while True:
+            batch = [await queue.get()]
+            # Let the rest of a burst arrive; under sustained load only yield
+            await asyncio.sleep(WEBHOOK_BATCH_WINDOW if queue.empty() else 0)
+            while len(batch) < WEBHOOK_BATCH_SIZE and not queue.empty():
+                batch.append(queue.get_nowait())
+            if queue.empty():
+                self._overflowing = False
+            self._async_process_batch(batch)
+
+    @callback
+    def _async_process_batch(self, batch: list[QueuedNotification]) -> None:
+        """Fire the events for a batch of notifications and schedule refreshes.
+
+        Args:
+            batch: Notifications in arrival order
+        """
+        events: list[dict[str, Any]] = []
+        refreshes: dict[tuple[str | None, str | None], set[str]] = {}
 
-            # Fire Home Assistant event
+        for notification in batch:
+            try:
+                event_data = self._build_event_data(notification)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.exception("Unexpected error processing webhook: %s", err)
+                continue
+
+            # Fire Home Assistant event, then the events of matching routing rules
+            self.hass.bus.async_fire(f"{DOMAIN}_notification", event_data)
+            events.append(event_data)
+            for event_type in self.router.route(event_data):
+                self.hass.bus.async_fire(event_type, event_data)
+                self.stats["routed"] += 1
+
+            # Collect the endpoints affected by this notification
+            if endpoints := WEBHOOK_REFRESH_ENDPOINTS.get(event_data["type"]):
+                refreshes.setdefault(
+                    (notification.remote, notification.entry_id), set()
+                ).update(endpoints)
+
+        for (remote, entry_id), endpoints in refreshes.items():
+            self._async_schedule_refresh(remote, entry_id, endpoints)
+
+        if self.batch_event and events:
             self.hass.bus.async_fire(
-                f"{DOMAIN}_notification",
-                event_data,
+                f"{DOMAIN}_notifications_batch",
+                {"count": len(events), "notifications": events},
             )
 
-            # Log success
-            message_preview = message[:50] + "..." if len(message) > 50 else message
+        self.stats["processed"] += len(events)
+        self.stats["batches"] += 1
+        self._async_schedule_update()
+        if len(events) == 1:
             _LOGGER.info(
                 "Webhook notification received: [%s] %s",
-                notification_type,
-                title,
+                events[0]["type"],
+                events[0]["title"],
             )
-            _LOGGER.debug("Notification message: %s", message_preview)
+        elif events:
+            _LOGGER.info("Processed %d webhook notifications", len(events))
 
-            # Return success response
-            return web.json_response(
-                {
-                    "success": True,
-                    "message": "Notification received and processed",
-                    "event_fired": f"{DOMAIN}_notification",
-                }
+    @callback
+    def _async_schedule_update(self) -> None:
+        """Notify the webhook sensors that the counters changed.
+
+        Every request changes a counter, so updates are coalesced and the
+        sensors are written at most once per WEBHOOK_SENSOR_UPDATE_INTERVAL.
+        """
+        if self._update_unsub is None:
+            self._update_unsub = async_call_later(
+                self.hass, WEBHOOK_SENSOR_UPDATE_INTERVAL, self._async_send_update
             )
 
-        except Exception as err:
-            # Log unexpected errors
-            _LOGGER.exception("Unexpected error processing webhook: %s", err)
-            return self._error_response(f"Internal server error: {str(err)}", 500)
+    @callback
+    def _async_send_update(self, _now: datetime) -> None:
+        """Send the pending sensor update."""
+        self._update_unsub = None
+        async_dispatcher_send(self.hass, SIGNAL_WEBHOOK_UPDATED)
+
+    @staticmethod
+    def _build_event_data(notification: QueuedNotification) -> dict[str, Any]:
+        """Build the event data of a notification.
+
+        Args:
+            notification: Parsed notification
+
+        Returns:
+            Event data for the moviepilot_notification event
+        """
+        data = notification.data
+
+        # Log incoming webhook (redacted for security)
+        _LOGGER.debug(
+            "Received MoviePilot webhook: title=%s, type=%s",
+            data.get("title", "N/A"),
+            data.get("type", "N/A"),
+        )
+
+        # Extract notification information
+        title = str(data.get("title", "MoviePilot Notification"))
+        message = str(data.get("text") or data.get("message", ""))
+        notification_type = str(data.get("type", "Manual"))
+
+        # Validate notification type
+        if notification_type not in WEBHOOK_NOTIFICATION_TYPES:
+            _LOGGER.warning(
+                "Unknown notification type '%s', using 'Manual'. Valid types: %s",
+                notification_type,
+                ", ".join(WEBHOOK_NOTIFICATION_TYPES),
+            )
+            notification_type = "Manual"
+
+        # Prepare event data
+        event_data = {
+            "type": notification_type,
+            "title": title,
+            "message": message,
+            "timestamp": data.get("timestamp") or notification.received,
+            "source": "moviepilot_webhook",
+        }
+
+        # Only include raw_data if there are extra fields
+        extra_fields = {k: v for k, v in data.items() if k not in RESERVED_FIELDS}
+        if extra_fields:
+            event_data["extra"] = extra_fields
+
+        message_preview = message[:50] + "..." if len(message) > 50 else message
+        _LOGGER.debug("Notification message: %s", message_preview)
+        return event_data
+
+    @callback
+    def _async_schedule_refresh(
+        self, remote: str | None, entry_id: str | None, endpoints: set[str]
+    ) -> None:
+        """Schedule a targeted refresh on the config entries notifications came from.
+
+        Args:
+            remote: Address of the sender
+            entry_id: Config entry requested via the ``entry_id`` query parameter
+            endpoints: Endpoints affected by the notifications
+        """
+        for entry_data in self._matching_entries(remote, entry_id):
+            for coordinator in entry_data[DATA_COORDINATORS].values():
+                coordinator.async_schedule_endpoint_refresh(endpoints)
+
+    def _matching_entries(self, remote: str | None, entry_id: str | None) -> list[dict[str, Any]]:
+        """Return the data of the config entries a notification belongs to.
+
+        Matches the ``entry_id`` query parameter first, then the sender address
+        against the configured hosts, and falls back to all loaded entries.
+
+        Args:
+            remote: Address of the sender
+            entry_id: Config entry requested via the ``entry_id`` query parameter
+
+        Returns:
+            List of per-entry data dictionaries
+        """
+        loaded = {
+            entry.entry_id: entry
+            for entry in self.hass.config_entries.async_entries(DOMAIN)
+            if entry.entry_id in self.hass.data.get(DOMAIN, {})
+        }
+        domain_data = self.hass.data.get(DOMAIN, {})
+
+        if entry_id is not None:
+            return [domain_data[entry_id]] if entry_id in loaded else []
+
+        matched = [
+            domain_data[loaded_id]
+            for loaded_id, entry in loaded.items()
+            if remote and _host_name(entry.data.get(CONF_HOST, "")) == remote
+        ]
+        return matched or [domain_data[loaded_id] for loaded_id in loaded]
 
     @staticmethod
     def _error_response(message: str, status: int = 400) -> web.Response:
@@ -146,8 +883,11 @@ async def async_setup_webhook(hass: HomeAssistant) -> bool:
         True if setup was successful
     """
     try:
-        # Register the webhook view
-        hass.http.register_view(MoviePilotWebhookView(hass))
+        # Register the webhook view and start processing its queue
+        view = MoviePilotWebhookView(hass)
+        hass.http.register_view(view)
+        hass.async_create_background_task(view.async_consume(), f"{DOMAIN}_webhook_queue")
+        hass.data.setdefault(DOMAIN, {})[DATA_WEBHOOK] = view
 
         # Log success
         _LOGGER.info("MoviePilot webhook receiver registered at: /api/moviepilot/webhook")
@@ -159,6 +899,31 @@ async def async_setup_webhook(hass: HomeAssistant) -> bool:
         return False
 
 
+def _invalid(error: str) -> dict[str, str]:
+    """Return the result of a notification that failed validation.
+
+    Args:
+        error: Reason the notification was not accepted
+
+    Returns:
+        Per-item result
+    """
+    return {ATTR_STATUS: STATUS_INVALID, "error": error}
+
+
+def _host_name(host: str) -> str:
+    """Strip the scheme, port and path from a configured host.
+
+    Args:
+        host: Host as entered in the config flow
+
+    Returns:
+        Bare host name or IP address
+    """
+    host = host.split("://", 1)[-1]
+    return host.split("/", 1)[0].rsplit(":", 1)[0]
+
+
 def get_webhook_url(hass: HomeAssistant) -> str | None:
     """Get the webhook URL for MoviePilot configuration.
 
@@ -0,0 +1,152 @@
+"""Measure the client-side CPU time of one MoviePilot API request.
+
+Serves a 20-item schedule payload from a local aiohttp server running in a
+child process, then times ``MoviePilotAPIClient._send`` sequentially with
+``time.process_time`` so only the client's own work is counted (request
+preparation, aiohttp, body read and JSON decoding). Every response carries
+a new sequence number, so the body is always decoded.
+
+The same loop with a bare aiohttp session (``get``, ``read``, ``json.loads``)
+is timed as a floor; the difference is the integration's own per-call
+overhead, which is what the request path changes affect.
+
+Requires aiohttp (and async-timeout, yarl). Compare two revisions with:
+
+    git worktree add /tmp/before <revision>
+    python scripts/bench_request.py --tree /tmp/before
+    python scripts/bench_request.py
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import importlib.machinery
+import importlib.util
+import json
+import logging
+import multiprocessing
+from pathlib import Path
+import statistics
+import sys
+import time
+
+ROOT = Path(__file__).resolve().parent.parent
+ENDPOINT = "/api/v1/dashboard/schedule2"
+
+
+def load_api(tree: Path):
+    """Import the integration's api module without its Home Assistant __init__."""
+    packages = {
+        "custom_components": tree / "custom_components",
+        "custom_components.moviepilot": tree / "custom_components" / "moviepilot",
+    }
+    for name, path in packages.items():
+        spec = importlib.machinery.ModuleSpec(name, None, is_package=True)
+        module = importlib.util.module_from_spec(spec)
+        module.__path__ = [str(path)]
+        sys.modules[name] = module
+    return importlib.import_module("custom_components.moviepilot.api")
+
+
+def serve(port: int, ready: multiprocessing.Event) -> None:
+    """Serve the schedule payload until terminated."""
+    from aiohttp import web
+
+    tasks = [
+        {
+            "id": f"task_{index}",
+            "name": f"定时任务 {index}",
+            "provider": "MoviePilot",
+            "status": "等待" if index % 3 else "正在运行",
+            "next_run": "2026-10-18 12:00:00",
+        }
+        for index in range(20)
+    ]
+    sequence = 0
+
+    async def schedule(request: web.Request) -> web.Response:
+        nonlocal sequence
+        sequence += 1
+        tasks[0]["seq"] = sequence
+        return web.Response(body=json.dumps(tasks).encode(), content_type="application/json")
+
+    async def main() -> None:
+        app = web.Application()
+        app.router.add_get(ENDPOINT, schedule)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+async def bench(api, port: int, calls: int, rounds: int) -> tuple[list[float], list[float]]:
+    """Return the CPU time per call of the client and of bare aiohttp in microseconds."""
+    import aiohttp
+
+    client = api.MoviePilotAPIClient("127.0.0.1", port, "token")
+    session = aiohttp.ClientSession()
+    url = f"http://127.0.0.1:{port}{ENDPOINT}"
+
+    async def send() -> None:
+        await client._send("GET", ENDPOINT)
+
+    async def floor() -> None:
+        async with session.get(url, params={"token": "token"}) as response:
+            json.loads(await response.read())
+
+    async def timed(call) -> float:
+        started = time.process_time()
+        for _ in range(calls):
+            await call()
+        return (time.process_time() - started) / calls * 1e6
+
+    try:
+        for _ in range(50):
+            await send()
+            await floor()
+        # 交替测量，使两者受到相同的机器负载影响
+        client_results: list[float] = []
+        floor_results: list[float] = []
+        for _ in range(rounds):
+            client_results.append(await timed(send))
+            floor_results.append(await timed(floor))
+    finally:
+        await client.close()
+        await session.close()
+    return client_results, floor_results
+
+
+def main() -> None:
+    """Run the benchmark."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tree", type=Path, default=ROOT, help="repository checkout to measure")
+    parser.add_argument("--calls", type=int, default=2000, help="requests per round")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--port", type=int, default=8799)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO)
+    api = load_api(args.tree.resolve())
+
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(target=serve, args=(args.port, ready), daemon=True)
+    server.start()
+    try:
+        if not ready.wait(10):
+            raise SystemExit("server did not start")
+        results, floor = asyncio.run(bench(api, args.port, args.calls, args.rounds))
+    finally:
+        server.terminate()
+
+    print(f"{args.tree} ({args.rounds} rounds x {args.calls} calls)")
+    print(f"  client _send: best {min(results):6.1f} us/call, median {statistics.median(results):6.1f}")
+    print(f"  bare aiohttp: best {min(floor):6.1f} us/call, median {statistics.median(floor):6.1f}")
+    print(f"  overhead:     best {min(results) - min(floor):6.1f} us/call")
+
+
+if __name__ == "__main__":
+    main()
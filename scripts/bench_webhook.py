@@ -0,0 +1,184 @@
+"""Load test the MoviePilot webhook receiver.
+
+Serves ``MoviePilotWebhookView.post`` from a real aiohttp server in a child
+process and posts Transfer notifications to it with a fixed number of
+concurrent clients, then reports the throughput and the p50/p99 latency.
+The view is given a minimal Home Assistant object whose event bus only
+counts and schedules events, so the numbers cover the receiver itself.
+Rate limiting is lifted and every notification is unique, so neither
+throttling nor deduplication short-circuits a request.
+
+Requires aiohttp and Home Assistant. Compare two revisions with:
+
+    git worktree add /tmp/before <revision>
+    python scripts/bench_webhook.py --tree /tmp/before
+    python scripts/bench_webhook.py
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import importlib
+import importlib.machinery
+import importlib.util
+import logging
+import math
+import multiprocessing
+from pathlib import Path
+import sys
+import time
+from typing import Any
+
+ROOT = Path(__file__).resolve().parent.parent
+URL_PATH = "/api/moviepilot/webhook"
+NOTIFICATION = {
+    "title": "【电视剧】整理完成 S01E{:05d}",
+    "text": "x" * 400,
+    "type": "Transfer",
+    "mediainfo": {"tmdbid": 1, "season": 1},
+    "files": ["episode.mkv"] * 5,
+}
+
+
+def load_webhook(tree: Path):
+    """Import the integration's webhook module without its Home Assistant __init__."""
+    packages = {
+        "custom_components": tree / "custom_components",
+        "custom_components.moviepilot": tree / "custom_components" / "moviepilot",
+    }
+    for name, path in packages.items():
+        spec = importlib.machinery.ModuleSpec(name, None, is_package=True)
+        module = importlib.util.module_from_spec(spec)
+        module.__path__ = [str(path)]
+        sys.modules[name] = module
+    return importlib.import_module("custom_components.moviepilot.webhook")
+
+
+class _Bus:
+    """Event bus that builds and schedules events like Home Assistant's."""
+
+    def __init__(self) -> None:
+        self.fired = 0
+
+    def async_fire(self, event_type: str, event_data: dict[str, Any]) -> None:
+        event = {"event_type": event_type, "data": dict(event_data), "time_fired": time.time()}
+        self.fired += 1
+        asyncio.get_running_loop().call_soon(lambda: event)
+
+
+class _ConfigEntries:
+    """Config entry registry without any entries."""
+
+    def async_entries(self, domain: str) -> list[Any]:
+        return []
+
+
+class _Hass:
+    """The parts of Home Assistant the webhook view uses."""
+
+    def __init__(self) -> None:
+        self.loop = asyncio.get_running_loop()
+        self.bus = _Bus()
+        self.data: dict[str, Any] = {}
+        self.config_entries = _ConfigEntries()
+
+    def async_run_hass_job(self, job, *args: Any, **kwargs: Any) -> Any:
+        return job.target(*args)
+
+    def async_create_background_task(self, target, name: str) -> asyncio.Task:
+        return asyncio.get_running_loop().create_task(target, name=name)
+
+
+def serve(tree: Path, port: int, ready: multiprocessing.Event) -> None:
+    """Serve the webhook view until terminated."""
+    from aiohttp import web
+
+    logging.disable(logging.CRITICAL)
+    webhook = load_webhook(tree)
+
+    async def main() -> None:
+        hass = _Hass()
+        view = webhook.MoviePilotWebhookView(hass)
+        if hasattr(view, "rate_limiter"):
+            view.rate_limiter = webhook.WebhookRateLimiter(
+                math.inf, math.inf, math.inf, math.inf
+            )
+        if hasattr(view, "async_consume"):
+            hass.async_create_background_task(view.async_consume(), "webhook_queue")
+
+        app = web.Application()
+        app.router.add_post(URL_PATH, view.post)
+        runner = web.AppRunner(app, access_log=None)
+        await runner.setup()
+        await web.TCPSite(runner, "127.0.0.1", port).start()
+        ready.set()
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+async def load(port: int, requests: int, concurrency: int) -> tuple[float, list[float]]:
+    """Post the notifications and return the rate and the sorted latencies."""
+    import aiohttp
+
+    url = f"http://127.0.0.1:{port}{URL_PATH}"
+    latencies: list[float] = []
+    sequence = 0
+
+    async with aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(limit=concurrency)
+    ) as session:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def post() -> None:
+            nonlocal sequence
+            sequence += 1
+            body = {**NOTIFICATION, "title": NOTIFICATION["title"].format(sequence)}
+            async with semaphore:
+                started = time.perf_counter()
+                async with session.post(url, json=body) as response:
+                    await response.read()
+                    if response.status != 200:
+                        raise RuntimeError(f"webhook answered {response.status}")
+                latencies.append(time.perf_counter() - started)
+
+        await asyncio.gather(*(post() for _ in range(min(200, requests))))
+        latencies.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(post() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return requests / elapsed, latencies
+
+
+def main() -> None:
+    """Run the load test."""
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tree", type=Path, default=ROOT, help="repository checkout to measure")
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--port", type=int, default=8765)
+    args = parser.parse_args()
+
+    ready = multiprocessing.Event()
+    server = multiprocessing.Process(
+        target=serve, args=(args.tree.resolve(), args.port, ready), daemon=True
+    )
+    server.start()
+    try:
+        if not ready.wait(30):
+            raise SystemExit("server did not start")
+        print(f"{args.tree} ({args.requests} requests, {args.concurrency} concurrent)")
+        for _ in range(args.rounds):
+            rate, latencies = asyncio.run(load(args.port, args.requests, args.concurrency))
+            p50 = latencies[len(latencies) // 2] * 1000
+            p99 = latencies[int(len(latencies) * 0.99)] * 1000
+            print(f"  {rate:8.0f} req/s  p50 {p50:6.2f} ms  p99 {p99:6.2f} ms")
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
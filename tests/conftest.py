@@ -0,0 +1,25 @@
+"""Fixtures for the MoviePilot integration tests.
+
+The API client, models and webhook helpers only need aiohttp; the package
+``__init__`` imports Home Assistant. Register the package without running its
+``__init__`` so those modules can be tested on their own.
+"""
+from __future__ import annotations
+
+import importlib.machinery
+import importlib.util
+from pathlib import Path
+import sys
+
+ROOT = Path(__file__).resolve().parent.parent
+PACKAGES = {
+    "custom_components": ROOT / "custom_components",
+    "custom_components.moviepilot": ROOT / "custom_components" / "moviepilot",
+}
+
+for name, path in PACKAGES.items():
+    if name not in sys.modules:
+        spec = importlib.machinery.ModuleSpec(name, None, is_package=True)
+        module = importlib.util.module_from_spec(spec)
+        module.__path__ = [str(path)]
+        sys.modules[name] = module
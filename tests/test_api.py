@@ -0,0 +1,154 @@
+"""Tests for the MoviePilot API client."""
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("aiohttp")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from custom_components.moviepilot.api import (  # noqa: E402
+    MoviePilotAPIClient,
+    MoviePilotAuthError,
+    MoviePilotConnectionError,
+    ServerSentEvent,
+)
+from custom_components.moviepilot.const import (  # noqa: E402
+    API_ENDPOINT_CPU,
+    API_ENDPOINT_MESSAGE_STREAM,
+    API_ENDPOINT_SYSTEM_ENV,
+    CIRCUIT_CLOSED,
+    CIRCUIT_HALF_OPEN,
+    CIRCUIT_OPEN,
+)
+
+
+def test_cancelled_probe_waiting_for_a_slot_reopens_the_circuit() -> None:
+    """A probe cancelled while queued must not leave the breaker half-open."""
+
+    async def run() -> None:
+        request_limiter = asyncio.Semaphore(1)
+        client = MoviePilotAPIClient(
+            "localhost", 3000, "token", session=object(), request_limiter=request_limiter
+        )
+        # Circuit open and due for a probe
+        client.breaker.state = CIRCUIT_OPEN
+
+        # Every shared slot is taken, so the probe has to wait
+        await request_limiter.acquire()
+        task = asyncio.create_task(client._request_once("GET", API_ENDPOINT_CPU))
+        for _ in range(5):
+            await asyncio.sleep(0)
+        assert client.breaker.state == CIRCUIT_HALF_OPEN
+
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+        assert client.breaker.state == CIRCUIT_OPEN
+        # The next request is allowed to probe again
+        assert client.breaker.before_request() is True
+
+    asyncio.run(run())
+
+
+def test_version_probe_rejected_by_the_token_does_not_block_polling() -> None:
+    """A 401 from /system/env means the version is unknown, not that the token is invalid."""
+
+    async def env(request: web.Request) -> web.Response:
+        return web.json_response({"detail": "Not authenticated"}, status=401)
+
+    async def cpu(request: web.Request) -> web.Response:
+        assert request.query["token"] == "token"
+        return web.json_response(12.5)
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get(API_ENDPOINT_SYSTEM_ENV, env)
+        app.router.add_get(API_ENDPOINT_CPU, cpu)
+        async with TestServer(app) as server:
+            client = MoviePilotAPIClient(server.host, server.port, "token")
+            try:
+                assert await client.get_version() is None
+                assert client.breaker.state == CIRCUIT_CLOSED
+
+                # The dashboard endpoints accept the API token
+                assert await client.get_cpu_usage() == 12.5
+                assert client.breaker.state == CIRCUIT_CLOSED
+            finally:
+                await client.close()
+
+    asyncio.run(run())
+
+
+def test_stream_events_parses_a_local_event_stream() -> None:
+    """Events are decoded from a real text/event-stream response."""
+    seen_headers: list[str | None] = []
+
+    async def stream(request: web.Request) -> web.StreamResponse:
+        seen_headers.append(request.headers.get("Last-Event-ID"))
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        await response.write(
+            b": heartbeat\r\n"
+            b"id: 7\r\n"
+            b"event: notice\r\n"
+            b"retry: 1500\r\n"
+            b"data: line one\r\n"
+            b"data: line two\r\n"
+            b"\r\n"
+            b"data: {\"value\": 1}\n"
+            b"\n"
+        )
+        return response
+
+    async def run() -> list[ServerSentEvent]:
+        app = web.Application()
+        app.router.add_get(API_ENDPOINT_MESSAGE_STREAM, stream)
+        async with TestServer(app) as server:
+            client = MoviePilotAPIClient(server.host, server.port, "token")
+            opened: list[bool] = []
+            events: list[ServerSentEvent] = []
+            try:
+                with pytest.raises(MoviePilotConnectionError):
+                    async for event in client.stream_events(
+                        API_ENDPOINT_MESSAGE_STREAM, "6", on_open=lambda: opened.append(True)
+                    ):
+                        events.append(event)
+            finally:
+                await client.close()
+            assert opened == [True]
+            return events
+
+    events = asyncio.run(run())
+
+    assert seen_headers == ["6"]
+    assert events == [
+        ServerSentEvent("notice", "line one\nline two", "7", 1500),
+        # The last event ID carries over to later events
+        ServerSentEvent("message", '{"value": 1}', "7", None),
+    ]
+
+
+def test_stream_events_raises_auth_error_on_401() -> None:
+    """A rejected token ends the stream with an auth error."""
+
+    async def stream(request: web.Request) -> web.Response:
+        return web.Response(status=401)
+
+    async def run() -> None:
+        app = web.Application()
+        app.router.add_get(API_ENDPOINT_MESSAGE_STREAM, stream)
+        async with TestServer(app) as server:
+            client = MoviePilotAPIClient(server.host, server.port, "token")
+            try:
+                with pytest.raises(MoviePilotAuthError):
+                    async for _event in client.stream_events(API_ENDPOINT_MESSAGE_STREAM):
+                        pass
+            finally:
+                await client.close()
+
+    asyncio.run(run())
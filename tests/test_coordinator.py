@@ -0,0 +1,88 @@
+"""Tests for the MoviePilot coordinators and their snapshot store."""
+from __future__ import annotations
+
+import asyncio
+from functools import partial
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.moviepilot.const import (  # noqa: E402
+    UPDATE_GROUP_LIBRARY,
+    UPDATE_GROUP_LIVE,
+    UPDATE_GROUP_STORAGE,
+    UPDATE_GROUP_TASKS,
+)
+from custom_components.moviepilot.coordinator import (  # noqa: E402
+    MoviePilotDataUpdateCoordinator,
+    MoviePilotSnapshotStore,
+)
+
+
+class _Store:
+    """Snapshot storage returning fixed data."""
+
+    def __init__(self, data: dict | None) -> None:
+        self._data = data
+
+    async def async_load(self) -> dict | None:
+        return self._data
+
+
+def _coordinator() -> SimpleNamespace:
+    """Return a coordinator stand-in with the real restore logic."""
+    coordinator = SimpleNamespace(data=None)
+    coordinator.async_restore = partial(
+        MoviePilotDataUpdateCoordinator.async_restore, coordinator
+    )
+    return coordinator
+
+
+def _snapshot_store(stored: dict | None) -> tuple[MoviePilotSnapshotStore, dict]:
+    coordinators = {
+        group: _coordinator()
+        for group in (
+            UPDATE_GROUP_LIVE,
+            UPDATE_GROUP_TASKS,
+            UPDATE_GROUP_STORAGE,
+            UPDATE_GROUP_LIBRARY,
+        )
+    }
+    store = MoviePilotSnapshotStore.__new__(MoviePilotSnapshotStore)
+    store._store = _Store(stored)
+    store._coordinators = coordinators
+    return store, coordinators
+
+
+def test_partial_snapshot_seeds_the_missing_groups() -> None:
+    """Groups missing from the snapshot start empty instead of without data."""
+    store, coordinators = _snapshot_store(
+        {
+            UPDATE_GROUP_LIVE: {
+                "data": {"cpu_percent": 12.5},
+                "updated": {"cpu_percent": "2026-10-18T12:00:00+00:00"},
+            }
+        }
+    )
+
+    assert asyncio.run(store.async_restore()) is True
+
+    assert coordinators[UPDATE_GROUP_LIVE].fields == {"cpu_percent": 12.5}
+    for group in (UPDATE_GROUP_TASKS, UPDATE_GROUP_STORAGE, UPDATE_GROUP_LIBRARY):
+        data = coordinators[group].data
+        assert data is not None
+        # Entities dereference the records without a None check
+        assert data.system is not None
+        assert data.tasks is not None
+        assert data.library is not None
+        assert data.downloader is not None
+
+
+def test_snapshot_without_data_is_not_restored() -> None:
+    """Without any stored group the blocking first refresh runs."""
+    store, coordinators = _snapshot_store({UPDATE_GROUP_LIVE: {"data": {}}})
+
+    assert asyncio.run(store.async_restore()) is False
+    assert all(coordinator.data is None for coordinator in coordinators.values())
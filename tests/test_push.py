@@ -0,0 +1,88 @@
+"""Tests for push mode against a local event stream server."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestServer  # noqa: E402
+
+from custom_components.moviepilot import push  # noqa: E402
+from custom_components.moviepilot.api import MoviePilotAPIClient  # noqa: E402
+from custom_components.moviepilot.const import API_ENDPOINT_MESSAGE_STREAM  # noqa: E402
+
+
+def test_listener_resumes_backs_off_and_stops_on_401(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Follow the message stream through drops, errors and a rejected token."""
+    last_event_ids: list[str | None] = []
+    # 200 with events, two server errors, 200 with an event, then 401
+    responses = iter(["events", 500, 500, "resume", 401])
+
+    async def stream(request: web.Request) -> web.StreamResponse:
+        last_event_ids.append(request.headers.get("Last-Event-ID"))
+        kind = next(responses)
+        if isinstance(kind, int):
+            return web.Response(status=kind)
+        response = web.StreamResponse(headers={"Content-Type": "text/event-stream"})
+        await response.prepare(request)
+        if kind == "events":
+            # The server asks for a 10 ms reconnection delay
+            await response.write(b'id: 1\nretry: 10\ndata: {"title": "a"}\n\n')
+        else:
+            await response.write(b'id: 2\ndata: {"title": "b"}\n\n')
+        return response
+
+    delays: list[float] = []
+
+    async def sleep(delay: float) -> None:
+        delays.append(delay)
+
+    monkeypatch.setattr(push, "asyncio", SimpleNamespace(sleep=sleep))
+    monkeypatch.setattr(push.random, "uniform", lambda low, high: 0.0)
+
+    async def run() -> tuple[list[bool], int]:
+        connected: list[bool] = []
+        refreshes = 0
+
+        async def async_request_refresh() -> None:
+            nonlocal refreshes
+            refreshes += 1
+
+        coordinator = SimpleNamespace(
+            async_set_push_connected=connected.append,
+            async_request_refresh=async_request_refresh,
+        )
+        loop = asyncio.get_running_loop()
+        hass = SimpleNamespace(async_create_task=loop.create_task)
+
+        app = web.Application()
+        app.router.add_get(API_ENDPOINT_MESSAGE_STREAM, stream)
+        async with TestServer(app) as server:
+            client = MoviePilotAPIClient(server.host, server.port, "token")
+            listener = push.MoviePilotPushListener(hass, client, coordinator)
+            try:
+                await asyncio.wait_for(
+                    listener._async_follow(
+                        API_ENDPOINT_MESSAGE_STREAM, listener._async_handle_message
+                    ),
+                    5,
+                )
+            finally:
+                await client.close()
+        await asyncio.sleep(0)
+        assert listener.stats == {"connects": 2, "events": 2}
+        return connected, refreshes
+
+    connected, refreshes = asyncio.run(run())
+
+    # Every reconnection resumes after the last event received
+    assert last_event_ids == [None, "1", "1", "1", "2"]
+    # Exponential backoff from the server's retry delay, reset after a successful connection
+    assert delays == [0.01, 0.02, 0.04, 0.01]
+    # Polling is reduced only while the stream is connected
+    assert connected == [True, False, False, False, True, False, False]
+    assert refreshes == 2
@@ -0,0 +1,26 @@
+"""Tests for the webhook routing rules."""
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+import voluptuous as vol  # noqa: E402
+
+from custom_components.moviepilot.routing import compile_routes  # noqa: E402
+
+
+@pytest.mark.parametrize("event", ["notification", "notifications_batch"])
+def test_reserved_event_names_are_rejected(event: str) -> None:
+    """Rules cannot fire the events the receiver fires itself."""
+    with pytest.raises(vol.Invalid):
+        compile_routes(f"- event: {event}")
+
+
+def test_routes_are_compiled() -> None:
+    """Valid rules are compiled in order."""
+    router = compile_routes("- event: transfer\n  type: Transfer\n- event: notified")
+    assert [rule.event_type for rule in router.rules] == [
+        "moviepilot_transfer",
+        "moviepilot_notified",
+    ]
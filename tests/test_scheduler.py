@@ -0,0 +1,21 @@
+"""Tests for the integration-wide refresh scheduler."""
+from __future__ import annotations
+
+from datetime import timedelta
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from custom_components.moviepilot.scheduler import MoviePilotScheduler  # noqa: E402
+
+
+@pytest.mark.parametrize("seconds", [5, 30, 60, 600])
+def test_offset_stays_below_the_refresh_interval(seconds: int) -> None:
+    """The start offset plus jitter never reaches the next refresh."""
+    scheduler = MoviePilotScheduler(max_offset=60, jitter=2.0)
+    interval = timedelta(seconds=seconds)
+
+    for index in range(500):
+        offset = scheduler.offset(f"entry_{index}", interval)
+        assert 0 <= offset < min(seconds, 60)
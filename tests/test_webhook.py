@@ -0,0 +1,134 @@
+"""Tests for the MoviePilot webhook receiver."""
+from __future__ import annotations
+
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+
+pytest.importorskip("homeassistant")
+
+from aiohttp import web  # noqa: E402
+from aiohttp.test_utils import TestClient, TestServer  # noqa: E402
+
+from custom_components.moviepilot.const import (  # noqa: E402
+    CONF_WEBHOOK_BATCH_EVENT,
+    CONF_WEBHOOK_MAX_BODY_SIZE,
+    CONF_WEBHOOK_OVERFLOW,
+    CONF_WEBHOOK_ROUTES,
+    DEFAULT_WEBHOOK_OVERFLOW,
+    DOMAIN,
+)
+from custom_components.moviepilot.webhook import (  # noqa: E402
+    MoviePilotWebhookView,
+    WebhookRateLimiter,
+)
+
+
+def _hass(entries: list[SimpleNamespace]) -> SimpleNamespace:
+    """Return a Home Assistant stand-in with the given config entries."""
+    return SimpleNamespace(
+        data={DOMAIN: {}},
+        config_entries=SimpleNamespace(async_entries=lambda domain: entries),
+    )
+
+
+def test_options_are_merged_in_entry_order_and_reapplied_on_unload() -> None:
+    """The options do not depend on which entry was set up last."""
+    first = SimpleNamespace(
+        entry_id="first",
+        title="First",
+        options={
+            CONF_WEBHOOK_OVERFLOW: "reject",
+            CONF_WEBHOOK_ROUTES: "- event: transfer\n  type: Transfer",
+        },
+    )
+    second = SimpleNamespace(
+        entry_id="second",
+        title="Second",
+        options={
+            CONF_WEBHOOK_BATCH_EVENT: True,
+            CONF_WEBHOOK_MAX_BODY_SIZE: 2048,
+            CONF_WEBHOOK_ROUTES: "- event: anything",
+        },
+    )
+    hass = _hass([first, second])
+    view = MoviePilotWebhookView(hass)
+
+    # The second entry is set up before the first
+    hass.data[DOMAIN]["second"] = {}
+    view.async_configure()
+    hass.data[DOMAIN]["first"] = {}
+    view.async_configure()
+
+    assert view.overflow == "reject"
+    assert view.batch_event is True
+    assert view.max_body_size == 2048 * 1024
+    assert len(view.router) == 2
+
+    # Unloading the second entry removes its options
+    del hass.data[DOMAIN]["second"]
+    view.async_configure()
+
+    assert view.overflow == "reject"
+    assert view.batch_event is False
+    assert len(view.router) == 1
+
+    del hass.data[DOMAIN]["first"]
+    view.async_configure()
+
+    assert view.overflow == DEFAULT_WEBHOOK_OVERFLOW
+    assert len(view.router) == 0
+
+
+def test_bulk_requests_are_rate_limited_per_notification() -> None:
+    """One request carrying many notifications cannot bypass the rate limit."""
+
+    async def run() -> None:
+        loop = asyncio.get_running_loop()
+        hass = SimpleNamespace(
+            loop=loop,
+            data={DOMAIN: {}},
+            async_run_hass_job=lambda job, *args, **kwargs: None,
+        )
+        view = MoviePilotWebhookView(hass)
+        # Three tokens, practically no refill
+        view.rate_limiter = WebhookRateLimiter(0.001, 3, 0.001, 3)
+
+        app = web.Application()
+        app.router.add_post(view.url, view.post)
+        async with TestClient(TestServer(app)) as client:
+            response = await client.post(
+                view.url, json=[{"title": f"n{index}", "type": "Manual"} for index in range(5)]
+            )
+            assert response.status == 200
+            body = await response.json()
+            assert body["queued"] == 3
+            assert body["throttled"] == 2
+            assert body["success"] is False
+            assert [result["status"] for result in body["results"]] == [
+                "queued",
+                "queued",
+                "queued",
+                "throttled",
+                "throttled",
+            ]
+
+            # Without tokens left the whole request is throttled
+            response = await client.post(view.url, json=[{"title": "again"}])
+            assert response.status == 429
+            assert int(response.headers["Retry-After"]) > 0
+
+            # NDJSON lines are charged the same way
+            view.rate_limiter = WebhookRateLimiter(0.001, 2, 0.001, 2)
+            response = await client.post(
+                view.url,
+                data=b'{"title": "a"}\n{"title": "b"}\n{"title": "c"}\n',
+                headers={"Content-Type": "application/x-ndjson"},
+            )
+            assert response.status == 200
+            body = await response.json()
+            assert (body["queued"], body["throttled"]) == (2, 1)
+            assert body["results"][2]["retry_after"] > 0
+
+    asyncio.run(run())